@@ -1,6 +1,9 @@
+import time
+import logging
 import warnings
 import importlib
 import numpy as np
+from functools import lru_cache
 
 try:
     from ._version import version as __version__
@@ -10,11 +13,34 @@ except ModuleNotFoundError:
 from express import settings
 from express.properties import BaseProperty
 from express.parsers import BaseParser
+from express.parsers.cache import ParserMethodCache
+from express.parsers.regex import REGEX_REGISTRY
+from express.properties.schemas import SCHEMA_REGISTRY
 from typing import Type, Optional, Union
 
 # disable pymatgen warnings
 warnings.filterwarnings("ignore")
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_class_by_reference(reference: str) -> Union[Type[BaseProperty], Type[BaseParser]]:
+    """
+    Returns class by reference. Classes are resolved once and cached, the resolution time is logged at debug level.
+
+    Args:
+        reference (str): reference, e.g. express.parsers.apps.vasp.parser.VaspParser
+
+    Returns:
+         class
+    """
+    start = time.perf_counter()
+    module_name, class_name = reference.rsplit(".", 1)
+    class_ = getattr(importlib.import_module(module_name), class_name)
+    logger.debug("Resolved %s in %.1f ms", reference, (time.perf_counter() - start) * 1e3)
+    return class_
+
 
 class ExPrESS(object):
     """
@@ -60,6 +86,28 @@ class ExPrESS(object):
 
         return parser_class
 
+    @classmethod
+    def warm(cls):
+        """
+        Resolves all the parser and property classes, compiles the parser regexes and the property schema validators
+        upfront, e.g. in long-running worker processes. Otherwise, they are resolved on first use.
+
+        Note: classes that can not be imported, e.g. due to a missing optional dependency, are skipped with a warning.
+        """
+        references = list(settings.PARSERS_REGISTRY.values())
+        references.extend(manifest["reference"] for manifest in settings.PROPERTIES_MANIFEST.values())
+        for reference in references:
+            try:
+                get_class_by_reference(reference)
+            except ImportError as e:
+                logger.warning("Could not resolve %s: %s", reference, e)
+        REGEX_REGISTRY.compile_all()
+        for property_name in settings.PROPERTIES_MANIFEST:
+            schema_id = SCHEMA_REGISTRY.get_property_manifest(property_name).get("schemaId")
+            schema = SCHEMA_REGISTRY.get_schema_by_id(schema_id) if schema_id else None
+            if schema is not None:
+                SCHEMA_REGISTRY.get_validator(schema)
+
     def _get_class_by_reference(self, reference: str) -> Union[Type[BaseProperty], Type[BaseParser]]:
         """
         Returns class by reference.
@@ -70,9 +118,7 @@ class ExPrESS(object):
         Returns:
              class
         """
-        class_name = reference.split(".")[-1]
-        module_name = ".".join(reference.split(".")[:-1])
-        return getattr(importlib.import_module(module_name), class_name)
+        return get_class_by_reference(reference)
 
     def _get_property_class(self, property_name: str) -> Type[BaseProperty]:
         """
@@ -102,3 +148,20 @@ class ExPrESS(object):
         Property_Class = self._get_property_class(property_name)
         property_instance = Property_Class(property_name, self.parser, *args, **kwargs)
         return property_instance.serialize_and_validate()
+
+    def properties(self, property_names: list, *args, **kwargs) -> dict:
+        """
+        Extracts given properties and validates them against their schemas. The parser methods are executed once for
+        all the properties, e.g. eigenvalues are parsed once for band_gaps and band_structure, see ParserMethodCache.
+        The results are kept afterwards only if the parser is created with the `memoize` kwarg.
+
+        Args:
+            property_names (list): property names.
+            args (list): args passed to the underlying property methods.
+            kwargs (dict): kwargs passed to the underlying property methods.
+
+        Returns:
+             dict: properties by name.
+        """
+        with ParserMethodCache(self.parser):
+            return {name: self.property(name, *args, **kwargs) for name in property_names}
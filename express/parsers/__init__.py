@@ -1,22 +1,52 @@
+import io
 import os
 
 from express.mixins import RoundNumericValuesMixin
+from express.parsers.cache import FileContentCache, FileMapCache, ParserMethodCache
+from express.parsers.settings import FILE_CONTENT_CACHE_MAX_SIZE
 
 
 class BaseParser(RoundNumericValuesMixin):
     """
     Base Parser class.
+
+    Args:
+        args (list): args passed to the parser.
+        kwargs (dict): kwargs passed to the parser.
+            version (str): application version.
+            file_content_cache_size (int): memory budget in bytes for the content of files read by the parser.
+            use_mmap (bool): whether to access large output files through read-only memory maps where supported.
+            memoize (bool): whether to cache the results of the parser methods marked with `memoized` until the
+                standard output file or the main output files of the application change, see ParserMethodCache.
     """
 
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
         self.version = kwargs.get("version", None)
+        self.file_content_cache = FileContentCache(kwargs.get("file_content_cache_size", FILE_CONTENT_CACHE_MAX_SIZE))
+        self.use_mmap = kwargs.get("use_mmap", False)
+        self.file_map_cache = FileMapCache()
+        self.method_cache = None
+        if kwargs.get("memoize", False):
+            self.method_cache = ParserMethodCache(self, self._get_watched_files).install()
+
+    def _get_watched_files(self):
+        """
+        Returns the paths of the files the results of the memoized methods depend on. Override to add the output files
+        of the application.
+
+        Returns:
+             list
+        """
+        return [self.kwargs.get("stdout_file")]
 
     def _get_file_content(self, file_path):
         """
         Returns the content of a given file.
 
+        Note: the content is cached, hence the file is only read again if it has changed on disk.
+
         Args:
             file_path (str): file path.
 
@@ -25,6 +55,63 @@ class BaseParser(RoundNumericValuesMixin):
         """
         content = ""
         if file_path and os.path.exists(file_path):
-            with open(file_path) as f:
-                content = f.read()
+            content = self.file_content_cache.get(file_path)
+        return content
+
+    def _open_file(self, file_path):
+        """
+        Opens a given file to be read line by line, without loading its content into memory.
+
+        Args:
+            file_path (str): file path.
+
+        Returns:
+             file object, empty if the file does not exist.
+        """
+        if file_path and os.path.exists(file_path):
+            return open(file_path)
+        return io.StringIO()
+
+    def _get_file_view(self, file_path):
+        """
+        Returns a read-only view of a given file to be passed to the text parser methods that only run regex patterns.
+
+        The view is a memory map of the file if the parser is created with `use_mmap`, hence the file is not copied into
+        memory. Otherwise, the (cached) file content is returned.
+
+        Args:
+            file_path (str): file path.
+
+        Returns:
+             str | mmap.mmap | bytes
+        """
+        if not self.use_mmap:
+            return self._get_file_content(file_path)
+        content = b""
+        if file_path and os.path.exists(file_path):
+            content = self.file_map_cache.get(file_path)
         return content
+
+    def invalidate_file_content_cache(self, file_path=None):
+        """
+        Drops a given file (or all files if no path is passed) from the file content and memory map caches.
+
+        Args:
+            file_path (str): file path.
+        """
+        self.file_content_cache.invalidate(file_path)
+        self.file_map_cache.invalidate(file_path)
+
+    def close(self):
+        """
+        Releases the resources held by the parser, including the memoized results.
+        """
+        self.invalidate_file_content_cache()
+        if self.method_cache is not None:
+            self.method_cache.invalidate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,17 +1,47 @@
 import os
 import re
-import io
+import copy
+import itertools
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
-from express.parsers.utils import find_file
+from express.parsers.basis import Basis, expand_bases
+from express.parsers.utils import find_file, convert_basis_to_cartesian
+from express.parsers.regex import REGEX_REGISTRY, compile_regex
 from express.parsers.settings import Constant, GENERAL_REGEX, ATOMIC_REGEX
 from express.parsers.apps.espresso import settings
-from express.parsers.formats.txt import BaseTXTParser
+from express.parsers.formats.txt import BaseTXTParser, GENERAL_OUTPUT_PARSER_FLAGS
 
 ORBITS = {"s": [""], "p": ["z", "x", "y"], "d": ["z2", "zx", "zy", "x2-y2", "xy"]}
 
+# executors to read pdos files concurrently with, see EspressoTXTParser.dos
+PDOS_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def load_dos_file(dos_file, columns):
+    """
+    Loads the given columns of a (p)dos file created by projwfc.x in a single pass. Only the lines starting with a
+    number are read, hence the header and the rows with energies overflowing the output format are skipped:
+
+        # E (eV)  ldos(E)   pdos(E)
+        *******  0.000E+00  0.000E+00     <- skipped
+        -99.989  0.000E+00  0.000E+00
+
+    Args:
+        dos_file (str): path to the dos file.
+        columns (sequence): indices of the columns to load.
+
+    Returns:
+        numpy.ndarray: (number of columns, number of energy levels) array.
+    """
+    data_line_pattern = REGEX_REGISTRY.get("espresso", "dos_data_line", re.MULTILINE)
+    with open(dos_file) as f:
+        lines = data_line_pattern.findall(f.read())
+    # values are parsed in double precision and then rounded, as by np.genfromtxt used previously
+    return np.loadtxt(lines, usecols=tuple(columns), ndmin=2).astype(np.float32).T
+
 
 class EspressoTXTParser(BaseTXTParser):
     """
@@ -20,6 +50,7 @@ class EspressoTXTParser(BaseTXTParser):
 
     def __init__(self, work_dir):
         super(EspressoTXTParser, self).__init__(work_dir)
+        self._convergence_index = None
 
     def total_energy(self, text):
         """
@@ -33,7 +64,7 @@ class EspressoTXTParser(BaseTXTParser):
         """
         return Constant.RYDBERG * self._general_output_parser(text, **settings.REGEX["total_energy"])
 
-    def dos(self):
+    def dos(self, max_workers=None, executor="thread"):
         """
         Extracts density of states. It reads 'pdos_tot' file to extract energy levels and total DOS values for each
         energy level. Then it reads partial DOS files created by QE with this format: `__prefix__.pdos_atm#1(
@@ -41,6 +72,11 @@ class EspressoTXTParser(BaseTXTParser):
         added together and packed in a dictionary. The result containing energy levels, total DOS and partial DOS for
         each element will be returned.
 
+        Args:
+            max_workers (int): number of workers to read partial DOS files concurrently with. Files are read serially
+                by default.
+            executor (str): type of the workers, one of PDOS_EXECUTORS keys: "thread" or "process".
+
         Returns:
             dict
 
@@ -64,7 +100,7 @@ class EspressoTXTParser(BaseTXTParser):
         """
         dos_tot_file = find_file(settings.PDOS_TOT_FILE, self.work_dir)
         energy_levels, total_dos = self._total_dos(dos_tot_file)
-        partial_dos_values, partial_dos_infos = self._partial_dos(len(energy_levels))
+        partial_dos_values, partial_dos_infos = self._partial_dos(len(energy_levels), max_workers, executor)
         return {
             "energy": energy_levels.tolist(),
             "total": total_dos.tolist(),
@@ -93,20 +129,22 @@ class EspressoTXTParser(BaseTXTParser):
                        ([-25.226, -25.216, -25.206], [0.512E-03, 0.637E-03, 0.791E-03])
         """
         if os.path.isfile(dos_tot_file):
-            trimmed_dos_file = io.StringIO(self._trim_dos_file(dos_tot_file))
-            dos_tot = np.genfromtxt(trimmed_dos_file, dtype=np.float32, usecols=(0, 1))
-            energy_levels = dos_tot[:, 0]
-            dos_tot = dos_tot[:, 1]
+            energy_levels, dos_tot = load_dos_file(dos_tot_file, (0, 1))
             return energy_levels, dos_tot
 
-    def _partial_dos(self, num_levels):
+    def _partial_dos(self, num_levels, max_workers=None, executor="thread"):
         """
         Parses partial DOS for each element with its orbit value. it reads partial DOS files created by QE with this
         format: `__prefix__.pdos_atm#1(C)_wfc#1(s)` in job working directory. DOS value for each atom with the same
         element and orbit number will be added together and packed in a dictionary.
 
+        The files may be read concurrently, while their values are always added together in the order of the file
+        names, hence the result does not depend on the number of workers.
+
         Args:
             num_levels (int): number of energy levels.
+            max_workers (int): number of workers to read the files with, serially if not set.
+            executor (str): type of the workers, "thread" or "process".
 
         Returns:
             dict: a dictionary containing partial DOS values for each element.
@@ -124,135 +162,118 @@ class EspressoTXTParser(BaseTXTParser):
                         }
                     ]
         """
+        if max_workers and executor not in PDOS_EXECUTORS:
+            raise ValueError("Unsupported executor: {0}".format(executor))
         pdos = {}
+        pdos_file_pattern = REGEX_REGISTRY.get("espresso", "pdos_file")
         # Because os.listdir() has an undefined order specified, we'll sort the file list in order to have a
         # reproducible result.  The sort order will be the normal alphanumeric comparison.
         # For example:
         # >>> x = ['a', 'B', 'c', 'D']
         # >>> sorted(x)
         # ['B', 'D', 'a', 'c']
-        for file_name in sorted(os.listdir(self.work_dir)):
-            file_path = os.path.join(self.work_dir, file_name)
-            match = re.compile(settings.REGEX["pdos_file"]["regex"]).match(file_name)
-            if match:
-                atm_pdos = self._extract_partial_dos(file_path, len(ORBITS[match.group("orbit_symbol")]))
-                atm_pdos = atm_pdos.T if atm_pdos.shape[0] > 1 else atm_pdos
-                for idx, orbit_pdos in enumerate(atm_pdos):
-                    orbit_idx = ORBITS[match.group("orbit_symbol")][idx] if match.group("orbit_symbol") != "s" else ""
-                    pdos_id = "{0}_{1}{2}{3}".format(
-                        match.group("atom_name"), match.group("orbit_num"), match.group("orbit_symbol"), orbit_idx
-                    )  # e.g. C_1s, C_2px, C_2dz2
-                    if pdos_id not in pdos.keys():
-                        pdos[pdos_id] = np.zeros(num_levels)
-                    pdos[pdos_id] += orbit_pdos
+        matches = [pdos_file_pattern.match(file_name) for file_name in sorted(os.listdir(self.work_dir))]
+        matches = [match for match in matches if match and os.path.isfile(os.path.join(self.work_dir, match.string))]
+        file_paths = [os.path.join(self.work_dir, match.string) for match in matches]
+        columns = [range(2, 2 + len(ORBITS[match.group("orbit_symbol")])) for match in matches]
+        if max_workers:
+            with PDOS_EXECUTORS[executor](max_workers=max_workers) as pool:
+                partial_dos = list(pool.map(load_dos_file, file_paths, columns))
+        else:
+            partial_dos = map(load_dos_file, file_paths, columns)
+
+        for match, atm_pdos in zip(matches, partial_dos):
+            for idx, orbit_pdos in enumerate(atm_pdos):
+                orbit_idx = ORBITS[match.group("orbit_symbol")][idx] if match.group("orbit_symbol") != "s" else ""
+                pdos_id = "{0}_{1}{2}{3}".format(
+                    match.group("atom_name"), match.group("orbit_num"), match.group("orbit_symbol"), orbit_idx
+                )  # e.g. C_1s, C_2px, C_2dz2
+                if pdos_id not in pdos.keys():
+                    pdos[pdos_id] = np.zeros(num_levels)
+                pdos[pdos_id] += orbit_pdos
 
         pdos_values = [pdos[item].tolist() for item in pdos]
         pdos_infos = [{"element": item.split("_")[0], "electronicState": item.split("_")[1]} for item in pdos]
         return pdos_values, pdos_infos
 
-    def _extract_partial_dos(self, pdos_file, orbit_num):
+    def convergence_electronic(self, text):
         """
-        Parses partial DOS values from a given file.
+        Extracts convergence electronic.
 
         Args:
-            pdos_file (str): path to pdos file.
+            text (str): text to extract data from.
 
         Returns:
-            numpy.ndarray
+             list[float]
         """
-        if os.path.isfile(pdos_file):
-            trimmed_pdos_file = io.StringIO(self._trim_dos_file(pdos_file))
-            target_columns = range(2, 2 + orbit_num)
-            columns = np.genfromtxt(trimmed_pdos_file, dtype=np.float32, usecols=range(2, 2 + orbit_num))
-            return columns if len(target_columns) > 1 else np.array([columns])
+        return self.convergence_index(text).convergence_electronic()
 
-    def _trim_dos_file(self, dos_file):
+    def convergence_ionic(self, text):
         """
-        Trims a given dos file and returns the data. Only lines which start with a scientific number are interested.
+        Extracts convergence ionic.
 
         Args:
-            dos_file (str): path to the dos file.
+            text (str): text to extract data from.
 
         Returns:
-            (str): trimmed out text containing actual dos values.
-                Example Input:
-                    *******  0.000E+00  0.000E+00
-                    *******  0.000E+00  0.000E+00
-                    -99.989  0.000E+00  0.000E+00
-                     99.939  0.000E+00  0.000E+00
-                      9.889  0.000E+00  0.000E+00
-                    *******  0.000E+00  0.000E+00
-                    *******  0.000E+00  0.000E+00
-                Example output:
-                    -99.989  0.000E+00  0.000E+00
-                    -99.939  0.000E+00  0.000E+00
-                    -99.889  0.000E+00  0.000E+00
-        """
-        with open(dos_file) as f:
-            return "\n".join(re.findall("^ *[-+]?\d*\.\d+(?:[eE][-+]?\d+)?.*$", f.read(), re.MULTILINE))
+             list[dict]
+        """
+        return self.convergence_index(text).convergence_ionic()
 
-    def convergence_electronic(self, text):
+    def convergence_index(self, text):
         """
-        Extracts convergence electronic.
+        Returns the index of the self-consistent and BFGS blocks of a given text.
+
+        Note: the index of the last text is kept, hence the blocks are only parsed once when the convergence electronic
+        and ionic data are both extracted from the same text. The index is looked up by the length and hash of the text
+        rather than the text itself, which is not kept in memory.
 
         Args:
             text (str): text to extract data from.
 
         Returns:
-             list[float]
+             EspressoConvergenceIndex
         """
-        data = self._general_output_parser(text, **settings.REGEX["convergence_electronic"])
-        # The next 3 lines are necessary to have realtime data
-        ionic_data = [_["electronic"]["data"] for _ in self.convergence_ionic(text)]
-        last_step_data = data[sum([len(_) for _ in ionic_data]) : len(data)]
-        if last_step_data:
-            ionic_data.append(last_step_data)
-        return [(np.array(_) * Constant.RYDBERG).tolist() for _ in ionic_data]
+        key = (len(text), hash(text))
+        if self._convergence_index is None or self._convergence_index[0] != key:
+            index = EspressoConvergenceIndex(self)
+            index.update(text)
+            self._convergence_index = (key, index)
+        return self._convergence_index[1]
 
-    def convergence_ionic(self, text):
+    def _convergence_step(self, block):
         """
-        Extracts convergence ionic.
+        Extracts the data of an ionic step from the text of its self-consistent calculation.
 
         Args:
-            text (str): text to extract data from.
+            block (str): text of the self-consistent calculation.
 
         Returns:
-             list[dict]
+            dict
         """
-        data = []
-        blocks = re.findall(settings.REGEX["convergence_ionic_blocks"]["regex"], text, re.DOTALL | re.MULTILINE)
-        for idx, block in enumerate(blocks):
-            energies = self._general_output_parser(block, **settings.REGEX["convergence_ionic_energies"])
-            energies = (np.array(energies) * Constant.RYDBERG).tolist()
-            data.append(
-                {
-                    "energy": energies[-1],
-                    "electronic": {
-                        "units": "eV",
-                        "data": self._general_output_parser(block, **settings.REGEX["convergence_electronic"]),
-                    },
-                }
-            )
-
-        if not data:
-            return []
+        energies = self._general_output_parser(block, **settings.REGEX["convergence_ionic_energies"])
+        energies = (np.array(energies) * Constant.RYDBERG).tolist()
+        return {
+            "energy": energies[-1],
+            "electronic": {
+                "units": "eV",
+                "data": self._general_output_parser(block, **settings.REGEX["convergence_electronic"]),
+            },
+        }
 
-        # last structure is used for the next ionic step, hence [:max(0, len(data) - 1)]
-        lattice_convergence = self._lattice_convergence(text)[: max(0, len(data) - 1)]
-        basis_convergence = self._basis_convergence(text)[: max(0, len(data) - 1)]
-        for idx, structure in enumerate(zip(lattice_convergence, basis_convergence)):
-            structure[1]["units"] = "angstrom"
-            lattice_matrix = np.array([structure[0]["vectors"][key] for key in ["a", "b", "c"]]).reshape((3, 3))
-            for coordinate in structure[1]["coordinates"]:
-                coordinate["value"] = np.dot(coordinate["value"], lattice_matrix).tolist()
-            data[idx + 1].update({"structure": {"lattice": structure[0], "basis": structure[1]}})
+    def _convergence_structure(self, lattice, basis):
+        """
+        Converts the basis extracted from a BFGS block to angstrom units and returns the structure of the step.
 
-        # inject initial structure
-        data[0].update(
-            {"structure": {"basis": self.initial_basis(text), "lattice": self.initial_lattice_vectors(text)}}
-        )
+        Args:
+            lattice (dict): lattice in angstrom units.
+            basis (Basis): basis in crystal units.
 
-        return data
+        Returns:
+            dict
+        """
+        basis.units = "angstrom"
+        return {"lattice": lattice, "basis": convert_basis_to_cartesian(basis, lattice)}
 
     def initial_lattice_vectors(self, text):
         """
@@ -297,14 +318,17 @@ class EspressoTXTParser(BaseTXTParser):
 
         Note: no units conversion is done in here.
 
-        """
-        basis = {"units": "angstrom", "elements": [], "coordinates": []}
-        matches = self._general_output_parser(text, **settings.REGEX["basis_alat"](number_of_atoms))
-        for idx, match in enumerate(matches):
-            basis["elements"].append({"id": idx, "value": match[0]})
-            coordinate = [float(match[1]), float(match[2]), float(match[3])]
-            basis["coordinates"].append({"id": idx, "value": coordinate})
-        return basis
+        Returns:
+            Basis
+        """
+        pattern = compile_regex(settings.REGEX["basis_alat"](number_of_atoms)["regex"], GENERAL_OUTPUT_PARSER_FLAGS)
+        # stop searching once the sites are found instead of matching the pattern through the rest of the output
+        matches = [_.groups() for _ in itertools.islice(pattern.finditer(text), number_of_atoms or None)]
+        return Basis(
+            [match[0] for match in matches],
+            [[float(match[1]), float(match[2]), float(match[3])] for match in matches],
+            units="angstrom",
+        )
 
     def _get_alat(self, text):
         return self._general_output_parser(text, **settings.REGEX["lattice_parameter_alat"])[0]
@@ -328,7 +352,7 @@ class EspressoTXTParser(BaseTXTParser):
             text (str): text to extract data from.
 
         Returns:
-            dict
+            Basis
 
          Example:
             {
@@ -340,61 +364,9 @@ class EspressoTXTParser(BaseTXTParser):
         alat = self._get_alat(text)
         number_of_atoms = self._number_of_atoms(text)
         basis_in_alat_units = self._extract_basis(text[text.find("positions (alat units)") :], number_of_atoms)
-        for coordinate in basis_in_alat_units["coordinates"]:
-            coordinate["value"] = [x * alat * Constant.BOHR for x in coordinate["value"]]
+        basis_in_alat_units.coordinates = basis_in_alat_units.coordinates * alat * Constant.BOHR
         return basis_in_alat_units
 
-    def _lattice_convergence(self, text):
-        """
-        Extracts lattice convergence values in angstrom units computed in each BFGS step.
-
-        Args:
-            text (str): text to extract data from.
-
-        Returns:
-            list
-
-        Example:
-            [
-                {
-                    'vectors': {
-                        'a': [-0.561154473, -0.000000000, 0.561154473],
-                        'b': [-0.000000000, 0.561154473, 0.561154473],
-                        'c': [-0.561154473, 0.561154473, 0.000000000],
-                        'alat': 1
-                    }
-                 },
-                ...
-                {
-                    'vectors': {
-                        'a': [-0.561154473, -0.000000000, 0.561154473],
-                        'b': [-0.000000000, 0.561154473, 0.561154473],
-                        'c': [-0.561154473, 0.561154473, 0.000000000],
-                        'alat': 1
-                    }
-                 }
-             ]
-        """
-        return self._extract_data_from_bfgs_blocks(text, self._extract_lattice)
-
-    def _extract_data_from_bfgs_blocks(self, text, func):
-        """
-        Extracts data from BFGS blocks using the provided function.
-
-        Args:
-            text (str): text to extract data from.
-            func (func): function object to be applied on the content block.
-
-        Returns:
-            list: list of information extracted using the provided function
-        """
-        results = []
-        bfgs_block_pattern = re.compile(settings.REGEX["bfgs_block"]["regex"], re.DOTALL)
-        bfgs_blocks = bfgs_block_pattern.findall(text)
-        for block in bfgs_blocks:
-            results.append(func(block))
-        return results
-
     def _extract_lattice(self, text, regex="lattice"):
         """
         Extracts lattice.
@@ -417,38 +389,11 @@ class EspressoTXTParser(BaseTXTParser):
                 }
             }
         """
-        match = re.search(settings.REGEX[regex]["regex"], text)
+        match = REGEX_REGISTRY.get("espresso", regex).search(text)
         if match:
             lattice = [float(_) for _ in match.groups(1)]
             return {"vectors": {"a": lattice[0:3], "b": lattice[3:6], "c": lattice[6:9], "alat": 1}}
 
-    def _basis_convergence(self, text):
-        """
-        Extracts convergence bases computed in each BFGS step.
-
-        Args:
-            text (str): text to extract data from.
-
-        Returns:
-            list
-
-        Example:
-            [
-                {
-                    'units': 'crystal',
-                    'elements': [{'id': 0, 'value': 'Si'}, {'id': 1, 'value': 'Si'}],
-                    'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [0.0, 0.0, 0.0]}]
-                 },
-                ...
-                {
-                    'units': 'crystal',
-                    'elements': [{'id': 0, 'value': 'Si'}, {'id': 1, 'value': 'Si'}],
-                    'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [0.0, 0.0, 0.0]}]
-                 }
-            ]
-        """
-        return self._extract_data_from_bfgs_blocks(text, self._extract_basis_from_bfgs_blocks)
-
     def _extract_basis_from_bfgs_blocks(self, text):
         """
         Extracts basis data in crystal units.
@@ -457,7 +402,7 @@ class EspressoTXTParser(BaseTXTParser):
             text (str): text to extract data from.
 
         Returns:
-            dict
+            Basis
 
         Example:
             {
@@ -466,14 +411,13 @@ class EspressoTXTParser(BaseTXTParser):
                 'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [0.0, 0.0, 0.0]}]
              }
         """
-        basis = {"units": "crystal", "elements": [], "coordinates": []}
-        matches = re.findall(settings.REGEX["ion_position"]["regex"], text)
+        matches = REGEX_REGISTRY.get("espresso", "ion_position").findall(text)
         if matches:
-            for idx, match in enumerate(matches):
-                basis["elements"].append({"id": idx, "value": match[0]})
-                basis["coordinates"].append({"id": idx, "value": [float(match[1]), float(match[2]), float(match[3])]})
-
-            return basis
+            return Basis(
+                [match[0] for match in matches],
+                [[float(match[1]), float(match[2]), float(match[3])] for match in matches],
+                units="crystal",
+            )
 
     def stress_tensor(self, text):
         """
@@ -633,10 +577,8 @@ class EspressoTXTParser(BaseTXTParser):
         """
         with open(modes_file, "r") as f:
             text = f.read()
-        qpoints = np.array(re.compile(settings.REGEX["qpoints"]["regex"]).findall(text), dtype=np.float32)
-        frequencies = np.array(
-            re.compile(settings.REGEX["phonon_frequencies"]["regex"]).findall(text), dtype=np.float32
-        )
+        qpoints = np.array(REGEX_REGISTRY.get("espresso", "qpoints").findall(text), dtype=np.float32)
+        frequencies = np.array(REGEX_REGISTRY.get("espresso", "phonon_frequencies").findall(text), dtype=np.float32)
         frequencies = np.transpose(frequencies.reshape(qpoints.shape[0], frequencies.shape[0] // qpoints.shape[0]))
         return qpoints, frequencies
 
@@ -790,12 +732,7 @@ class EspressoTXTParser(BaseTXTParser):
         basis = self._extract_basis(text[atomic_position_last_index:], number_of_atoms)
 
         # final basis is in crystal units, hence it needs to be converted into angstrom.
-        final_lattice_vectors = self.final_lattice_vectors(text)
-        lattice_matrix = np.array([final_lattice_vectors["vectors"][key] for key in ["a", "b", "c"]]).reshape((3, 3))
-        for coordinate in basis["coordinates"]:
-            coordinate["value"] = np.dot(coordinate["value"], lattice_matrix).tolist()
-
-        return basis
+        return convert_basis_to_cartesian(basis, self.final_lattice_vectors(text))
 
     def final_lattice_vectors(self, text):
         """
@@ -1136,3 +1073,131 @@ class EspressoTXTParser(BaseTXTParser):
         return {
             "values": values,
         }
+
+
+class EspressoConvergenceIndex(object):
+    """
+    Index of the self-consistent and BFGS blocks of pw.x standard output, which the convergence data is extracted from.
+
+    The index is built incrementally: the text appended to the output is passed to `update` and only this text, along
+    with the unfinished blocks at the end of the previous text, is searched. Hence, following the output of a running
+    calculation costs in proportion to the new output rather than to the size of the whole output.
+
+    Args:
+        txt_parser (EspressoTXTParser): parser used to extract the data from the blocks.
+    """
+
+    def __init__(self, txt_parser):
+        self.txt_parser = txt_parser
+        self.scf_accuracies = []  # estimated scf accuracy of all electronic steps
+        self.steps = []  # one entry per complete self-consistent calculation
+        self.initial_structure = None
+        self._raw_structures = []  # lattice and basis of each BFGS block
+        self._structures = []  # structures converted to angstrom units so far
+        self._head = ""  # text before the end of the first self-consistent calculation
+        self._scf_text = ""  # text from the first unfinished self-consistent calculation
+        self._bfgs_text = ""  # text from the first unfinished BFGS block
+
+    def update(self, text):
+        """
+        Adds the text appended to the output since the previous update.
+
+        Args:
+            text (str): new text, ending at a line boundary.
+        """
+        if not text:
+            return
+        parser = self.txt_parser
+        self.scf_accuracies.extend(parser._general_output_parser(text, **settings.REGEX["convergence_electronic"]))
+
+        self._scf_text = self._consume(
+            self._scf_text + text,
+            REGEX_REGISTRY.get("espresso", "convergence_ionic_blocks", re.DOTALL | re.MULTILINE),
+            settings.SCF_BLOCK_FLAG,
+            lambda match: self.steps.append(parser._convergence_step(match.group(1))),
+        )
+        self._bfgs_text = self._consume(
+            self._bfgs_text + text,
+            REGEX_REGISTRY.get("espresso", "bfgs_block", re.DOTALL),
+            settings.BFGS_BLOCK_FLAG,
+            lambda match: self._raw_structures.append(
+                (parser._extract_lattice(match.group(0)), parser._extract_basis_from_bfgs_blocks(match.group(0)))
+            ),
+        )
+
+        if self.initial_structure is None:
+            self._head += text
+            if self.steps:
+                self.initial_structure = {
+                    "basis": parser.initial_basis(self._head),
+                    "lattice": parser.initial_lattice_vectors(self._head),
+                }
+                self._head = ""
+
+    @staticmethod
+    def _consume(text, pattern, flag, callback):
+        """
+        Passes the complete blocks found in a given text to the callback and returns the text left for the next update,
+        starting right before the first unfinished block.
+
+        Args:
+            text (str): text to search.
+            pattern (re.Pattern): block pattern.
+            flag (str): text the blocks start with.
+            callback (func): function to be applied on each block match.
+
+        Returns:
+            str
+        """
+        end_index = 0
+        for match in pattern.finditer(text):
+            callback(match)
+            end_index = match.end()
+        start_index = text.find(flag, end_index)
+        # keep the preceding character as the block patterns may start with whitespace
+        return "" if start_index < 0 else text[max(end_index, start_index - 1) :]
+
+    def structures(self, count):
+        """
+        Returns the structures of the first BFGS blocks in angstrom units.
+
+        Args:
+            count (int): maximum number of structures.
+
+        Returns:
+            list[dict]
+        """
+        for lattice, basis in self._raw_structures[len(self._structures) : count]:
+            self._structures.append(self.txt_parser._convergence_structure(lattice, basis))
+        return self._structures[:count]
+
+    def convergence_electronic(self):
+        """
+        Returns convergence electronic, including the electronic steps of the unfinished ionic step.
+
+        Returns:
+             list[list]
+        """
+        ionic_data = [step["electronic"]["data"] for step in self.steps]
+        # the electronic steps of the unfinished ionic step are included to have realtime data
+        last_step_data = self.scf_accuracies[sum([len(_) for _ in ionic_data]) :]
+        if last_step_data:
+            ionic_data.append(last_step_data)
+        return [(np.array(_) * Constant.RYDBERG).tolist() for _ in ionic_data]
+
+    def convergence_ionic(self):
+        """
+        Returns convergence ionic. The data is copied, hence the index is not modified by the callers.
+
+        Returns:
+             list[dict]
+        """
+        if not self.steps:
+            return []
+        data = [dict(step) for step in self.steps]
+        # last structure is used for the next ionic step, hence len(data) - 1
+        for idx, structure in enumerate(self.structures(len(data) - 1)):
+            data[idx + 1].update({"structure": structure})
+        # inject initial structure
+        data[0].update({"structure": self.initial_structure})
+        return copy.deepcopy(expand_bases(data))
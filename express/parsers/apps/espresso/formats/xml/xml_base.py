@@ -2,7 +2,7 @@ import re
 
 import numpy as np
 
-from express.parsers.formats.xml import BaseXMLParser
+from express.parsers.formats.xml import BaseXMLParser, decode_numbers
 from express.parsers.settings import GENERAL_REGEX, Constant
 
 
@@ -16,12 +16,11 @@ class EspressoXMLParserBase(BaseXMLParser):
 
     TAG_VALUE_CAST_MAP = {
         "character": lambda v, s, c: v,
+        # integer tags hold few values, hence the regex tolerating stray tokens is kept for them
         "integer": lambda v, s, c: np.array([int(_) for _ in re.findall(GENERAL_REGEX["int_number"], v)]).reshape(
             [s // c, c]
         ),
-        "real": lambda v, s, c: np.array([float(_) for _ in re.findall(GENERAL_REGEX["double_number"], v)]).reshape(
-            [s // c, c]
-        ),
+        "real": lambda v, s, c: decode_numbers(v, np.float64).reshape([s // c, c]),
         "logical": lambda v, s, c: False if v in ["F", "false"] else True,
     }
 
@@ -60,8 +59,6 @@ class EspressoXMLParserBase(BaseXMLParser):
         bs_tag = self.root.find(self.band_structure_tag)
         return self._get_xml_tag_value(bs_tag.find(self.fermi_energy_tag)) * Constant.HARTREE
 
-
-
     def get_inverse_reciprocal_lattice_vectors(self):
         """
         Returns inverse reciprocal lattice vectors to convert cartesian (2pi/a) point to crystal.
@@ -69,5 +66,3 @@ class EspressoXMLParserBase(BaseXMLParser):
         reciprocal_lattice = self.final_lattice_vectors(reciprocal=True)
         lattice_array = [reciprocal_lattice["vectors"][i] for i in ["a", "b", "c"]]
         return np.linalg.inv(np.array(lattice_array))
-
-
@@ -4,6 +4,8 @@ from xml.etree.ElementTree import Element
 import numpy as np
 
 from express.parsers.apps.espresso.formats.xml.xml_base import EspressoXMLParserBase
+from express.parsers.eigenvalues import EigenvalueSet
+from express.parsers.formats.xml import decode_numbers
 from express.parsers.settings import Constant
 
 
@@ -45,7 +47,9 @@ class EspressoXMLParserPostV6_4(EspressoXMLParserBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.root = self.root.find("output") if self.root else None
+
+    def _transform_root(self, root):
+        return root.find("output")
 
     def nspins(self) -> int:
         bs_tag = self.root.find(self.band_structure_tag)
@@ -105,12 +109,13 @@ class EspressoXMLParserPostV6_4(EspressoXMLParserBase):
 
         return vectors
 
-    def eigenvalues_at_kpoints(self) -> list:
+    def eigenvalues_at_kpoints(self) -> EigenvalueSet:
         """
-        Return list of eigenvalue data for all kpoints.
+        Return eigenvalue data for all kpoints.
 
         Returns:
-            list: [
+            EigenvalueSet: sequence of the following per-kpoint objects:
+            [
                 {
                     "kpoint": [float, float, float],
                     "weight": "float",
@@ -124,71 +129,40 @@ class EspressoXMLParserPostV6_4(EspressoXMLParserBase):
                 }
             ]
         """
-        all_kpoints = []
-        bs_tag = self.root.find(self.band_structure_tag)
-        is_lsda = self._get_xml_tag_value(bs_tag.find("lsda"))
-
-        if is_lsda:
-            nband = int(bs_tag.find("nbnd_up").text)
-        else:
-            nband = int(bs_tag.find("nbnd").text)
-
-        for ks_entry in bs_tag.iterfind("ks_energies"):
-            k_point = ks_entry.find("k_point")
-            cartesian_coords = self._get_xml_tag_value(k_point)[0]
-            crystal_coords = np.dot(cartesian_coords, self.get_inverse_reciprocal_lattice_vectors())
-            kpoint_dict = {
-                "kpoint": crystal_coords.tolist(),
-                "weight": float(k_point.attrib.get("weight")),
-            }
-            if is_lsda:
-                kpoint_dict["eigenvalues"] = self.__process_ks_lsda(ks_entry, nband)
-            # below clause is applicable to both non-magnetic and non-collinear magnetic cases
-            else:
-                kpoint_dict["eigenvalues"] = self.__process_ks_non_mag(ks_entry)
+        return EigenvalueSet(*self._band_structure_arrays())
 
-            all_kpoints.append(kpoint_dict)
-        return all_kpoints
+    def _band_structure_arrays(self) -> tuple:
+        """
+        Extracts the kpoints and the eigenvalues of all kpoints at once.
 
-    def __process_ks_lsda(self, ks_entry: Element, nband: int) -> list:
-        """Process local spin density approximation (LSDA) eigenvalues.
+        For LSDA the first nband eigenvalues of each kpoint are assumed to be spin 0.5 and the next nband spin -0.5.
+        The non-magnetic and non-collinear magnetic cases have a single (0.5) spin channel.
 
-        Assume the first nband entries are spin 0.5 and the next nband entries are spin -0.5.
+        Returns:
+            tuple: ndarrays of kpoints in crystal units (nk x 3), weights (nk), energies in eV and occupations
+                (ns x nk x nb).
         """
-        energies = (
-            np.array([float(eigenvalue) for eigenvalue in ks_entry.find("eigenvalues").text.split()]) * Constant.HARTREE
-        ).tolist()
-        occupations = [float(occ) for occ in ks_entry.find("occupations").text.split()]
-        eigenvalues = []
-        eigenvalues.append(
-            {
-                "energies": energies[:nband],
-                "occupations": occupations[:nband],
-                "spin": 0.5,
-            }
-        )
-        eigenvalues.append(
-            {
-                "energies": energies[nband:],
-                "occupations": occupations[nband:],
-                "spin": -0.5,
-            }
-        )
-        return eigenvalues
-
-    def __process_ks_non_mag(self, ks_entry: Element) -> list:
-        eigenvalues = []
-        eigenvalues.append(
-            {
-                "energies": (
-                    np.array([float(eigenvalue) for eigenvalue in ks_entry.find("eigenvalues").text.split()])
-                    * Constant.HARTREE
-                ).tolist(),
-                "occupations": [float(occ) for occ in ks_entry.find("occupations").text.split()],
-                "spin": 0.5,
-            }
+        bs_tag = self.root.find(self.band_structure_tag)
+        nspin = 2 if self._get_xml_tag_value(bs_tag.find("lsda")) else 1
+        ks_entries = bs_tag.findall("ks_energies")
+        k_points = [ks_entry.find("k_point") for ks_entry in ks_entries]
+        if not ks_entries:
+            return np.zeros((0, 3)), np.zeros(0), np.zeros((nspin, 0, 0)), np.zeros((nspin, 0, 0))
+
+        cartesian_coords = decode_numbers(" ".join(k_point.text for k_point in k_points)).reshape((-1, 3))
+        # transform all kpoints at once instead of inverting the reciprocal lattice for each kpoint
+        crystal_coords = np.dot(cartesian_coords, self.get_inverse_reciprocal_lattice_vectors())
+
+        def to_spin_arrays(tag):
+            values = decode_numbers(" ".join(ks_entry.find(tag).text for ks_entry in ks_entries))
+            return values.reshape((len(ks_entries), nspin, -1)).transpose((1, 0, 2))
+
+        return (
+            crystal_coords,
+            np.array([float(k_point.attrib.get("weight")) for k_point in k_points]),
+            to_spin_arrays("eigenvalues") * Constant.HARTREE,
+            to_spin_arrays("occupations"),
         )
-        return eigenvalues
 
     def final_basis(self) -> dict:
         elements, coordinates = [], []
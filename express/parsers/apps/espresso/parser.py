@@ -6,19 +6,30 @@ import numpy as np
 
 from express.parsers import BaseParser
 from express.parsers.apps.espresso import settings
-from express.parsers.apps.espresso.formats.txt import EspressoTXTParser
+from express.parsers.apps.espresso.formats.txt import EspressoTXTParser, EspressoConvergenceIndex
 from express.parsers.apps.espresso.formats.xml.xml_factory import get_xml_parser
 from express.parsers.apps.espresso.settings import NEB_PATH_FILE_SUFFIX
+from express.parsers.eigenvalues import EigenvalueSet
 from express.parsers.mixins.electronic import ElectronicDataMixin
 from express.parsers.mixins.ionic import IonicDataMixin
 from express.parsers.mixins.reciprocal import ReciprocalDataMixin
 from express.parsers.settings import Constant
+from express.parsers.tail import FileTail
 from express.parsers.utils import find_file, find_files_by_regex, lattice_basis_to_poscar
 
 
 class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDataMixin):
     """
     Espresso parser class.
+
+    Args:
+        kwargs (dict): kwargs passed to the parser.
+            work_dir (str): path to the working directory.
+            stdout_file (str): path to the standard output file.
+            incremental_convergence (bool): whether to follow the standard output of a running calculation, parsing
+                only the output appended since the previous call when extracting convergence data.
+            pdos_max_workers (int): number of workers to read projwfc.x partial DOS files concurrently with.
+            pdos_executor (str): type of the workers reading partial DOS files, "thread" (default) or "process".
     """
 
     def __init__(self, *args, **kwargs):
@@ -26,13 +37,26 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         self.work_dir = self.kwargs["work_dir"]
         self.stdout_file = self.kwargs["stdout_file"]
         self.txt_parser = EspressoTXTParser(self.work_dir)
+        self.stdout_tail = None
+        self.convergence_index = None
+        if self.kwargs.get("incremental_convergence"):
+            self.stdout_tail = FileTail(self.stdout_file)
+            self.convergence_index = EspressoConvergenceIndex(self.txt_parser)
 
+        self.is_sternheimer_gw = self._is_sternheimer_gw_calculation()
         self.xml_parser = get_xml_parser(
             self.version,
             work_dir=self.work_dir,
-            is_sternheimer_gw=self._is_sternheimer_gw_calculation(),
+            is_sternheimer_gw=self.is_sternheimer_gw,
         )
 
+    def _get_watched_files(self):
+        """
+        Reference:
+            func: express.parsers.BaseParser._get_watched_files
+        """
+        return [self.stdout_file, self.xml_parser.xml_path]
+
     def total_energy(self):
         """
         Returns total energy.
@@ -40,7 +64,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.total_energy
         """
-        return self.txt_parser.total_energy(self._get_file_content(self.stdout_file))
+        return self.txt_parser.total_energy(self._get_file_view(self.stdout_file))
 
     def fermi_energy(self):
         """
@@ -89,7 +113,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.eigenvalues_at_kpoints
         """
-        if self._is_sternheimer_gw_calculation():
+        if self.is_sternheimer_gw:
             text = self._get_file_content(self.stdout_file)
             inverse_reciprocal_lattice_vectors = self.xml_parser.get_inverse_reciprocal_lattice_vectors()
             return self.txt_parser.eigenvalues_at_kpoints_from_sternheimer_gw_stdout(
@@ -109,7 +133,10 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.reciprocal.ReciprocalDataMixin.ibz_k_points
         """
-        return np.array([eigenvalueData["kpoint"] for eigenvalueData in self.eigenvalues_at_kpoints()])
+        eigenvalues_at_kpoints = self.eigenvalues_at_kpoints()
+        if isinstance(eigenvalues_at_kpoints, EigenvalueSet):
+            return eigenvalues_at_kpoints.kpoints
+        return np.array([eigenvalueData["kpoint"] for eigenvalueData in eigenvalues_at_kpoints])
 
     def dos(self):
         """
@@ -118,7 +145,9 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.dos
         """
-        return self.txt_parser.dos()
+        return self.txt_parser.dos(
+            max_workers=self.kwargs.get("pdos_max_workers"), executor=self.kwargs.get("pdos_executor", "thread")
+        )
 
     def initial_basis(self):
         """
@@ -127,7 +156,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.initial_basis
         """
-        return self.txt_parser.initial_basis(self._get_file_content(self.stdout_file))
+        return self.txt_parser.initial_basis(self._get_file_content(self.stdout_file)).to_dict()
 
     def initial_lattice_vectors(self):
         """
@@ -163,6 +192,8 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.convergence_electronic
         """
+        if self.stdout_tail:
+            return self._update_convergence_index().convergence_electronic()
         return self.txt_parser.convergence_electronic(self._get_file_content(self.stdout_file))
 
     def convergence_ionic(self):
@@ -172,8 +203,24 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.convergence_ionic
         """
+        if self.stdout_tail:
+            return self._update_convergence_index().convergence_ionic()
         return self.txt_parser.convergence_ionic(self._get_file_content(self.stdout_file))
 
+    def _update_convergence_index(self):
+        """
+        Updates the convergence index with the output appended to the stdout file since the previous call. The index is
+        built from scratch if the file was truncated or replaced.
+
+        Returns:
+             EspressoConvergenceIndex
+        """
+        text, is_reset = self.stdout_tail.read()
+        if is_reset:
+            self.convergence_index = EspressoConvergenceIndex(self.txt_parser)
+        self.convergence_index.update(text)
+        return self.convergence_index
+
     def stress_tensor(self):
         """
         Returns stress tensor.
@@ -181,7 +228,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.stress_tensor
         """
-        return self.txt_parser.stress_tensor(self._get_file_content(self.stdout_file))
+        return self.txt_parser.stress_tensor(self._get_file_view(self.stdout_file))
 
     def pressure(self):
         """
@@ -190,7 +237,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.pressure
         """
-        return self.txt_parser.pressure(self._get_file_content(self.stdout_file))
+        return self.txt_parser.pressure(self._get_file_view(self.stdout_file))
 
     def total_force(self):
         """
@@ -199,7 +246,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.total_force
         """
-        return self.txt_parser.total_force(self._get_file_content(self.stdout_file))
+        return self.txt_parser.total_force(self._get_file_view(self.stdout_file))
 
     def atomic_forces(self):
         """
@@ -208,7 +255,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.atomic_forces
         """
-        return self.txt_parser.atomic_forces(self._get_file_content(self.stdout_file))
+        return self.txt_parser.atomic_forces(self._get_file_view(self.stdout_file))
 
     def total_energy_contributions(self):
         """
@@ -217,7 +264,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.total_energy_contributions
         """
-        return self.txt_parser.total_energy_contributions(self._get_file_content(self.stdout_file))
+        return self.txt_parser.total_energy_contributions(self._get_file_view(self.stdout_file))
 
     def zero_point_energy(self):
         """
@@ -226,7 +273,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.zero_point_energy
         """
-        return self.txt_parser.zero_point_energy(self._get_file_content(self.stdout_file))
+        return self.txt_parser.zero_point_energy(self._get_file_view(self.stdout_file))
 
     def phonon_dos(self):
         """
@@ -1,3 +1,4 @@
+from express.parsers.regex import REGEX_REGISTRY
 from express.parsers.settings import GENERAL_REGEX
 
 PDOS_TOT_FILE = "pdos_tot"
@@ -13,6 +14,10 @@ WAVEFUNCTION_FILE = "wf_r.dat"
 COMMON_REGEX = r"{0}\s+[=:<>]\s*([-+]?\d*\.?\d*([Ee][+-]?\d+)?)"
 DOUBLE_REGEX = GENERAL_REGEX["double_number"]
 
+# text the self-consistent calculation and BFGS blocks start with, see EspressoConvergenceIndex
+SCF_BLOCK_FLAG = "Self-consistent Calculation"
+BFGS_BLOCK_FLAG = "new unit-cell volume"
+
 STERNHEIMER_GW0_DIR_PATTERN = "/_gw0/"
 STERNHEIMER_GW_TITLE = "SternheimerGW"
 PWSCF_OUTPUT_FILE_REGEX = "Program PWSCF"
@@ -29,6 +34,8 @@ REGEX = {
             r".*\.pdos_atm#(?P<atom_num>\d+)\((?P<atom_name>\w+)\)" r"_wfc#(?P<orbit_num>\d+)\((?P<orbit_symbol>\w)\)"
         ),
     },
+    # lines of (p)dos files holding data, i.e. except headers and rows with energies overflowing the format (*******)
+    "dos_data_line": {"regex": r"^ *{0}.*$".format(DOUBLE_REGEX)},
     "convergence_electronic": {
         "regex": r"estimated scf accuracy\s+<\s+({0})".format(DOUBLE_REGEX),
         "output_type": "float",
@@ -189,3 +196,5 @@ TOTAL_ENERGY_CONTRIBUTIONS = {
         "output_type": "float",
     },
 }
+
+REGEX_REGISTRY.register("espresso", REGEX, TOTAL_ENERGY_CONTRIBUTIONS)
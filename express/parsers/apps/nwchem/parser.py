@@ -31,7 +31,7 @@ class NwchemParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDa
             func: express.parsers.mixins.electronic.ElectronicDataMixin.total_energy
             NWChem energies are defaulted to hartrees and are converted to eV in this method
         """
-        total_dft_energy = Constant.HARTREE * self.txt_parser.total_energy(self._get_file_content(self.stdout_file))
+        total_dft_energy = Constant.HARTREE * self.txt_parser.total_energy(self._get_file_view(self.stdout_file))
         return total_dft_energy
 
     def total_energy_contributions(self):
@@ -42,7 +42,7 @@ class NwchemParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDa
             func: express.parsers.mixins.electronic.ElectronicDataMixin.total_energy_contributions
             NWChem energies are defaulted to hartrees and are converted to eV in this method.
         """
-        energy_contributions = self.txt_parser.total_energy_contributions(self._get_file_content(self.stdout_file))
+        energy_contributions = self.txt_parser.total_energy_contributions(self._get_file_view(self.stdout_file))
         for key1, value1 in energy_contributions.items():
             for key2, value2 in value1.items():
                 if type(value2) == float:
@@ -56,7 +56,7 @@ class NwchemParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDa
         Reference:
             NWChem orbital energies are defaulted to hartrees and are converted to eV in this method.
         """
-        homo_energy = self.txt_parser.homo_energy(self._get_file_content(self.stdout_file))
+        homo_energy = self.txt_parser.homo_energy(self._get_file_view(self.stdout_file))
         return None if homo_energy is None else Constant.HARTREE * homo_energy
 
     def lumo_energy(self):
@@ -66,7 +66,7 @@ class NwchemParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDa
         Reference:
             NWChem orbital energies are defaulted to hartrees and are converted to eV in this method.
         """
-        lumo_energy = self.txt_parser.lumo_energy(self._get_file_content(self.stdout_file))
+        lumo_energy = self.txt_parser.lumo_energy(self._get_file_view(self.stdout_file))
         return None if lumo_energy is None else Constant.HARTREE * lumo_energy
 
     def zero_point_energy(self):
@@ -76,7 +76,7 @@ class NwchemParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDa
         Reference:
             NWChem zero-point correction is printed in kcal/mol and converted to eV in this method.
         """
-        zero_point_energy = self.txt_parser.zero_point_energy(self._get_file_content(self.stdout_file))
+        zero_point_energy = self.txt_parser.zero_point_energy(self._get_file_view(self.stdout_file))
         return None if zero_point_energy is None else self._kcal_per_mol_to_ev(zero_point_energy)
 
     def thermal_correction_to_energy(self):
@@ -86,13 +86,13 @@ class NwchemParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDa
         Reference:
             NWChem thermochemistry correction is parsed directly in kcal/mol.
         """
-        return self.txt_parser.thermal_correction_to_energy(self._get_file_content(self.stdout_file))
+        return self.txt_parser.thermal_correction_to_energy(self._get_file_view(self.stdout_file))
 
     def thermal_correction_to_enthalpy(self):
         """
         Returns thermal correction to enthalpy.
         """
-        return self.txt_parser.thermal_correction_to_enthalpy(self._get_file_content(self.stdout_file))
+        return self.txt_parser.thermal_correction_to_enthalpy(self._get_file_view(self.stdout_file))
 
     def _is_nwchem_output_file(self, path):
         """
@@ -1,3 +1,4 @@
+from express.parsers.regex import REGEX_REGISTRY
 from express.parsers.settings import GENERAL_REGEX
 
 COMMON_REGEX = r"{}\s+[=:<>]\s*([-+]?\d*\.?\d*([Ee][+-]?\d+)?)"
@@ -38,3 +39,5 @@ TOTAL_ENERGY_CONTRIBUTIONS = {
         "output_type": "float",
     },
 }
+
+REGEX_REGISTRY.register("nwchem", REGEX, TOTAL_ENERGY_CONTRIBUTIONS)
@@ -1,9 +1,10 @@
-import re
 import numpy as np
-from pymatgen.io.vasp import Outcar
+from collections import deque
 
 from express.parsers.apps.vasp import settings
-from express.parsers.formats.txt import BaseTXTParser
+from express.parsers.basis import Basis
+from express.parsers.regex import REGEX_REGISTRY, compile_regex
+from express.parsers.formats.txt import BaseTXTParser, GENERAL_OUTPUT_PARSER_FLAGS
 
 
 class VaspTXTParser(BaseTXTParser):
@@ -31,7 +32,7 @@ class VaspTXTParser(BaseTXTParser):
         }
         start_index = text.find(text_range[space]["start"])
         end_index = text.find(text_range[space]["end"])
-        ibz_kpts = re.findall(settings.REGEX["ibz_kpoints"]["regex"], text[start_index:end_index])
+        ibz_kpts = REGEX_REGISTRY.get("vasp", "ibz_kpoints").findall(text[start_index:end_index])
         ibz_kpts = [[float(x) for x in kp] for kp in ibz_kpts]
         return np.array(ibz_kpts)
 
@@ -47,94 +48,191 @@ class VaspTXTParser(BaseTXTParser):
         """
         return self._general_output_parser(text, **settings.REGEX["total_energy"])
 
-    def _lattice_convergence(self, text):
+    def _lattice(self, match):
         """
-        Extracts lattice convergence values computed in each BFGS step.
+        Returns the lattice for a match of the lattice vectors regex.
+
+        Example:
+            {
+                'vectors': {
+                    'a': [-0.561154473, -0.000000000, 0.561154473],
+                    'b': [-0.000000000, 0.561154473, 0.561154473],
+                    'c': [-0.561154473, 0.561154473, 0.000000000],
+                    'alat': 1.0
+                }
+            }
+        """
+        lattice = [float(_) for _ in match.groups()]
+        return {
+            "vectors": {
+                "a": lattice[0:3],
+                "b": lattice[3:6],
+                "c": lattice[6:9],
+                "alat": 1.0,  # abc vectors are expected in absolute units (eg. bohr)
+            }
+        }
+
+    def _iter_outcar_sections(self, outcar):
+        """
+        Reads OUTCAR line by line and yields the lattices and the blocks of ion positions and forces in the order they
+        appear, so that the file is never loaded into memory. Sections are detected as the `lattice_vectors` and
+        `ion_positions_block` regexes would do on the whole text.
 
         Args:
-            text (str): text to extract data from.
+            outcar (str|iterable): OUTCAR content or an iterable of its lines, e.g. an open file.
+
+        Returns:
+            generator: ("lattice", dict) and ("ions", str) tuples, the latter containing the text of the block.
+        """
+        lattice_pattern = REGEX_REGISTRY.get("vasp", "lattice_vectors")
+        lattice_candidates = []  # text following a lattice flag, one list of lines per flag not matched yet
+        block_lines = None  # text of the ions block being read, None outside of a block
+        header_offset = None  # minimum offset of the separator ending the block header, None outside of a header
+
+        for line in self._iter_lines(outcar):
+            for candidate in lattice_candidates:
+                candidate.append(line)
+            flag_index = line.find(settings.LATTICE_VECTORS_FLAG)
+            if flag_index >= 0:
+                lattice_candidates.append([line[flag_index:]])
+            if lattice_candidates and len(lattice_candidates[0]) == 4:
+                match = lattice_pattern.match("".join(lattice_candidates.pop(0)))
+                if match:
+                    # the following candidates start within the matched text
+                    lattice_candidates = []
+                    yield "lattice", self._lattice(match)
+
+            offset = 0
+            while offset < len(line):
+                if block_lines is not None:
+                    separator_index = line.find(settings.ION_POSITIONS_SEPARATOR, 0 if block_lines else 1)
+                    if separator_index < 0:
+                        block_lines.append(line)
+                        break
+                    block_lines.append(line[:separator_index])
+                    yield "ions", "".join(block_lines)
+                    block_lines = None
+                    offset = len(line) - len(line[separator_index:].lstrip("-"))
+                elif header_offset is not None:
+                    # header ends with a line terminated by a separator
+                    dashes_index = max(header_offset, len(line.rstrip("\n").rstrip("-")))
+                    if line.endswith("\n") and len(line) - 1 - dashes_index >= len(settings.ION_POSITIONS_SEPARATOR):
+                        block_lines, header_offset = [], None
+                    else:
+                        header_offset = 0
+                    break
+                else:
+                    flag_index = line.find(settings.ION_POSITIONS_FLAG, offset)
+                    if flag_index < 0:
+                        break
+                    header_offset = flag_index + len(settings.ION_POSITIONS_FLAG) + 1
+
+        for candidate in lattice_candidates:
+            match = lattice_pattern.match("".join(candidate))
+            if match:
+                yield "lattice", self._lattice(match)
+                break
+
+    def iter_structures(self, outcar, atom_names):
+        """
+        Yields the structure of each ionic step read from OUTCAR line by line: the n-th lattice is paired with the n-th
+        block of ion positions. Lattices without a corresponding block are yielded with `None` basis and forces.
+
+        Args:
+            outcar (str|iterable): OUTCAR content or an iterable of its lines, e.g. an open file.
+            atom_names (list): list of atom names.
 
         Returns:
-            list
+            generator
 
         Example:
-            [
-                {
+            {
+                'lattice': {
                     'vectors': {
                         'a': [-0.561154473, -0.000000000, 0.561154473],
                         'b': [-0.000000000, 0.561154473, 0.561154473],
                         'c': [-0.561154473, 0.561154473, 0.000000000],
-                        'alat': 9.44858082
+                        'alat': 1.0
                     }
-                 },
-                ...
-                {
-                    'vectors': {
-                        'a': [-0.561154473, -0.000000000, 0.561154473],
-                        'b': [-0.000000000, 0.561154473, 0.561154473],
-                        'c': [-0.561154473, 0.561154473, 0.000000000],
-                        'alat': 9.44858082
-                    }
-                 }
-             ]
+                },
+                'basis': {
+                    'units': 'angstrom',
+                    'elements': [{'id': 0, 'value': 'Si'}, {'id': 1, 'value': 'Si'}],
+                    'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [1.35, 1.35, 1.35]}]
+                },
+                'forces': [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+            }
         """
+        basis_pattern = REGEX_REGISTRY.get("vasp", "basis_vectors")
+        forces_pattern = REGEX_REGISTRY.get("vasp", "ion_forces")
+        lattices, blocks = deque(), deque()
+        for section, value in self._iter_outcar_sections(outcar):
+            (lattices if section == "lattice" else blocks).append(value)
+            while lattices and blocks:
+                block = blocks.popleft()
+                ions = basis_pattern.findall(block)
+                yield {
+                    "lattice": lattices.popleft(),
+                    "basis": Basis(
+                        [atom_names[idx] for idx in range(len(ions))],
+                        [[float(x) for x in ion] for ion in ions],
+                        units="angstrom",
+                    ),
+                    "forces": [[float(x) for x in force] for force in forces_pattern.findall(block)],
+                }
+        for lattice in lattices:
+            yield {"lattice": lattice, "basis": None, "forces": None}
 
-        lattices = []
-        match = re.findall(settings.REGEX["lattice_vectors"]["regex"], text)
-        if match:
-            for lattice in match:
-                lattice = [float(_) for _ in lattice]
-                lattices.append(
-                    {
-                        "vectors": {
-                            "a": lattice[0:3],
-                            "b": lattice[3:6],
-                            "c": lattice[6:9],
-                            "alat": 1.0,  # abc vectors are expected in absolute units (eg. bohr)
-                        }
-                    }
-                )
-        return lattices
-
-    def _basis_convergence(self, text, atom_names):
+    def iter_convergence_electronic(self, stdout):
         """
-        Extracts convergence bases computed in each BFGS step.
+        Yields the energy changes (dE column) of the electronic steps of each ionic step, reading stdout line by line.
+        A new ionic step starts at electronic step 1.
 
         Args:
-            text (str): text to extract data from.
-            atom_names (list): list of atom names.
+            stdout (str|iterable): stdout content or an iterable of its lines, e.g. an open file.
 
         Returns:
-            list
+            generator
+        """
+        pattern = compile_regex(settings.REGEX["convergence_electronic"]["regex"], GENERAL_OUTPUT_PARSER_FLAGS)
+        energies = None
+        for line in self._iter_lines(stdout):
+            if ":" not in line:
+                continue
+            for step, energy in pattern.findall(line):
+                if int(step) == 1:
+                    if energies is not None:
+                        yield energies
+                    energies = []
+                if energies is not None:
+                    energies.append(float(energy))
+        if energies is not None:
+            yield energies
+
+    def iter_ionic_steps(self, outcar, stdout, atom_names):
+        """
+        Yields convergence ionic steps one by one, reading OUTCAR and stdout line by line, hence the memory needed does
+        not grow with the size of the files. The last step is skipped if its structure is not written yet.
 
-        Example:
-            [
-                {
-                    'units': 'crystal',
-                    'elements': [{'id': 0, 'value': 'Si'}, {'id': 1, 'value': 'Si'}],
-                    'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [0.0, 0.0, 0.0]}]
-                 },
-                ...
-                {
-                    'units': 'crystal',
-                    'elements': [{'id': 0, 'value': 'Si'}, {'id': 1, 'value': 'Si'}],
-                    'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [0.0, 0.0, 0.0]}]
-                 }
-            ]
+        Args:
+            outcar (str|iterable): OUTCAR content or an iterable of its lines, e.g. an open file.
+            stdout (str|iterable): stdout content or an iterable of its lines, e.g. an open file.
+            atom_names (list): list of atoms.
+
+        Returns:
+            generator
         """
-        results = []
-        matches = re.findall(settings.REGEX["ion_positions_block"]["regex"], text, re.DOTALL | re.MULTILINE)
-        if matches:
-            for match in matches:
-                ions = re.findall(settings.REGEX["basis_vectors"]["regex"], match)
-                results.append(
-                    {
-                        "units": "angstrom",
-                        "elements": [{"id": idx, "value": atom_names[idx]} for idx in range(len(ions))],
-                        "coordinates": [{"id": idx, "value": [float(x) for x in ion]} for idx, ion in enumerate(ions)],
-                    }
-                )
-            return results
+        energy = 0
+        structures = self.iter_structures(outcar, atom_names)
+        for energies in self.iter_convergence_electronic(stdout):
+            structure = next(structures, None)
+            if structure is None:
+                return
+            energy += sum(energies)
+            step = {"energy": energy, "electronic": {"units": "eV", "data": energies}}
+            if structure["basis"] is not None:
+                step.update({"structure": {"lattice": structure["lattice"], "basis": structure["basis"]}})
+            yield step
 
     def convergence_electronic(self, outcar, stdout, atom_names):
         """
@@ -159,58 +257,31 @@ class VaspTXTParser(BaseTXTParser):
                 2 T=  1843. E= -.89706481E+03 F= -.91969309E+03 E0= -.91970717E+03  EK= 0.22628E+02
 
         Args:
-            outcar (str): OUTCAR content.
-            stdout (str): stdout content.
+            outcar (str|iterable): OUTCAR content.
+            stdout (str|iterable): stdout content or an iterable of its lines, e.g. an open file.
             atom_names (list): list of atoms.
 
         Returns:
              list[list]
         """
-        data = []
-        matches = self._general_output_parser(stdout, **settings.REGEX["convergence_electronic"])
-        first_step_indices = [ind for ind, elm in enumerate(matches) if int(elm[0]) == 1]
-        for ind, first_step_index in enumerate(first_step_indices):
-            if ind + 1 == len(first_step_indices):
-                energies = matches[first_step_index:]
-            else:
-                energies = matches[first_step_index : first_step_indices[ind + 1]]
-            data.append([energy[1] for energy in energies])  # strip out the step numbers
-        return data
+        return list(self.iter_convergence_electronic(stdout))
 
     def convergence_ionic(self, outcar, stdout, atom_names):
         """
         Extracts convergence ionic.
 
+        Reference:
+            func: express.parsers.apps.vasp.formats.txt.VaspTXTParser.iter_ionic_steps
+
         Args:
-            outcar (str): OUTCAR content.
-            stdout (str): stdout content.
+            outcar (str|iterable): OUTCAR content or an iterable of its lines, e.g. an open file.
+            stdout (str|iterable): stdout content or an iterable of its lines, e.g. an open file.
             atom_names (list): list of atoms.
 
         Returns:
              list[dict]
         """
-        data = []
-        convergence_electronic_data = self.convergence_electronic(outcar, stdout, atom_names)
-        for ind, energies in enumerate(convergence_electronic_data):
-            data.append(
-                {
-                    "energy": sum([sum(e) for e in convergence_electronic_data[0 : ind + 1]]),
-                    "electronic": {"units": "eV", "data": energies},
-                }
-            )
-
-        if not data:
-            return []
-
-        lattice_convergence = self._lattice_convergence(outcar)
-        basis_convergence = self._basis_convergence(outcar, atom_names)
-        data = data[0 : len(lattice_convergence)]  # strip out the last non-complete step
-        if not data:
-            return []
-        for idx, structure in enumerate(zip(lattice_convergence, basis_convergence)):
-            data[idx].update({"structure": {"lattice": structure[0], "basis": structure[1]}})
-
-        return data
+        return list(self.iter_ionic_steps(outcar, stdout, atom_names))
 
     def pressure(self, text):
         """
@@ -274,5 +345,8 @@ class VaspTXTParser(BaseTXTParser):
         Returns:
              list
         """
+        # pymatgen is imported on use to keep it out of the import of the parsers
+        from pymatgen.io.vasp import Outcar
+
         mag = Outcar(outcar).magnetization
         return [[0, 0, ion["tot"]] if isinstance(ion["tot"], float) else ion["tot"].moment.tolist() for ion in mag]
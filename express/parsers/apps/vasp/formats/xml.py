@@ -1,8 +1,10 @@
 import string
 import numpy as np
-from operator import itemgetter
 
-from express.parsers.formats.xml import BaseXMLParser
+from express.parsers.basis import Basis
+from express.parsers.eigenvalues import EigenvalueSet
+from express.parsers.formats.xml import BaseXMLParser, decode_numbers
+from express.parsers.utils import convert_crystal_to_cartesian
 
 SPIN_MAP_COLLINEAR = {1: "up", 2: "down"}
 
@@ -15,19 +17,65 @@ class VaspXMLParser(BaseXMLParser):
     """
     Vasp XML parser class.
 
+    Only the last `calculation` (ionic step) is used, hence vasprun.xml is parsed incrementally and the previous steps
+    are dropped as soon as the next one is read.
+
     Args:
         xml_file_path (str): path to the xml file.
     """
 
     def __init__(self, xml_file_path):
         super(VaspXMLParser, self).__init__(xml_file_path)
+        self._index = None
+        self._index_root = None
+
+    def _parse_root(self):
+        return self._iterparse_root(keep_last=("calculation",))
+
+    @property
+    def index(self):
+        """
+        Index of the vasprun tree: atom names and the elements used by the extractors. It is built once for the current
+        root, hence the extractors do not search the tree, e.g. for the last of the ionic steps, on every call.
+
+        Returns:
+            dict
+        """
+        root = self.root
+        if self._index is None or self._index_root is not root:
+            self._index, self._index_root = self._build_index(root), root
+        return self._index
+
+    @staticmethod
+    def _build_index(root):
+        """
+        Builds the index of the vasprun tree. Elements not found in the tree are set to None.
+
+        Args:
+            root (xml.etree.ElementTree.Element): document root.
+
+        Returns:
+            dict
+        """
+        calculations = root.findall("calculation")
+        calculation = calculations[-1] if calculations else None
+        atoms = root.find("atominfo/array/set")
+        return {
+            "atom_names": None if atoms is None else [atom.find("c").text.strip() for atom in atoms.findall("rc")],
+            "calculation": calculation,
+            "dos": None if calculation is None else calculation.find("dos"),
+            "eigenvalues": None if calculation is None else calculation.find("eigenvalues/array/set"),
+            "final_structure": root.find('structure[@name="finalpos"]'),
+            "kpoints": root.find("kpoints"),
+            "parameters": root.find("parameters"),
+        }
 
     def eigenvalues_at_kpoints(self):
         """
         Returns eigenvalues for all kpoints.
 
         Returns:
-             list
+             EigenvalueSet
 
         Example:
             [
@@ -45,51 +93,63 @@ class VaspXMLParser(BaseXMLParser):
                 ...
             ]
         """
-        kpoints_list = self.root.find("kpoints").find('.//varray[@name="kpointlist"]')
-        kpoints_weight = self.root.find("kpoints").find('.//varray[@name="weights"]')
+        kpoints_list = self.index["kpoints"].find('.//varray[@name="kpointlist"]')
+        kpoints_weight = self.index["kpoints"].find('.//varray[@name="weights"]')
+        kpoints = decode_numbers(" ".join(kpoint.text for kpoint in kpoints_list)).reshape((-1, 3))
+        weights = decode_numbers(" ".join(weight.text for weight in kpoints_weight))
         eigenvalues, occupations = self._parse_eigenvalues_occupations()
 
-        eigenvalues_at_kpoints = []
-        for kp_id, (kpoint, weight) in enumerate(zip(kpoints_list, kpoints_weight)):
-            eigenvalues_at_kpoint = {
-                "kpoint": [float(x) for x in kpoint.text.split()],
-                "weight": float(weight.text),
-                "eigenvalues": [],
-            }
-            for spin in eigenvalues:
-                eigenvalues_at_kpoint["eigenvalues"].append(
-                    {
-                        "energies": eigenvalues[spin][kp_id].tolist(),
-                        "occupations": occupations[spin][kp_id].tolist(),
-                        "spin": 0.5 if spin == 0 else -0.5,
-                    }
-                )
-            eigenvalues_at_kpoints.append(eigenvalues_at_kpoint)
-
-        return eigenvalues_at_kpoints
+        nkpoints = min(len(kpoints), len(weights), eigenvalues.shape[1])
+        return EigenvalueSet(
+            kpoints[:nkpoints],
+            weights[:nkpoints],
+            eigenvalues[:, :nkpoints],
+            occupations[:, :nkpoints],
+        )
 
     def _parse_eigenvalues_occupations(self):
         """
         Extracts eigenvalues and occupations for each spin and kpoint.
 
         Returns:
-            tuple: a tuple of the eigenvalues and occupations for each spin and kpoint.
-        """
-        eigenvalues = {}
-        occupations = {}
-        eigenvalues_tag = self.root.findall("calculation")[-1].find("eigenvalues/array/set")
-        for id_spin, eigen_spin in enumerate(eigenvalues_tag):
-            eigenvalues[id_spin] = {}
-            occupations[id_spin] = {}
-            for id_kpt, eigen_kpt in enumerate(eigen_spin):
-                # TODO: strip out the non-numeric values (*) for all kpoints instead of replacing them with last number.
-                kpt_data = [[float(x) for x in _.text.split()] for _ in eigen_kpt if "*" not in _.text]
-                kpt_data.extend([kpt_data[-1] for i in range(len(eigen_kpt) - len(kpt_data))])
-                # eigenvalues mayn't be sorted properly.
-                kpt_data = np.array(sorted(sorted(kpt_data, key=itemgetter(0)), key=itemgetter(1), reverse=True))
-                eigenvalues[id_spin][id_kpt] = kpt_data[:, 0]
-                occupations[id_spin][id_kpt] = kpt_data[:, 1]
-        return eigenvalues, occupations
+            tuple: eigenvalues and occupations arrays with indices in the following order: spin, kpoint, band.
+        """
+        data = np.array([self._parse_eigenvalues_set(eigen_spin) for eigen_spin in self.index["eigenvalues"]])
+        if not data.size:
+            return np.zeros((0, 0, 0)), np.zeros((0, 0, 0))
+        return data[..., 0], data[..., 1]
+
+    @staticmethod
+    def _parse_eigenvalues_set(eigen_spin):
+        """
+        Reads the eigenvalues and occupations of all kpoints of a spin channel at once and sorts the bands of each
+        kpoint by occupation (descending) and energy (ascending), as the eigenvalues may not be sorted properly.
+
+        Rows holding non-numeric values (*) are replaced by the last numeric row of the same kpoint.
+
+        Args:
+            eigen_spin (xml.etree.ElementTree.Element): set element of a spin channel.
+
+        Returns:
+            ndarray: (nk, nb, 2) array of the energies and occupations.
+        """
+        rows = [[row.text for row in eigen_kpt] for eigen_kpt in eigen_spin]
+        texts = [text for kpoint_rows in rows for text in kpoint_rows]
+        shape = (len(rows), len(rows[0]) if rows else 0)
+        is_valid = np.array(["*" not in text for text in texts], dtype=bool).reshape(shape)
+        # TODO: strip out the non-numeric values (*) for all kpoints instead of replacing them with last number.
+        data = decode_numbers(" ".join(text for text in texts if "*" not in text))
+        data = data.reshape((-1, len(data) // max(is_valid.sum(), 1)))
+        if not is_valid.all():
+            values = np.full((is_valid.size, data.shape[1]), np.nan)
+            values[is_valid.ravel()] = data
+            values = values.reshape(shape + (-1,))
+            last_valid = shape[1] - 1 - is_valid[:, ::-1].argmax(axis=1)
+            values[~is_valid] = values[np.arange(shape[0]), last_valid][np.nonzero(~is_valid)[0]]
+            data = values
+        data = data.reshape(shape + (-1,))
+        order = np.lexsort((data[..., 0], -data[..., 1]), axis=-1)
+        return np.take_along_axis(data, order[..., np.newaxis], axis=1)
 
     def fermi_energy(self):
         """
@@ -98,7 +158,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             float
         """
-        tag = self.root.findall("calculation")[-1].find("dos/i")
+        tag = self.index["dos"].find("i")
         return float(tag.text)
 
     def nspins(self):
@@ -108,7 +168,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
              int
         """
-        tag = self.root.find("parameters").find('.//separator[@name="electronic spin"]').find('.//i[@name="ISPIN"]')
+        tag = self.index["parameters"].find('.//separator[@name="electronic spin"]').find('.//i[@name="ISPIN"]')
         return int(tag.text)
 
     def dos(self, combined=True):
@@ -141,25 +201,11 @@ class VaspXMLParser(BaseXMLParser):
                 ]
             }
         """
-        total_dos, partial_dos_values, partial_dos_infos, electronic_states = self._extract_dos()
+        total_dos, partial_dos, electronic_states = self._extract_dos()
         if combined:
-            combined_pdos_values = []
-            combined_pdos_infos = []
-            for atom_type in set(self.atom_names()):
-                for elec_state in electronic_states:
-                    matched_pdos = []
-                    for pdos_idx, pdos_info_item in enumerate(partial_dos_infos):
-                        if pdos_info_item["electronicState"] == elec_state and atom_type == pdos_info_item["element"]:
-                            matched_pdos.append(partial_dos_values[pdos_idx])
-                    combined_pdos_values.append(np.sum(matched_pdos, axis=0).tolist())
-                    combined_pdos_infos.append(
-                        {
-                            "element": atom_type,
-                            "electronicState": elec_state,
-                            "spin": 0.5 if "up" in elec_state else -0.5,
-                        }
-                    )
-            partial_dos_values, partial_dos_infos = combined_pdos_values, combined_pdos_infos
+            partial_dos_values, partial_dos_infos = self._combine_partial_dos(partial_dos, electronic_states)
+        else:
+            partial_dos_values, partial_dos_infos = self._partial_dos_to_list(partial_dos, electronic_states)
 
         # TODO: extract and return total dos for all the spins
         return {
@@ -176,7 +222,10 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             list: list of atom names.
         """
-        return [atom.find("c").text.strip() for atom in self.root.find("atominfo/array/set").findall("rc")]
+        atom_names = self.index["atom_names"]
+        if atom_names is None:
+            raise ValueError("atominfo is not found in {0}".format(self.xml_path))
+        return list(atom_names)
 
     def _extract_total_dos(self, dos_root):
         total_dos = []
@@ -192,69 +241,117 @@ class VaspXMLParser(BaseXMLParser):
         Extracts density of states (total and partial) from xml output.
 
         Returns:
-            tuple: energy levels, total dos, partial dos and electronic states values
+            tuple: total dos, partial dos array and electronic states, see `_partial_dos`.
         """
-        dos_root = self.root.findall("calculation")[-1].find("dos")
+        dos_root = self.index["dos"]
         total_dos = self._extract_total_dos(dos_root)
-        partial_dos_values, partial_dos_infos, electronic_states = self._partial_dos(dos_root)
-        return total_dos, partial_dos_values, partial_dos_infos, electronic_states
+        partial_dos, electronic_states = self._partial_dos(dos_root)
+        return total_dos, partial_dos, electronic_states
 
     def _partial_dos(self, dos_root):
         """
-        Parses partial DOS for each element with its orbit value. DOS value for each atom with the same element and
-        orbit number will be added together and packed in a dictionary.
+        Parses partial DOS of all atoms at once.
 
         Args:
             dos_root (xml.etree.ElementTree.Element): dos root Element instance of ElementTree XML class.
 
         Returns:
-            dict: a dictionary containing partial DOS values for each element.
+            tuple: partial DOS array with indices in the following order: atom, spin, orbit, energy level, and the
+                electronic state names (e.g. 'p-up') of its spin and orbit indices.
+        """
+        partial_root = dos_root.find("partial/array/set")
+        if partial_root is None or not len(partial_root):
+            return np.zeros((0, 0, 0, 0)), []
+        orbit_symbols = [orbit.text.strip() for orbit in dos_root.find("partial/array").findall("field")[1:]]
+        num_spins = len(partial_root[0])
+        # extract partial dos only for the first spin in case of non-collinear calculation
+        if num_spins == 4 and not EXTRACT_PARTIAL_DOS_FOR_ALL_SPINS:
+            num_spins = 1
+        rows = [row.text for atom in partial_root for spin in atom[:num_spins] for row in spin.findall("r")]
+        values = decode_numbers(" ".join(rows)).reshape((len(partial_root), num_spins, -1, len(orbit_symbols) + 1))
+        # the first column holds energy levels
+        partial_dos = values[..., 1:].transpose((0, 1, 3, 2))
+
+        electronic_states = []
+        for spin_id in range(num_spins):
+            spin_states = []
+            for column_id in range(len(orbit_symbols)):
+                elec_state = orbit_symbols[column_id - 1]
+                if len(partial_root[0]) == 2:
+                    elec_state = "{0}-{1}".format(orbit_symbols[column_id], SPIN_MAP_COLLINEAR[spin_id + 1])
+                elif len(partial_root[0]) == 4:
+                    elec_state = "{0}-{1}".format(orbit_symbols[column_id], SPIN_MAP_NON_COLLINEAR[spin_id + 1])
+                # orbit_symbol is missed in VASP 5.4.4, hence the below
+                elec_state = "".join(("d", elec_state)) if "x2-y2" in elec_state else elec_state
+                spin_states.append(elec_state)
+            electronic_states.append(spin_states)
+        return partial_dos, electronic_states
+
+    def _partial_dos_to_list(self, partial_dos, electronic_states):
+        """
+        Returns partial DOS values and information for each atom, spin and orbit.
+
+        Args:
+            partial_dos (ndarray): partial DOS array, see `_partial_dos`.
+            electronic_states (list): electronic state names, see `_partial_dos`.
+
+        Returns:
+            tuple: partial DOS values and information lists.
                 Example:
+                    [[0.00015, 0.000187, 0.000232], [6.87e-06, 8.5e-06, 1.0e-05]],
                     [
-                        {
-                            'element': 'C',
-                            'electronicState': 's-down',
-                            'value': [0.00015, 0.000187, 0.000232, 0.000287, 0.000355, 0.000437]
-                        },
-                        {
-                            'element': 'Ti',
-                            'electronicState': 'p-up',
-                            'value': [6.87e-06, 8.5e-06, 1.0e-05, 1.3e-05, 1.63e-05, 2.01e-05]
-                        }
+                        {'element': 'C', 'index': 0, 'electronicState': 's-down', 'spin': -0.5},
+                        {'element': 'Ti', 'index': 1, 'electronicState': 'p-up', 'spin': 0.5}
                     ]
         """
-        # TODO: simplify the logic and break it down into multiple functions
-        partial_dos_values = []
-        partial_dos_infos = []
-        electronic_states = set()
-        if dos_root.find("partial") is not None:
-            orbit_symbols = [orbit.text.strip() for orbit in dos_root.find("partial/array").findall("field")[1:]]
-            partial_root = dos_root.find("partial/array/set")
-            for atom_id, atom in enumerate(partial_root):
-                for spin_id, spin in enumerate(atom):
-                    # extract partial dos only for the first spin in case of non-collinear calculation
-                    if spin_id > 0 and len(atom) == 4 and not EXTRACT_PARTIAL_DOS_FOR_ALL_SPINS:
-                        continue
-                    pdos_spin = np.array([[float(x) for x in pdos.text.split()[1:]] for pdos in spin.findall("r")])
-                    for column_id, column in enumerate(pdos_spin.T):
-                        elec_state = orbit_symbols[column_id - 1]
-                        if len(atom) == 2:
-                            elec_state = "{0}-{1}".format(orbit_symbols[column_id], SPIN_MAP_COLLINEAR[spin_id + 1])
-                        elif len(atom) == 4:
-                            elec_state = "{0}-{1}".format(orbit_symbols[column_id], SPIN_MAP_NON_COLLINEAR[spin_id + 1])
-                        # orbit_symbol is missed in VASP 5.4.4, hence the below
-                        elec_state = "".join(("d", elec_state)) if "x2-y2" in elec_state else elec_state
-                        electronic_states.add(elec_state)
-                        partial_dos_values.append(column.tolist())
-                        partial_dos_infos.append(
-                            {
-                                "element": self.atom_names()[atom_id],
-                                "index": atom_id,
-                                "electronicState": elec_state,
-                                "spin": 0.5 if spin_id == 0 else -0.5,
-                            }
-                        )
-        return partial_dos_values, partial_dos_infos, electronic_states
+        atom_names = self.atom_names() if len(partial_dos) else []
+        partial_dos_infos = [
+            {
+                "element": atom_names[atom_id],
+                "index": atom_id,
+                "electronicState": elec_state,
+                "spin": 0.5 if spin_id == 0 else -0.5,
+            }
+            for atom_id in range(len(partial_dos))
+            for spin_id, spin_states in enumerate(electronic_states)
+            for elec_state in spin_states
+        ]
+        return partial_dos.reshape((len(partial_dos_infos), -1)).tolist(), partial_dos_infos
+
+    def _combine_partial_dos(self, partial_dos, electronic_states):
+        """
+        Adds together partial DOS values of the atoms with the same element for each electronic state.
+
+        Args:
+            partial_dos (ndarray): partial DOS array, see `_partial_dos`.
+            electronic_states (list): electronic state names, see `_partial_dos`.
+
+        Returns:
+            tuple: partial DOS values and information lists for each element and electronic state.
+        """
+        if not len(partial_dos):
+            return [], []
+        atom_names = self.atom_names()[: len(partial_dos)]
+        states = [elec_state for spin_states in electronic_states for elec_state in spin_states]
+        # elements and states are combined in the order of their first appearance, hence deterministically
+        atom_types, unique_states = list(dict.fromkeys(atom_names)), list(dict.fromkeys(states))
+        atom_type_ids = np.array([atom_types.index(atom_name) for atom_name in atom_names])
+        state_ids = np.array([unique_states.index(elec_state) for elec_state in states])
+        group_ids = (atom_type_ids[:, np.newaxis] * len(unique_states) + state_ids).ravel()
+
+        num_levels = partial_dos.shape[-1]
+        combined_pdos = np.zeros((len(atom_types) * len(unique_states), num_levels))
+        np.add.at(combined_pdos, group_ids, partial_dos.reshape((-1, num_levels)))
+        combined_pdos_infos = [
+            {
+                "element": atom_type,
+                "electronicState": elec_state,
+                "spin": 0.5 if "up" in elec_state else -0.5,
+            }
+            for atom_type in atom_types
+            for elec_state in unique_states
+        ]
+        return combined_pdos.tolist(), combined_pdos_infos
 
     def final_lattice_vectors(self):
         """
@@ -275,7 +372,7 @@ class VaspXMLParser(BaseXMLParser):
         """
         vectors = {}
         for idx, vector in enumerate(
-            self._parse_varray(self.root.find('structure[@name="finalpos"]/crystal/varray[@name="basis"]'))
+            self._parse_varray(self.index["final_structure"].find('crystal/varray[@name="basis"]'))
         ):
             vectors.update({string.ascii_lowercase[idx]: vector.tolist()})
         vectors.update({"alat": 1.0, "units": "angstrom"})
@@ -287,7 +384,7 @@ class VaspXMLParser(BaseXMLParser):
         Extract basis.
 
         Returns:
-            dict
+            Basis
 
         Example:
             {
@@ -296,18 +393,13 @@ class VaspXMLParser(BaseXMLParser):
                 'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [1.11, 0.78, 1.93]}]
              }
         """
-        lattice = self.final_lattice_vectors()
-        lattice_matrix = np.array([lattice["vectors"][key] for key in ["a", "b", "c"]], dtype=np.float64).reshape(
-            (3, 3)
+        positions = self._parse_varray(self.index["final_structure"].find('varray[@name="positions"]'))
+        atom_names = self.atom_names()
+        return Basis(
+            [atom_names[idx] for idx in range(len(positions))],
+            convert_crystal_to_cartesian(positions, self.final_lattice_vectors()),
+            units="angstrom",
         )
-        elements, coordinates = [], []
-        for idx, vector in enumerate(
-            self._parse_varray(self.root.find('structure[@name="finalpos"]/varray[@name="positions"]'))
-        ):
-            elements.append({"id": idx, "value": self.atom_names()[idx]})
-            coordinates.append({"id": idx, "value": np.dot(vector, lattice_matrix).tolist()})
-
-        return {"units": "angstrom", "elements": elements, "coordinates": coordinates}
 
     def _parse_varray(self, varray):
         """
@@ -342,7 +434,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             list
         """
-        return self._parse_varray(self.root.findall("calculation")[-1].find('.//varray[@name="stress"]')).tolist()
+        return self._parse_varray(self.index["calculation"].find('.//varray[@name="stress"]')).tolist()
 
     def atomic_forces(self):
         """
@@ -351,4 +443,4 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             list
         """
-        return self._parse_varray(self.root.findall("calculation")[-1].find('.//varray[@name="forces"]')).tolist()
+        return self._parse_varray(self.index["calculation"].find('.//varray[@name="forces"]')).tolist()
@@ -1,8 +1,8 @@
 import os
-import numpy as np
 
 from express.parsers import BaseParser
 from express.parsers.apps.vasp import settings
+from express.parsers.basis import expand_bases
 from express.parsers.mixins.ionic import IonicDataMixin
 from express.parsers.apps.vasp.formats.txt import VaspTXTParser
 from express.parsers.apps.vasp.formats.xml import VaspXMLParser
@@ -24,6 +24,13 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         self.txt_parser = VaspTXTParser(self.work_dir)
         self.xml_parser = VaspXMLParser(find_file(settings.XML_DATA_FILE, self.work_dir))
 
+    def _get_watched_files(self):
+        """
+        Reference:
+            func: express.parsers.BaseParser._get_watched_files
+        """
+        return [self.stdout_file, self.xml_parser.xml_path, os.path.join(self.work_dir, "OUTCAR")]
+
     def _get_outcar_content(self):
         """
         Returns the content of OUTCAR file.
@@ -31,12 +38,16 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Returns:
             str
         """
-        outcar_content = ""
-        outcar_path = os.path.join(self.work_dir, "OUTCAR")
-        if os.path.exists(outcar_path):
-            with open(outcar_path) as f:
-                outcar_content = f.read()
-        return outcar_content
+        return self._get_file_content(os.path.join(self.work_dir, "OUTCAR"))
+
+    def _get_outcar_view(self):
+        """
+        Returns a read-only view of OUTCAR file.
+
+        Reference:
+            func: express.parsers.BaseParser._get_file_view
+        """
+        return self._get_file_view(os.path.join(self.work_dir, "OUTCAR"))
 
     def total_energy(self):
         """
@@ -45,7 +56,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.total_energy
         """
-        return self.txt_parser.total_energy(self._get_file_content(self.stdout_file))
+        return self.txt_parser.total_energy(self._get_file_view(self.stdout_file))
 
     def fermi_energy(self):
         """
@@ -85,7 +96,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.reciprocal.ReciprocalDataMixin.ibz_k_points
         """
-        return np.array([eigenvalueData["kpoint"] for eigenvalueData in self.eigenvalues_at_kpoints()])
+        return self.eigenvalues_at_kpoints().kpoints
 
     def dos(self):
         """
@@ -103,7 +114,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.final_basis
         """
-        return self.xml_parser.final_basis()
+        return self.xml_parser.final_basis().to_dict()
 
     def final_lattice_vectors(self):
         """
@@ -121,14 +132,13 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.convergence_electronic
         """
-        outcar = self._get_outcar_content()
-        stdout = self._get_file_content(self.stdout_file)
         try:
             atom_names = self.xml_parser.atom_names()
         except Exception:
             print("atom_names can not be extracted")
             atom_names = []
-        return self.txt_parser.convergence_electronic(outcar, stdout, atom_names)
+        with self._open_file(self.stdout_file) as stdout:
+            return self.txt_parser.convergence_electronic(None, stdout, atom_names)
 
     def convergence_ionic(self):
         """
@@ -137,9 +147,21 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.convergence_ionic
         """
-        outcar = self._get_outcar_content()
-        stdout = self._get_file_content(self.stdout_file)
-        return self.txt_parser.convergence_ionic(outcar, stdout, self.xml_parser.atom_names())
+        return list(self.iter_ionic_steps())
+
+    def iter_ionic_steps(self):
+        """
+        Yields convergence ionic steps one by one, streaming OUTCAR and stdout files instead of reading them into
+        memory.
+
+        Reference:
+            func: express.parsers.apps.vasp.formats.txt.VaspTXTParser.iter_ionic_steps
+        """
+        atom_names = self.xml_parser.atom_names()
+        outcar_file = os.path.join(self.work_dir, "OUTCAR")
+        with self._open_file(outcar_file) as outcar, self._open_file(self.stdout_file) as stdout:
+            for step in self.txt_parser.iter_ionic_steps(outcar, stdout, atom_names):
+                yield expand_bases(step)
 
     def stress_tensor(self):
         """
@@ -157,7 +179,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.pressure
         """
-        return self.txt_parser.pressure(self._get_outcar_content())
+        return self.txt_parser.pressure(self._get_outcar_view())
 
     def total_force(self):
         """
@@ -166,7 +188,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.total_force
         """
-        return self.txt_parser.total_force(self._get_outcar_content())
+        return self.txt_parser.total_force(self._get_outcar_view())
 
     def atomic_forces(self):
         """
@@ -184,7 +206,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.total_energy_contributions
         """
-        return self.txt_parser.total_energy_contributions(self._get_outcar_content())
+        return self.txt_parser.total_energy_contributions(self._get_outcar_view())
 
     def zero_point_energy(self):
         """
@@ -193,7 +215,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.zero_point_energy
         """
-        return self.txt_parser.zero_point_energy(self._get_outcar_content())
+        return self.txt_parser.zero_point_energy(self._get_outcar_view())
 
     def magnetic_moments(self):
         """
@@ -1,9 +1,15 @@
+from express.parsers.regex import REGEX_REGISTRY
 from express.parsers.settings import GENERAL_REGEX
 
 NEB_DIR_PREFIX = "0"
 NEB_STD_OUT_FILE = "stdout"
 XML_DATA_FILE = "vasprun.xml"
 
+# flags of the OUTCAR sections read line by line, see VaspTXTParser.iter_structures
+LATTICE_VECTORS_FLAG = "direct lattice vectors"
+ION_POSITIONS_FLAG = "POSITION"
+ION_POSITIONS_SEPARATOR = "-----"
+
 _COMMON_REGEX = r"{0}\s+({1})\s+({1})\s+({1})\s+({1})\s+({1})\s+({1})"
 
 REGEX = {
@@ -33,6 +39,11 @@ REGEX = {
             double=GENERAL_REGEX["double_number"]
         )
     },
+    "ion_forces": {
+        "regex": r"\s+{double}\s+{double}\s+{double}\s+({double})\s+({double})\s+({double})".format(
+            double=GENERAL_REGEX["double_number"]
+        )
+    },
     "pressure": {
         "regex": r"external pressure\s+=\s+({0})\s+kB".format(GENERAL_REGEX["double_number"]),
         "occurrences": -1,
@@ -71,3 +82,5 @@ TOTAL_ENERGY_CONTRIBUTIONS = {
         "match_groups": [1, 2, 3, 4, 5, 6],
     },
 }
+
+REGEX_REGISTRY.register("vasp", REGEX, TOTAL_ENERGY_CONTRIBUTIONS)
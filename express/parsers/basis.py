@@ -0,0 +1,129 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class Basis(Mapping):
+    """
+    Compact basis representation used internally by the format parsers, e.g. for the structures of every ionic step.
+    The public parser methods return its ESSE shape, see `to_dict`.
+
+    Element symbols are stored once and referenced by an integer index per atom, coordinates are kept as an Nx3 array
+    and atomic constraints, if any, as an Nx3 boolean array. This takes an order of magnitude less memory than the
+    ESSE shape made of a dict per atom, which adds up when every ionic step of a trajectory holds a basis.
+
+    The class is a read-only mapping with the keys of the ESSE basis, hence `basis["elements"]` and
+    `basis["coordinates"]` return the lists of objects with id and the basis compares equal to its dict counterpart.
+    The lists are built on access; use `to_dict` to expand the basis once, as done in
+    `express.properties.BaseProperty.serialize_and_validate`.
+
+    Args:
+        elements (list): element symbols of the atoms.
+        coordinates (array-like): Nx3 coordinates of the atoms.
+        units (str): units of the coordinates, e.g. crystal or angstrom.
+        constraints (array-like): optional Nx3 atomic constraints.
+    """
+
+    __slots__ = ("units", "symbols", "element_indices", "coordinates", "constraints")
+
+    def __init__(self, elements, coordinates, units="crystal", constraints=None):
+        indices = {}
+        self.element_indices = np.array([indices.setdefault(e, len(indices)) for e in elements], dtype=np.int32)
+        self.symbols = list(indices)
+        self.coordinates = np.array(coordinates, dtype=np.float64).reshape((-1, 3))
+        self.units = units
+        self.constraints = None if constraints is None else np.array(constraints, dtype=bool).reshape((-1, 3))
+        if len(self.element_indices) != len(self.coordinates):
+            raise ValueError(
+                f"Number of elements ({len(self.element_indices)}) does not match "
+                f"number of coordinates ({len(self.coordinates)})."
+            )
+
+    @classmethod
+    def from_dict(cls, basis):
+        """
+        Creates a basis from its ESSE shape. A `Basis` is returned as is.
+
+        Args:
+            basis (dict): basis with units, elements and coordinates.
+
+        Returns:
+            Basis
+        """
+        if isinstance(basis, Basis):
+            return basis
+        constraints = basis.get("constraints")
+        return cls(
+            [element["value"] for element in basis["elements"]],
+            [coordinate["value"] for coordinate in basis["coordinates"]],
+            units=basis.get("units", "crystal"),
+            constraints=None if constraints is None else [constraint["value"] for constraint in constraints],
+        )
+
+    @property
+    def elements(self):
+        """
+        Returns the element symbols of the atoms.
+
+        Returns:
+            list
+        """
+        return [self.symbols[index] for index in self.element_indices.tolist()]
+
+    def to_dict(self):
+        """
+        Expands the basis into its ESSE shape.
+
+        Returns:
+            dict
+
+        Example:
+            {
+                'units': 'crystal',
+                'elements': [{'id': 0, 'value': 'Si'}, {'id': 1, 'value': 'Si'}],
+                'coordinates': [{'id': 0, 'value': [0.0, 0.0, 0.0]}, {'id': 1, 'value': [0.25, 0.25, 0.25]}]
+             }
+        """
+        return {key: self[key] for key in self}
+
+    def __getitem__(self, key):
+        if key == "units":
+            return self.units
+        if key == "elements":
+            return [{"id": idx, "value": value} for idx, value in enumerate(self.elements)]
+        if key == "coordinates":
+            return [{"id": idx, "value": value} for idx, value in enumerate(self.coordinates.tolist())]
+        if key == "constraints" and self.constraints is not None:
+            return [{"id": idx, "value": value} for idx, value in enumerate(self.constraints.tolist())]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from ("units", "elements", "coordinates")
+        if self.constraints is not None:
+            yield "constraints"
+
+    def __len__(self):
+        return 3 if self.constraints is None else 4
+
+    def __repr__(self):
+        return f"Basis(units={self.units!r}, elements={self.elements!r}, coordinates={self.coordinates.tolist()!r})"
+
+
+def expand_bases(instance):
+    """
+    Returns a copy of the given instance with the nested `Basis` objects expanded into their ESSE shape.
+
+    Args:
+        instance (dict|list): serialized property.
+
+    Returns:
+        dict|list
+    """
+    if isinstance(instance, Basis):
+        return instance.to_dict()
+    if isinstance(instance, dict):
+        return {key: expand_bases(value) for key, value in instance.items()}
+    # lists of numbers, e.g. eigenvalues or densities of states, are returned as is instead of being copied
+    if isinstance(instance, list) and any(isinstance(value, (dict, list, Basis)) for value in instance):
+        return [expand_bases(value) for value in instance]
+    return instance
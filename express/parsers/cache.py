@@ -0,0 +1,434 @@
+import os
+import copy
+import mmap
+import inspect
+import functools
+from collections import OrderedDict
+from collections.abc import Iterator
+
+import numpy as np
+
+from express.parsers.basis import Basis
+from express.parsers.eigenvalues import EigenvalueSet
+from express.parsers.settings import FILE_CONTENT_CACHE_MAX_SIZE
+
+
+class FileContentCache(object):
+    """
+    Caches the content of files read by a parser, so that each file is read from disk only once.
+
+    Entries are keyed by the absolute file path and validated against the file modification time and size, hence a file
+    that changed on disk is read again. The least recently used entries are evicted once the total size of the cached
+    files exceeds the memory budget.
+
+    Args:
+        max_size (int): memory budget in bytes. Files larger than the budget are read, but not cached.
+    """
+
+    def __init__(self, max_size=FILE_CONTENT_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+
+    def get(self, file_path):
+        """
+        Returns the content of a given file, reading it from disk only if it is not cached or changed since last read.
+
+        Args:
+            file_path (str): file path.
+
+        Returns:
+             str
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            self._entries.move_to_end(key)
+            return entry[2]
+
+        self.invalidate(key)
+        with open(key) as f:
+            content = f.read()
+        if stat.st_size <= self.max_size:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, content)
+            self.size += stat.st_size
+            self._evict()
+        return content
+
+    def invalidate(self, file_path=None):
+        """
+        Drops a given file from the cache. All files are dropped if no file path is passed.
+
+        Args:
+            file_path (str): file path.
+        """
+        if file_path is None:
+            self._entries.clear()
+            self.size = 0
+            return
+        entry = self._entries.pop(os.path.abspath(file_path), None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def _evict(self):
+        """
+        Drops the least recently used entries until the cached content fits into the memory budget.
+        """
+        while self.size > self.max_size and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self.size -= entry[1]
+
+    def __contains__(self, file_path):
+        return os.path.abspath(file_path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class FileMapCache(object):
+    """
+    Keeps read-only memory maps of the files accessed by a parser, so that the file content is paged in by the OS on
+    demand instead of being copied into the process memory.
+
+    Maps are keyed by the absolute file path and re-created if the file modification time or size changes.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, file_path):
+        """
+        Returns a read-only memory map of a given file.
+
+        Note: empty files can not be memory-mapped, hence empty bytes are returned for them.
+
+        Args:
+            file_path (str): file path.
+
+        Returns:
+             mmap.mmap | bytes
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        self.invalidate(key)
+        if stat.st_size == 0:
+            return b""
+        with open(key, "rb") as f:
+            file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._entries[key] = (stat.st_mtime_ns, stat.st_size, file_map)
+        return file_map
+
+    def invalidate(self, file_path=None):
+        """
+        Closes the memory map of a given file. All maps are closed if no file path is passed.
+
+        Args:
+            file_path (str): file path.
+        """
+        keys = list(self._entries) if file_path is None else [os.path.abspath(file_path)]
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                entry[2].close()
+
+    def __contains__(self, file_path):
+        return os.path.abspath(file_path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# types of the values returned as is by copy_result
+IMMUTABLE_TYPES = frozenset(
+    (type(None), bool, int, float, complex, str, bytes, np.bool_, np.int32, np.int64, np.float32, np.float64)
+)
+
+# array-backed types copied by `copy_result` with read-only views of their arrays
+ARRAY_BACKED_TYPES = frozenset((Basis, EigenvalueSet))
+
+
+def memoized(method):
+    """
+    Marks a parser method to be memoized by ParserMethodCache. The mark is inherited by the implementations of the
+    method in subclasses, e.g. the methods of the parser mixins are memoized in all parsers implementing them.
+
+    Note: only the methods returning the same result for the same files should be marked, as opposed to the methods
+    with side effects, e.g. `close`, or following a running calculation, e.g. `convergence_ionic`.
+
+    Args:
+        method (callable): parser method.
+
+    Returns:
+         callable
+    """
+    method.is_memoized = True
+    return method
+
+
+def is_memoized(cls, name):
+    """
+    Returns whether a given method of a class or of any of its bases is marked with `memoized`.
+
+    Args:
+        cls (type): class.
+        name (str): method name.
+
+    Returns:
+         bool
+    """
+    return any(getattr(vars(base).get(name), "is_memoized", False) for base in cls.__mro__)
+
+
+class _FrozenList(tuple):
+    """
+    List stored by ParserMethodCache, turned back into a list by `copy_result`.
+    """
+
+
+class _FrozenScalarList(_FrozenList):
+    """
+    List of immutable values stored by ParserMethodCache, copied at once by `copy_result`.
+    """
+
+
+class _FrozenTuple(tuple):
+    """
+    Tuple of mutable values stored by ParserMethodCache, copied by `copy_result`.
+    """
+
+
+def freeze_result(result):
+    """
+    Returns the form of a result stored by ParserMethodCache: lists are stored as tuples, so that the lists of numbers,
+    e.g. eigenvalues, are only inspected once and `copy_result` only copies the containers.
+
+    Args:
+        result: result of a parser method.
+
+    Returns:
+        frozen result.
+    """
+    result_type = type(result)
+    if result_type is list:
+        if IMMUTABLE_TYPES.issuperset(map(type, result)):
+            return _FrozenScalarList(result)
+        return _FrozenList(freeze_result(item) for item in result)
+    if result_type is tuple and not IMMUTABLE_TYPES.issuperset(map(type, result)):
+        return _FrozenTuple(freeze_result(item) for item in result)
+    if result_type is dict:
+        return {key: freeze_result(value) for key, value in result.items()}
+    return result
+
+
+def copy_result(result):
+    """
+    Returns a copy of a frozen result (see `freeze_result`) that the caller can not use to modify the cached one. Only
+    the mutable containers are copied: arrays are returned as read-only views, including the arrays of the
+    array-backed types (see `ARRAY_BACKED_TYPES`), immutable values as is and other objects are deep-copied.
+
+    Args:
+        result: frozen result.
+
+    Returns:
+        copy of the result.
+    """
+    result_type = type(result)
+    if result_type in IMMUTABLE_TYPES or result_type is tuple or isinstance(result, np.generic):
+        return result
+    if result_type is _FrozenScalarList:
+        return list(result)
+    if result_type is _FrozenList:
+        return [copy_result(item) for item in result]
+    if result_type is _FrozenTuple:
+        return tuple(copy_result(item) for item in result)
+    if result_type is dict:
+        return {key: copy_result(value) for key, value in result.items()}
+    if result_type is np.ndarray:
+        view = result.view()
+        view.flags.writeable = False
+        return view
+    if result_type in ARRAY_BACKED_TYPES:
+        return _copy_array_backed(result)
+    return copy.deepcopy(result)
+
+
+def _copy_array_backed(result):
+    """
+    Returns a copy of an array-backed object sharing read-only views of its arrays, e.g. the coordinates of a basis,
+    instead of copying them. Lists, e.g. the element symbols, are copied.
+
+    Args:
+        result (Basis|EigenvalueSet): array-backed object.
+
+    Returns:
+        Basis|EigenvalueSet
+    """
+    result_copy = object.__new__(type(result))
+    for name in type(result).__slots__:
+        value = getattr(result, name)
+        setattr(result_copy, name, list(value) if type(value) is list else copy_result(value))
+    return result_copy
+
+
+class ParserMethodCache(object):
+    """
+    Memoizes the parser methods marked with `memoized`: each method is executed once per arguments and its result is
+    returned on subsequent calls, including the calls made by the parser itself, e.g. `ibz_k_points` calling
+    `eigenvalues_at_kpoints`. Methods are wrapped on the parser instance, hence the parser class is unchanged for the
+    callers.
+
+    The cache is either used as a context manager, e.g. by `ExPrESS.properties`, or installed for the lifetime of the
+    parser with the `memoize` parser kwarg. Results are dropped when one of the watched files (e.g. the standard output
+    file) is created, removed or modified. Callers receive copies of the results, see `freeze_result` and
+    `copy_result`.
+
+    Note: generators and calls with unhashable arguments are not cached.
+
+    Args:
+        parser (express.parsers.BaseParser): parser instance.
+        watched_paths (list|callable): paths of the files the results depend on, or a function returning them, called
+            before each check as the paths may only be known once the parser is initialized.
+    """
+
+    def __init__(self, parser, watched_paths=()):
+        self.parser = parser
+        self._watched_paths = watched_paths
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._method_names = []
+        self._fingerprint = None
+        self._depth = 0
+
+    def install(self):
+        """
+        Wraps the memoized methods of the parser. Methods already wrapped, e.g. by another cache, are left as is.
+
+        Returns:
+            ParserMethodCache
+        """
+        if self.parser is None:
+            return self
+        parser_class = type(self.parser)
+        for name in dir(parser_class):
+            method = getattr(parser_class, name)
+            if name in vars(self.parser) or not inspect.isfunction(method) or not is_memoized(parser_class, name):
+                continue
+            if inspect.isgeneratorfunction(method):
+                continue
+            setattr(self.parser, name, self._memoize(name, getattr(self.parser, name)))
+            self._method_names.append(name)
+        return self
+
+    def uninstall(self):
+        """
+        Restores the methods of the parser and drops the results.
+        """
+        for name in self._method_names:
+            delattr(self.parser, name)
+        self._method_names = []
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drops the results.
+        """
+        self._results.clear()
+        self._fingerprint = None
+
+    def stats(self):
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: numbers of hits, misses and cached results.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._results)}
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    @property
+    def watched_paths(self):
+        watched_paths = self._watched_paths() if callable(self._watched_paths) else self._watched_paths
+        return [path for path in watched_paths if path]
+
+    def _get_fingerprint(self, watched_paths):
+        """
+        Returns the modification times and sizes of given files, None for the missing ones.
+
+        Args:
+            watched_paths (list): file paths.
+
+        Returns:
+            list
+        """
+        fingerprint = []
+        for path in watched_paths:
+            try:
+                stat = os.stat(path)
+                fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                # files are created and removed by running calculations
+                fingerprint.append((path, None))
+        return fingerprint
+
+    def _check_watched_paths(self):
+        """
+        Drops the results if the watched files changed since the last check.
+        """
+        watched_paths = self.watched_paths
+        if not watched_paths:
+            return
+        fingerprint = self._get_fingerprint(watched_paths)
+        if fingerprint != self._fingerprint:
+            self._results.clear()
+            self._fingerprint = fingerprint
+
+    def _memoize(self, name, method):
+        """
+        Returns a wrapper of a given bound method storing its results.
+
+        Args:
+            name (str): method name.
+            method (callable): bound method.
+
+        Returns:
+             callable
+        """
+
+        @functools.wraps(method)
+        def memoized_method(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(*args, **kwargs)
+            # the files are checked once per call, not for the nested calls of the parser to itself
+            if self._depth == 0:
+                self._check_watched_paths()
+            self._depth += 1
+            try:
+                if key in self._results:
+                    self.hits += 1
+                    result = self._results[key]
+                else:
+                    self.misses += 1
+                    result = method(*args, **kwargs)
+                    if isinstance(result, Iterator):
+                        return result
+                    result = freeze_result(result)
+                    self._results[key] = result
+            finally:
+                self._depth -= 1
+            return copy_result(result)
+
+        return memoized_method
@@ -0,0 +1,156 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+SPIN_VALUES = [0.5, -0.5]
+
+
+class EigenvalueSet(Sequence):
+    """
+    Eigenvalues at kpoints stored as contiguous arrays:
+        - energies[s, k, b]: energies of band b at kpoint k for spin channel s.
+        - occupations[s, k, b]: occupations of the same, or None if they are not available.
+        - kpoints[k, 3]: kpoint coordinates.
+        - weights[k]: kpoint weights.
+
+    The class is a read-only sequence of the per-kpoint objects returned by
+    `express.parsers.mixins.electronic.ElectronicDataMixin.eigenvalues_at_kpoints`, which are built on access.
+    Use `to_list` to build all of them at once.
+
+    Args:
+        kpoints (array-like): kpoint coordinates.
+        weights (array-like): kpoint weights.
+        energies (array-like): energies with indices in the following order: spin, kpoint, band.
+        occupations (array-like): occupations in the same order as energies.
+        spins (list): spin values of the spin channels, 0.5 (and -0.5) by default.
+    """
+
+    __slots__ = ("kpoints", "weights", "energies", "occupations", "spins")
+
+    def __init__(self, kpoints, weights, energies, occupations=None, spins=None):
+        self.kpoints = np.array(kpoints, dtype=np.float64).reshape((-1, 3))
+        self.weights = np.array(weights, dtype=np.float64).reshape(-1)
+        self.energies = np.array(energies, dtype=np.float64)
+        self.occupations = None if occupations is None else np.array(occupations, dtype=np.float64)
+        self.spins = list(spins) if spins is not None else SPIN_VALUES[: len(self.energies)]
+
+    @classmethod
+    def from_list(cls, eigenvalues_at_kpoints):
+        """
+        Creates an eigenvalue set from the per-kpoint objects. An `EigenvalueSet` is returned as is.
+
+        Args:
+            eigenvalues_at_kpoints (list): eigenvalues for all kpoints.
+
+        Returns:
+            EigenvalueSet
+        """
+        if isinstance(eigenvalues_at_kpoints, EigenvalueSet):
+            return eigenvalues_at_kpoints
+        if not eigenvalues_at_kpoints:
+            return cls(np.zeros((0, 3)), [], np.zeros((1, 0, 0)))
+        spins = [eigenvalue["spin"] for eigenvalue in eigenvalues_at_kpoints[0]["eigenvalues"]]
+
+        def to_array(key):
+            return np.array(
+                [
+                    [eigenvalue[key] for eigenvalue in eigenvalues_at_kpoint["eigenvalues"]]
+                    for eigenvalues_at_kpoint in eigenvalues_at_kpoints
+                ],
+                dtype=np.float64,
+            ).transpose((1, 0, 2))
+
+        has_occupations = all(
+            len(eigenvalue["occupations"])
+            for eigenvalues_at_kpoint in eigenvalues_at_kpoints
+            for eigenvalue in eigenvalues_at_kpoint["eigenvalues"]
+        )
+        return cls(
+            [eigenvalues_at_kpoint["kpoint"] for eigenvalues_at_kpoint in eigenvalues_at_kpoints],
+            [eigenvalues_at_kpoint["weight"] for eigenvalues_at_kpoint in eigenvalues_at_kpoints],
+            to_array("energies"),
+            to_array("occupations") if has_occupations else None,
+            spins=spins,
+        )
+
+    def spin_energies(self, nspins):
+        """
+        Returns the energies of the first `nspins` spin channels ordered by spin index (0 -> 1/2, 1 -> -1/2).
+
+        Args:
+            nspins (int): number of spin channels.
+
+        Returns:
+            ndarray
+        """
+        return self.energies[[self.spins.index(spin) for spin in SPIN_VALUES[:nspins]]]
+
+    def select(self, kpoint_mask):
+        """
+        Returns the eigenvalue set for a subset of kpoints.
+
+        Args:
+            kpoint_mask (ndarray): boolean mask or indices of the kpoints to keep.
+
+        Returns:
+            EigenvalueSet
+        """
+        return EigenvalueSet(
+            self.kpoints[kpoint_mask],
+            self.weights[kpoint_mask],
+            self.energies[:, kpoint_mask],
+            None if self.occupations is None else self.occupations[:, kpoint_mask],
+            spins=self.spins,
+        )
+
+    def to_list(self):
+        """
+        Returns the eigenvalues for all kpoints as a list of objects.
+
+        Returns:
+            list
+        """
+        return self._to_list(slice(None))
+
+    def _to_list(self, kpoint_slice):
+        kpoints = self.kpoints[kpoint_slice].tolist()
+        weights = self.weights[kpoint_slice].tolist()
+        energies = self.energies[:, kpoint_slice].tolist()
+        occupations = None if self.occupations is None else self.occupations[:, kpoint_slice].tolist()
+        return [
+            {
+                "kpoint": kpoint,
+                "weight": weight,
+                "eigenvalues": [
+                    {
+                        "energies": energies[spin_index][kpoint_index],
+                        "occupations": [] if occupations is None else occupations[spin_index][kpoint_index],
+                        "spin": spin,
+                    }
+                    for spin_index, spin in enumerate(self.spins)
+                ],
+            }
+            for kpoint_index, (kpoint, weight) in enumerate(zip(kpoints, weights))
+        ]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._to_list(index)
+        kpoint_index = range(len(self))[index]
+        return self._to_list(slice(kpoint_index, kpoint_index + 1))[0]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __len__(self):
+        return len(self.kpoints)
+
+    def __eq__(self, other):
+        if isinstance(other, EigenvalueSet):
+            other = other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"EigenvalueSet(nspins={len(self.spins)}, nkpoints={len(self)}, nbands={self.energies.shape[-1]})"
@@ -1,6 +1,11 @@
+import io
 import builtins
 import re
 
+from express.parsers.regex import compile_regex
+
+GENERAL_OUTPUT_PARSER_FLAGS = re.I | re.MULTILINE
+
 
 class BaseTXTParser(object):
     """
@@ -12,6 +17,20 @@ class BaseTXTParser(object):
     def __init__(self, work_dir):
         self.work_dir = work_dir
 
+    @staticmethod
+    def _iter_lines(text):
+        """
+        Iterates over the lines of a text or of an iterable of lines, e.g. an open file, which is then not read into
+        memory at once.
+
+        Args:
+            text (str|iterable): text or an iterable of lines.
+
+        Returns:
+            iterator
+        """
+        return io.StringIO(text) if isinstance(text, str) else iter(text)
+
     def _general_output_parser(
         self, text, regex, output_type, start_flag=None, end_flag=None, occurrences=0, match_groups=[]
     ):
@@ -19,8 +38,11 @@ class BaseTXTParser(object):
         General function for extracting data from a text output. It extracts basic values using regex patterns. Based
         on the input regex pattern, this function uses re.findall method to find every instance of the pattern inside
         the text.
+        Note: text can also be a bytes-like object (e.g. a memory-mapped file), in which case the pattern is applied to
+        it in place, without copying the file content into memory.
+
         Args:
-            text (str): text to search
+            text (str|bytes|mmap.mmap): text to search
             regex (str): regex pattern.
             output_type (str): output type.
             start_flag (str): a symbol in the output file to be used as the starting point (for speedup and accuracy).
@@ -33,14 +55,20 @@ class BaseTXTParser(object):
         Return:
             any
         """
+        is_binary = not isinstance(text, str)
+        if is_binary:
+            regex, start_flag, end_flag = [_.encode() if _ else _ for _ in (regex, start_flag, end_flag)]
         start_index = text.rfind(start_flag) if start_flag else 0
         end_index = text.rfind(end_flag) if end_flag else len(text)
-        pattern = re.compile(regex, re.I | re.MULTILINE)
-        cast = getattr(builtins, output_type)
+        # keep the slicing semantics of text[start_index:end_index] when a flag is not found
+        start_index, end_index = [len(text) + i if i < 0 else i for i in (start_index, end_index)]
+        pattern = compile_regex(regex, GENERAL_OUTPUT_PARSER_FLAGS)
+        builtin_cast = getattr(builtins, output_type)
+        cast = (lambda v: builtin_cast(v.decode())) if is_binary else builtin_cast
+        # searching within [start_index, end_index) avoids copying the text slice
+        match = pattern.findall(text, start_index, end_index)
         # output type depends on the number of values required. List or single number.
         result = [] if len(match_groups) > 1 or abs(occurrences) > 1 or occurrences == 0 else None
-
-        match = pattern.findall(text[start_index:end_index])
         if match:
             occurrences = len(match) if occurrences == 0 else occurrences
             match = match[occurrences:] if occurrences < 0 else match[:occurrences]
@@ -1,20 +1,108 @@
 import os
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
+FORTRAN_EXPONENT_TRANSLATION = str.maketrans("Dd", "Ee")
+
+
+def decode_numbers(text, dtype=np.float64):
+    """
+    Decodes whitespace-separated numbers, e.g. the text of a numeric XML tag, into a 1D array. Fortran double precision
+    exponents (1.0D-01) are converted to the regular ones.
+
+    Args:
+        text (str): text to decode.
+        dtype (type): array type.
+
+    Returns:
+        ndarray
+    """
+    try:
+        return np.array(text.split(), dtype=dtype)
+    except ValueError:
+        return np.array(text.translate(FORTRAN_EXPONENT_TRANSLATION).split(), dtype=dtype)
+
 
 class BaseXMLParser(object):
     """
     Base XML parser class.
+
+    The XML file is parsed on the first access to `root`, hence parsers that are never queried do not read the file.
     """
 
     def __init__(self, xml_file_path):
         self.xml_path = xml_file_path
-        self.root = None
+        self._root = None
+        self._is_root_loaded = False
         self.xml_dir_name = None
         if self.xml_path and os.path.exists(self.xml_path):
-            try:
-                self.xml_dir_name = os.path.dirname(self.xml_path)
-                self.root = ET.parse(self.xml_path).getroot()
-            except ET.ParseError:
-                # safely ignore broken xml file
-                pass
+            self.xml_dir_name = os.path.dirname(self.xml_path)
+
+    @property
+    def root(self):
+        if not self._is_root_loaded:
+            self._is_root_loaded = True
+            if self.xml_dir_name is not None:
+                try:
+                    root = self._parse_root()
+                    self._root = self._transform_root(root) if root is not None else None
+                except ET.ParseError:
+                    # safely ignore broken xml file
+                    pass
+        return self._root
+
+    @root.setter
+    def root(self, root):
+        self._root = root
+        self._is_root_loaded = True
+
+    def _parse_root(self):
+        """
+        Parses the XML file and returns its root element. Override to parse the file differently, e.g. with
+        `_iterparse_root`.
+
+        Returns:
+            xml.etree.ElementTree.Element
+        """
+        return ET.parse(self.xml_path).getroot()
+
+    def _transform_root(self, root):
+        """
+        Returns the element used as the root by the parser, e.g. a child of the document root.
+
+        Args:
+            root (xml.etree.ElementTree.Element): document root.
+
+        Returns:
+            xml.etree.ElementTree.Element
+        """
+        return root
+
+    def _iterparse_root(self, keep_last=()):
+        """
+        Parses the XML file incrementally and keeps only the last of the repeated children of the document root with
+        the given tags. The previous ones are removed from the tree as soon as the next one is parsed, hence the memory
+        needed does not grow with their number, e.g. with the number of ionic steps in vasprun.xml.
+
+        Args:
+            keep_last (tuple): tags of the children of the document root to keep the last occurrence of.
+
+        Returns:
+            xml.etree.ElementTree.Element
+        """
+        root, depth, last_elements = None, 0, {}
+        with open(self.xml_path, "rb") as f:
+            for event, element in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = element
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 1 and element.tag in keep_last:
+                    previous_element = last_elements.get(element.tag)
+                    if previous_element is not None:
+                        root.remove(previous_element)
+                    last_elements[element.tag] = element
+        return root
@@ -1,8 +1,9 @@
 import numpy as np
-from pymatgen.core.structure import Structure
 
 from abc import abstractmethod
 
+from express.parsers.cache import memoized
+
 
 class ElectronicDataMixin(object):
     """
@@ -13,6 +14,7 @@ class ElectronicDataMixin(object):
     """
 
     @abstractmethod
+    @memoized
     def total_energy(self):
         """
         Returns total energy.
@@ -28,6 +30,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def fermi_energy(self):
         """
         Returns fermi energy.
@@ -43,6 +46,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def nspins(self):
         """
         Returns the number of spins.
@@ -56,6 +60,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def eigenvalues_at_kpoints(self):
         """
         Returns eigenvalues for all kpoints.
@@ -86,6 +91,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def dos(self):
         """
         Returns density of states.
@@ -160,6 +166,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def total_energy_contributions(self):
         """
         Extracts total energy contributions.
@@ -202,6 +209,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def reaction_energies(self):
         """
         Returns reaction energies.
@@ -225,6 +233,7 @@ class ElectronicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def reaction_coordinates(self):
         """
         Returns reaction coordinates.
@@ -257,6 +266,9 @@ class ElectronicDataMixin(object):
         Returns:
              list
         """
+        # pymatgen is imported on use to keep it out of the import of the parsers
+        from pymatgen.core.structure import Structure
+
         structures = [Structure.from_str(poscar, "poscar") for poscar in poscars]
         prev = structures[0]
         reaction_coordinates = [0]
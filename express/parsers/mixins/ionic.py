@@ -1,5 +1,7 @@
 from abc import abstractmethod
 
+from express.parsers.cache import memoized
+
 
 class IonicDataMixin(object):
     """
@@ -10,6 +12,7 @@ class IonicDataMixin(object):
     """
 
     @abstractmethod
+    @memoized
     def initial_lattice_vectors(self):
         """
         Returns initial lattice vectors.
@@ -30,6 +33,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def initial_basis(self):
         """
         Returns initial basis.
@@ -49,6 +53,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def final_lattice_vectors(self):
         """
         Returns final lattice vectors.
@@ -69,6 +74,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def final_basis(self):
         """
         Returns final basis.
@@ -172,6 +178,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def stress_tensor(self):
         """
         Returns stress tensor.
@@ -203,6 +210,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def pressure(self):
         """
         Returns pressure.
@@ -218,6 +226,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def total_force(self):
         """
         Returns total force.
@@ -233,6 +242,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def atomic_forces(self):
         """
         Returns forces that is exerted on each atom by its surroundings.
@@ -259,6 +269,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def atomic_constraints(self):
         """
         Returns atomic constraints.
@@ -283,6 +294,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def space_group_symbol(self):
         """
         Returns space group symbol.
@@ -299,6 +311,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def formula(self):
         """
         Returns formula.
@@ -312,6 +325,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def reduced_formula(self):
         """
         Returns reduced formula.
@@ -325,6 +339,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def volume(self):
         """
         Returns volume.
@@ -340,6 +355,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def elemental_ratios(self):
         """
         Returns elemental ratio.
@@ -356,6 +372,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def density(self):
         """
         Returns density.
@@ -371,6 +388,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def zero_point_energy(self):
         """
         Returns zero point energy.
@@ -386,6 +404,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def phonon_dos(self):
         """
         Returns phonon dos.
@@ -402,6 +421,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def phonon_dispersions(self):
         """
         Returns phonon dispersions.
@@ -419,6 +439,7 @@ class IonicDataMixin(object):
         pass
 
     @abstractmethod
+    @memoized
     def magnetic_moments(self):
         """
         Returns magnetic moments.
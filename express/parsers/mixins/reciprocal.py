@@ -1,5 +1,7 @@
 from abc import abstractmethod
 
+from express.parsers.cache import memoized
+
 
 class ReciprocalDataMixin(object):
     """
@@ -10,6 +12,7 @@ class ReciprocalDataMixin(object):
     """
 
     @abstractmethod
+    @memoized
     def ibz_k_points(self):
         """
         Returns ibz_k_points.
@@ -0,0 +1,81 @@
+import re
+from functools import lru_cache
+
+# number of compiled patterns kept, as for the cache of the `re` module. Patterns built from the input, e.g. by the
+# regex factories, are compiled again once evicted instead of accumulating in long-lived processes.
+COMPILED_REGEX_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=COMPILED_REGEX_CACHE_SIZE)
+def compile_regex(regex, flags=0):
+    """
+    Compiles a given regex pattern once and returns the cached compiled pattern on subsequent calls. The least recently
+    used patterns are dropped once COMPILED_REGEX_CACHE_SIZE patterns are cached.
+
+    Args:
+        regex (str|bytes): regex pattern.
+        flags (int): regex flags.
+
+    Returns:
+         re.Pattern
+    """
+    return re.compile(regex, flags)
+
+
+class RegexRegistry(object):
+    """
+    Registry of the regex patterns defined in the parsers settings, e.g. `express.parsers.apps.espresso.settings.REGEX`.
+    Patterns are looked up by application (namespace) and name and compiled once on first use.
+
+    Note: factory entries (callables producing the regex settings) are not registered as they depend on the input.
+    """
+
+    def __init__(self):
+        self._tables = {}
+
+    def register(self, namespace, *tables):
+        """
+        Registers regex tables under a given namespace.
+
+        Args:
+            namespace (str): namespace, e.g. application name.
+            tables (dict): mapping of name to either a regex string or a settings dict containing the "regex" key.
+        """
+        registered = self._tables.setdefault(namespace, {})
+        for table in tables:
+            for name, entry in table.items():
+                if isinstance(entry, dict) and "regex" in entry:
+                    registered[name] = entry["regex"]
+                elif isinstance(entry, str):
+                    registered[name] = entry
+
+    def get(self, namespace, name, flags=0):
+        """
+        Returns the compiled pattern for a given name.
+
+        Args:
+            namespace (str): namespace, e.g. application name.
+            name (str): regex name, e.g. total_energy.
+            flags (int): regex flags.
+
+        Returns:
+             re.Pattern
+        """
+        return compile_regex(self._tables[namespace][name], flags)
+
+    def compile_all(self, flags=0):
+        """
+        Compiles all registered patterns upfront, e.g. to warm up long-running processes.
+
+        Args:
+            flags (int): regex flags.
+        """
+        for namespace, table in self._tables.items():
+            for name in table:
+                self.get(namespace, name, flags)
+
+    def names(self, namespace):
+        return list(self._tables.get(namespace, {}))
+
+
+REGEX_REGISTRY = RegexRegistry()
@@ -1,5 +1,7 @@
 from math import pi
 
+from express.parsers.regex import REGEX_REGISTRY
+
 
 class Constant(object):
     """
@@ -30,6 +32,9 @@ class Constant(object):
     ry_bohr_to_eV_A = 25.71104309541616  # or RYDBERG / BOHR
 
 
+# Memory budget (in bytes) for the content of files cached by a parser instance.
+FILE_CONTENT_CACHE_MAX_SIZE = 4 * 1024**3
+
 GENERAL_REGEX = {"double_number": r"[-+]?\d*\.\d+(?:[eE][-+]?\d+)?", "int_number": r"[+-]?\d+"}
 
 # Maps the format keywords used in this code to their corresponding ase keywords.
@@ -39,3 +44,5 @@ ATOMIC_REGEX = {
     "orbitalName": r"[1-9][sSpPdDfF]",
     "atomicSpecies": r"[a-zA-Z]{1,2}[\d+]?",
 }
+
+REGEX_REGISTRY.register("general", GENERAL_REGEX, ATOMIC_REGEX)
@@ -8,6 +8,7 @@ from jarvis.core.atoms import Atoms
 from jarvis.io.vasp.inputs import Poscar
 
 from express.parsers import BaseParser
+from express.parsers.basis import Basis
 from express.parsers.mixins.ionic import IonicDataMixin
 
 STRUCTURE_MAP = {
@@ -175,7 +176,7 @@ class StructureParser(BaseParser, IonicDataMixin):
         """
         elements = []
         coordinates = []
-        for i, site in enumerate(self.structure.sites):
+        for site in self.structure.sites:
             if not site.is_ordered:
                 raise ValueError(
                    f"Disordered site at {site.frac_coords.tolist()} with "
@@ -183,12 +184,9 @@ class StructureParser(BaseParser, IonicDataMixin):
                 )
 
             # Use specie.symbol to strip oxidation state (e.g. "Li0+" → "Li", "O2-" → "O")
-            elements.append({"id": i, "value": site.specie.symbol})
-            coordinates.append({
-                "id": i,
-                "value": self._round(site.frac_coords.tolist(), PRECISION_MAP["coordinates_crystal"])
-            })
-        return {"units": "crystal", "elements": elements, "coordinates": coordinates}
+            elements.append(site.specie.symbol)
+            coordinates.append(self._round(site.frac_coords.tolist(), PRECISION_MAP["coordinates_crystal"]))
+        return Basis(elements, coordinates, units="crystal").to_dict()
 
     def space_group_symbol(self):
         """
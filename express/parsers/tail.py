@@ -0,0 +1,54 @@
+import os
+
+
+class FileTail(object):
+    """
+    Follows a file that is being appended to, e.g. the standard output of a running job, and returns only the lines
+    appended since the previous read.
+
+    The byte offset of the first line not read yet is kept between the reads. A trailing line that is not terminated
+    yet is left to the next read, so that the returned text always ends at a line boundary.
+
+    Args:
+        file_path (str): file path.
+        encoding (str): file encoding.
+    """
+
+    def __init__(self, file_path, encoding="utf-8"):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.offset = 0
+        self._inode = None
+
+    def read(self):
+        """
+        Returns the complete lines appended to the file since the previous read.
+
+        The file is read from the beginning again if it was truncated or replaced since the previous read, which is
+        reported by the second returned value, so that the state built from the previous reads can be discarded.
+
+        Returns:
+            tuple: text of the new lines and whether the file was read from the beginning again.
+        """
+        if not os.path.exists(self.file_path):
+            return "", False
+
+        with open(self.file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            is_reset = self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self.offset)
+            if is_reset:
+                self.offset = 0
+            self._inode = stat.st_ino
+            f.seek(self.offset)
+            data = f.read()
+
+        data = data[: data.rfind(b"\n") + 1]
+        self.offset += len(data)
+        return data.decode(self.encoding, errors="replace"), is_reset
+
+    def reset(self):
+        """
+        Makes the next read start from the beginning of the file.
+        """
+        self.offset = 0
+        self._inode = None
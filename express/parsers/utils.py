@@ -3,6 +3,10 @@ import re
 from typing import Optional, List
 from pathlib import Path
 
+import numpy as np
+
+from express.parsers.basis import Basis
+
 
 def find_file(name: str, path: str) -> Optional[str]:
     """
@@ -48,7 +52,7 @@ def find_files_by_regex(regex: str, path: Path) -> List[Path]:
     return matches
 
 
-def get_element_counts(basis: dict) -> List[dict]:
+def get_element_counts(basis) -> List[dict]:
     """
     Returns chemical elements with their count wrt their original order in the basis.
     Note: entries for the same element separated by another element are considered separately.
@@ -56,16 +60,59 @@ def get_element_counts(basis: dict) -> List[dict]:
     """
     element_counts = []
     previous_element = None
-    for index, element in enumerate(basis["elements"]):
-        if previous_element and previous_element["value"] == element["value"]:
+    for element in Basis.from_dict(basis).elements:
+        if previous_element == element:
             element_counts[-1]["count"] += 1
         else:
-            element_counts.append({"count": 1, "value": element["value"]})
-        previous_element = basis["elements"][index]
+            element_counts.append({"count": 1, "value": element})
+        previous_element = element
     return element_counts
 
 
-def lattice_basis_to_poscar(lattice: dict, basis: dict, basis_units: str = "cartesian") -> str:
+def lattice_to_matrix(lattice: dict) -> np.ndarray:
+    """
+    Returns the lattice vectors as rows of a 3x3 matrix.
+    """
+    return np.array([lattice["vectors"][key] for key in ["a", "b", "c"]], dtype=np.float64).reshape((3, 3))
+
+
+def convert_crystal_to_cartesian(coordinates, lattice: dict) -> np.ndarray:
+    """
+    Converts coordinates in crystal units to the units of the lattice vectors with a single matrix product.
+
+    Args:
+        coordinates (array-like): Nx3 coordinates in crystal units.
+        lattice (dict): lattice.
+
+    Returns:
+        ndarray: Nx3 coordinates.
+    """
+    return np.asarray(coordinates, dtype=np.float64).reshape((-1, 3)) @ lattice_to_matrix(lattice)
+
+
+def convert_basis_to_cartesian(basis, lattice: dict):
+    """
+    Converts the coordinates of a basis in crystal units to the units of the lattice vectors in place.
+
+    Args:
+        basis (Basis|dict): basis in crystal units.
+        lattice (dict): lattice.
+
+    Returns:
+        Basis|dict: the basis.
+    """
+    if isinstance(basis, Basis):
+        basis.coordinates = convert_crystal_to_cartesian(basis.coordinates, lattice)
+        return basis
+    crystal_coordinates = [coordinate["value"] for coordinate in basis["coordinates"]]
+    cartesian_coordinates = convert_crystal_to_cartesian(crystal_coordinates, lattice).tolist()
+    for coordinate, value in zip(basis["coordinates"], cartesian_coordinates):
+        coordinate["value"] = value
+    return basis
+
+
+def lattice_basis_to_poscar(lattice: dict, basis, basis_units: str = "cartesian") -> str:
+    basis = Basis.from_dict(basis)
     element_counts = get_element_counts(basis)
     return "\n".join(
         [
@@ -77,6 +124,6 @@ def lattice_basis_to_poscar(lattice: dict, basis: dict, basis_units: str = "cart
             " ".join((e["value"] for e in element_counts)),
             " ".join((str(e["count"]) for e in element_counts)),
             basis_units,
-            "\n".join([" ".join(["{0:14.9f}".format(v) for v in x["value"]]) for x in basis["coordinates"]]),
+            "\n".join([" ".join(["{0:14.9f}".format(v) for v in x]) for x in basis.coordinates.tolist()]),
         ]
     )
@@ -1,7 +1,8 @@
-from mat3ra.esse import ESSE
 from abc import abstractmethod
 
 from express.mixins import RoundNumericValuesMixin
+from express.parsers.basis import expand_bases
+from express.properties.schemas import SCHEMA_REGISTRY
 
 
 class BaseProperty(RoundNumericValuesMixin):
@@ -18,8 +19,8 @@ class BaseProperty(RoundNumericValuesMixin):
     def __init__(self, name, parser, *args, **kwargs):
         self.name, self.parser = name, parser
         self.args, self.kwargs = args, kwargs
-        self.esse = ESSE()
-        self.manifest = self.esse.get_property_manifest(self.name)
+        self.esse = SCHEMA_REGISTRY.esse
+        self.manifest = SCHEMA_REGISTRY.get_property_manifest(self.name)
 
     @abstractmethod
     def _serialize(self):
@@ -27,18 +28,20 @@ class BaseProperty(RoundNumericValuesMixin):
 
     @property
     def schema(self):
-        return self.esse.get_schema_by_id(self.manifest["schemaId"])
+        return SCHEMA_REGISTRY.get_schema_by_id(self.manifest["schemaId"])
 
     def serialize_and_validate(self):
         """
         Serialize the property and validates it against the schema.
 
+        Note: the bases returned by the parsers are expanded into their ESSE shape in here.
+
         Returns:
             dict
         """
-        instance = self._serialize()
+        instance = expand_bases(self._serialize())
         # TODO: consider rounding all numbers at this stage
-        self.esse.validate(instance, self.schema)
+        SCHEMA_REGISTRY.validate(instance, self.schema)
         return instance
 
     def safely_invoke_parser_method(self, method_name, *args, **kwargs):
@@ -1,7 +1,6 @@
 import numpy as np
 from typing import Tuple
-from copy import deepcopy
-from express.properties.utils import eigenvalues
+from express.parsers.eigenvalues import EigenvalueSet
 from express.properties.non_scalar import NonScalarProperty
 
 PRECISION_MAP = {
@@ -128,17 +127,22 @@ class BandGaps(NonScalarProperty):
               s = 0  <->  1/2
               s = 1  <-> -1/2
 
+        Raises:
+            ValueError: if there is no valence or no conduction band at some k-point.
+
         Returns:
             tuple: bands information containing e_skn and occ_sk explained above.
 
         """
         nk = len(self.ibz_k_points)
-        ns = self.nspins
-        e_skn = np.array([[eigenvalues(self.eigenvalues_at_kpoints, k, s) for k in range(nk)] for s in range(ns)])
-        e_skn -= self.fermi_energy
+        e_skn = EigenvalueSet.from_list(self.eigenvalues_at_kpoints).spin_energies(self.nspins)[:, :nk]
+        e_skn = e_skn - self.fermi_energy
         occ_sk = (e_skn < 0.0).sum(2)
+        if np.any(occ_sk == 0) or np.any(occ_sk == e_skn.shape[2]):
+            raise ValueError("Band gaps require both valence and conduction bands at each k-point")
         # select highest occupied and lowest unoccupied bands
-        e_skn = np.array([[e_skn[s, k, occ_sk[s, k] - 1 : occ_sk[s, k] + 1] for k in range(nk)] for s in range(ns)])
+        band_indices = np.stack([occ_sk - 1, occ_sk], axis=2)
+        e_skn = np.take_along_axis(e_skn, band_indices, axis=2)
         return occ_sk, e_skn
 
     @staticmethod
@@ -178,12 +182,17 @@ class BandGaps(NonScalarProperty):
              dict
         """
         precision = PRECISION_MAP["eigenvalues"]
-        eigens_at_kpoints = deepcopy(self.eigenvalues_at_kpoints)
+        eigenvalue_set = EigenvalueSet.from_list(self.eigenvalues_at_kpoints)
+        occupations = eigenvalue_set.occupations
+        eigens_at_kpoints = EigenvalueSet(
+            np.round(eigenvalue_set.kpoints, precision),
+            eigenvalue_set.weights,
+            np.round(eigenvalue_set.energies, precision),
+            None if occupations is None else np.round(occupations, precision),
+            spins=eigenvalue_set.spins,
+        ).to_list()
         for eigens_at_kpoint in eigens_at_kpoints:
-            eigens_at_kpoint["kpoint"] = self._round(eigens_at_kpoint["kpoint"], precision)
             for eigens_at_spin in eigens_at_kpoint["eigenvalues"]:
-                eigens_at_spin["energies"] = self._round(eigens_at_spin["energies"], precision)
-                eigens_at_spin["occupations"] = self._round(eigens_at_spin["occupations"], precision)
                 # occupations are empty in case of QE GW, hence sending all values.
                 if len(eigens_at_spin["occupations"]) == 0:
                     continue
@@ -1,6 +1,4 @@
-import numpy as np
-
-from express.properties.utils import eigenvalues
+from express.parsers.eigenvalues import EigenvalueSet
 from express.settings import ZERO_WEIGHT_KPOINT_THRESHOLD
 from express.properties.non_scalar.two_dimensional_plot import TwoDimensionalPlotProperty
 
@@ -27,15 +25,15 @@ class BandStructure(TwoDimensionalPlotProperty):
         # k-point. Here we override nspins for non-collinear case.
         self.nspins = 1 if self.parser.nspins() == 4 else self.parser.nspins()
 
-        self.eigenvalues_at_kpoints = self.parser.eigenvalues_at_kpoints()
+        self.eigenvalues_at_kpoints = EigenvalueSet.from_list(self.parser.eigenvalues_at_kpoints())
         if kwargs.get("remove_non_zero_weight_kpoints", False):
-            self.eigenvalues_at_kpoints = [
-                e for e in self.eigenvalues_at_kpoints if e["weight"] <= ZERO_WEIGHT_KPOINT_THRESHOLD
-            ]
+            self.eigenvalues_at_kpoints = self.eigenvalues_at_kpoints.select(
+                self.eigenvalues_at_kpoints.weights <= ZERO_WEIGHT_KPOINT_THRESHOLD
+            )
 
         self.nkpoints = len(self.eigenvalues_at_kpoints)
         self.bands = self._get_band()
-        self.xDataArray = [eigenvalueData["kpoint"] for eigenvalueData in self.eigenvalues_at_kpoints]
+        self.xDataArray = self.eigenvalues_at_kpoints.kpoints.tolist()
         self.yDataSeries = self.bands.tolist()
 
     def _serialize(self):
@@ -50,8 +48,6 @@ class BandStructure(TwoDimensionalPlotProperty):
         Returns:
             ndarray
         """
-        bands = np.array(
-            [[eigenvalues(self.eigenvalues_at_kpoints, k, s) for s in range(self.nspins)] for k in range(self.nkpoints)]
-        )
-        bands = np.transpose(bands).reshape(len(bands[0][0]) * self.nspins, self.nkpoints)
-        return bands
+        # band index first, then spin, as in the transposed (kpoint, spin, band) array
+        bands = self.eigenvalues_at_kpoints.spin_energies(self.nspins).transpose((2, 0, 1))
+        return bands.reshape(-1, self.nkpoints)
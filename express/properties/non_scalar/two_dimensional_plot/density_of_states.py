@@ -1,3 +1,5 @@
+import numpy as np
+
 from express.properties.non_scalar.two_dimensional_plot import TwoDimensionalPlotProperty
 
 
@@ -6,12 +8,59 @@ class DensityOfStates(TwoDimensionalPlotProperty):
     Describes the number of electronic states per interval of energy at each energy level that are available to be
     occupied. There are also projections of total electronic density onto each of the atomic states that are often
     useful.
+
+    Args:
+        kwargs (dict): kwargs passed to the property.
+            energy_window (list): lower and upper energy bounds relative to the Fermi energy, e.g. [-5.0, 5.0], to
+                keep the energy levels within.
+            num_points (int): number of points of the uniform energy grid to linearly interpolate the DOS onto.
+            dtype (str): floating point type to serialize the values with, e.g. "float32" or "float16". The values
+                are rounded to the type and written with the shortest decimal representation that round-trips in it.
+                Values are serialized as extracted by default.
+
+    Note: the parsers return the DOS as lists, hence the values are held in double precision and only rounded to
+    `dtype` on serialization.
     """
 
     def __init__(self, name, parser, *args, **kwargs):
         super(DensityOfStates, self).__init__(name, parser, *args, **kwargs)
         dos = self.parser.dos()
-        self.xDataArray = [dos["energy"]]
-        self.yDataSeries = [dos["total"]]
+        energy = np.asarray(dos["energy"])
+        values = np.asarray([dos["total"]] + dos["partial"])
+
+        energy_window = kwargs.get("energy_window")
+        if energy_window is not None:
+            fermi_energy = self.parser.fermi_energy()
+            mask = (energy >= fermi_energy + energy_window[0]) & (energy <= fermi_energy + energy_window[1])
+            energy, values = energy[mask], values[:, mask]
+
+        num_points = kwargs.get("num_points")
+        if num_points and len(energy) > 1:
+            grid = np.linspace(energy[0], energy[-1], num_points)
+            values = np.array([np.interp(grid, energy, series) for series in values])
+            energy = grid
+
+        self.dtype = kwargs.get("dtype")
+        self.xDataArray = energy[np.newaxis]
+        self.yDataSeries = values
         self.legend = [{}] + dos["partial_info"]
-        self.yDataSeries.extend([pdos for pdos in dos["partial"]])
+
+    def _serialize(self):
+        data = super(DensityOfStates, self)._serialize()
+        data.update({"xDataArray": self._to_list(self.xDataArray), "yDataSeries": self._to_list(self.yDataSeries)})
+        return data
+
+    def _to_list(self, array):
+        """
+        Returns a list of the values of a given array, rounded to `dtype` if set.
+
+        Args:
+            array (numpy.ndarray): array to convert.
+
+        Returns:
+            list
+        """
+        if self.dtype is None:
+            return array.tolist()
+        # numpy prints the shortest representation of a value that converts back to the same value of its type
+        return array.astype(self.dtype).astype(str).astype(np.float64).tolist()
@@ -0,0 +1,93 @@
+class SchemaRegistry(object):
+    """
+    Process-wide access to the ESSE schemas: a single ESSE instance is shared by all properties, schemas are looked up
+    by id once and a validator is compiled once per schema, hence the schema checks are not repeated on every
+    validation.
+
+    Note: ESSE and jsonschema are imported on first use, as loading the schemas takes a noticeable part of the import
+    time of express.
+    """
+
+    def __init__(self):
+        self._esse = None
+        self._schemas = {}
+        self._validators = {}
+
+    @property
+    def esse(self):
+        if self._esse is None:
+            from mat3ra.esse import ESSE
+
+            self._esse = ESSE()
+        return self._esse
+
+    def get_property_manifest(self, property_name):
+        """
+        Returns the manifest for a given property.
+
+        Args:
+            property_name (str): property name.
+
+        Returns:
+             dict
+        """
+        return self.esse.get_property_manifest(property_name)
+
+    def get_schema_by_id(self, schema_id):
+        """
+        Returns the schema with a given id.
+
+        Args:
+            schema_id (str): schema id, e.g. "properties-directory/scalar/total-energy".
+
+        Returns:
+             dict
+        """
+        if schema_id not in self._schemas:
+            self._schemas[schema_id] = self.esse.get_schema_by_id(schema_id)
+        return self._schemas[schema_id]
+
+    def get_validator(self, schema):
+        """
+        Returns the validator for a given schema. Validators are cached by the schema id.
+
+        Args:
+            schema (dict): schema.
+
+        Raises:
+            jsonschema.exceptions.SchemaError
+
+        Returns:
+            jsonschema.protocols.Validator
+        """
+        schema_id = schema.get("$id")
+        validator = self._validators.get(schema_id)
+        if validator is None:
+            from jsonschema import validators
+
+            validator_class = validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            validator = validator_class(schema)
+            if schema_id is not None:
+                self._validators[schema_id] = validator
+        return validator
+
+    def validate(self, instance, schema):
+        """
+        Validates a given instance against the schema. The error raised is the same as with `ESSE.validate`.
+
+        Args:
+            instance (dict|list): instance to validate.
+            schema (dict): schema to validate the instance with.
+
+        Raises:
+            jsonschema.exceptions.ValidationError
+        """
+        from jsonschema import exceptions
+
+        error = exceptions.best_match(self.get_validator(schema).iter_errors(instance))
+        if error is not None:
+            raise error
+
+
+SCHEMA_REGISTRY = SchemaRegistry()
@@ -1,4 +1,5 @@
 from express.properties import BaseProperty
+from express.properties.schemas import SCHEMA_REGISTRY
 import os
 import copy
 from typing import Dict, Any
@@ -23,7 +24,7 @@ class WorkflowProperty(BaseProperty):
 
     @property
     def schema(self):
-        return self.esse.get_schema_by_id("workflow")
+        return SCHEMA_REGISTRY.get_schema_by_id("workflow")
 
     @property
     def workflow_specific_config(self) -> dict:
@@ -0,0 +1,185 @@
+"""
+Long-lived extraction worker: reads jobs from the standard input and writes the extracted properties to the standard
+output, one JSON object per line, so that the import of express and its dependencies and the loading of the schemas
+are paid once for many jobs.
+
+Job example:
+    {
+        "id": "job-1",
+        "parser": "espresso",
+        "kwargs": {"work_dir": "/path/to/job", "stdout_file": "/path/to/job/pw.out"},
+        "properties": ["total_energy", "fermi_energy"],
+        "property_kwargs": {}
+    }
+
+Result example:
+    {"id": "job-1", "properties": {"total_energy": {...}, "fermi_energy": {...}}}
+    {"id": "job-2", "error": "FileNotFoundError: ..."}
+
+Usage:
+    express-worker --max-workers 4 < jobs.jsonl > results.jsonl
+
+Note: the output of `print` calls, e.g. the parser warnings, is written to the standard error, so that it does not
+corrupt the results.
+"""
+
+import os
+import sys
+import json
+import contextlib
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from express import ExPrESS, settings
+
+
+def run_job(job):
+    """
+    Extracts the properties of a given job.
+
+    Args:
+        job (dict): job, see the module docstring.
+
+    Returns:
+        dict: result, see the module docstring.
+    """
+    try:
+        if job.get("parser") not in settings.PARSERS_REGISTRY:
+            raise ValueError("Unknown parser: {0}".format(job.get("parser")))
+        handler = ExPrESS(job["parser"], **job.get("kwargs", {}))
+        try:
+            properties = handler.properties(job["properties"], **job.get("property_kwargs", {}))
+        finally:
+            # release the cached files of the job as the worker outlives it
+            handler.parser.close()
+        return {"id": job.get("id"), "properties": properties}
+    except Exception as e:
+        return {"id": job.get("id"), "error": _format_error(e)}
+
+
+def _format_error(error):
+    return "{0}: {1}".format(type(error).__name__, error)
+
+
+def _json_default(value):
+    # numpy values
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError("Object of type {0} is not JSON serializable".format(type(value).__name__))
+
+
+def _initialize_worker_process(warm):
+    """
+    Initializes a worker process: writes the output of `print` calls to the standard error and warms up ExPrESS.
+
+    Args:
+        warm (bool): whether to resolve the parser and property classes upfront, see ExPrESS.warm.
+    """
+    sys.stdout = sys.stderr
+    if warm:
+        ExPrESS.warm()
+
+
+def serve(input_stream, output_stream, max_workers=None, warm=True):
+    """
+    Processes the jobs read from a given stream, one JSON object per line, until the end of the stream. Results are
+    written as soon as they are ready, hence not necessarily in the order of the jobs.
+
+    A job may not run because a worker process died, e.g. running out of memory, as the pool of the processes is then
+    broken: the jobs of a broken pool are resubmitted once to a new pool and reported with a BrokenProcessPool error
+    if it breaks again.
+
+    Args:
+        input_stream (io.TextIOBase): stream to read jobs from.
+        output_stream (io.TextIOBase): stream to write results to.
+        max_workers (int): number of worker processes. Jobs are processed in the current process if not set.
+        warm (bool): whether to resolve the parser and property classes upfront, see ExPrESS.warm.
+    """
+    lock = threading.Lock()
+
+    def write(result):
+        with lock:
+            output_stream.write(json.dumps(result, default=_json_default) + "\n")
+            output_stream.flush()
+
+    def jobs():
+        for line in input_stream:
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError as e:
+                write({"id": None, "error": _format_error(e)})
+                continue
+            if not isinstance(job, dict):
+                write({"id": None, "error": "Job must be a JSON object"})
+                continue
+            yield job
+
+    with contextlib.redirect_stdout(sys.stderr):
+        if not max_workers:
+            if warm:
+                ExPrESS.warm()
+            for job in jobs():
+                write(run_job(job))
+            return
+
+        def create_pool():
+            return ProcessPoolExecutor(max_workers, initializer=_initialize_worker_process, initargs=(warm,))
+
+        # broken pools are shut down once all jobs are done, as they can not be shut down from the future callbacks
+        pools = [create_pool()]
+        pool_lock = threading.Lock()
+        pending = threading.Condition()
+        pending_jobs = [0]
+
+        def submit(job, resubmit):
+            with pool_lock:
+                try:
+                    future = pools[-1].submit(run_job, job)
+                except BrokenProcessPool:
+                    pools.append(create_pool())
+                    future = pools[-1].submit(run_job, job)
+            future.add_done_callback(lambda future: write_future_result(job, future, resubmit))
+
+        def write_future_result(job, future, resubmit):
+            error = future.exception()
+            if resubmit and isinstance(error, BrokenProcessPool):
+                # the job may have not run: it is pending until its new future is done
+                try:
+                    return submit(job, resubmit=False)
+                except Exception as e:
+                    error = e
+            try:
+                write(future.result() if error is None else {"id": job.get("id"), "error": _format_error(error)})
+            finally:
+                with pending:
+                    pending_jobs[0] -= 1
+                    pending.notify_all()
+
+        try:
+            for job in jobs():
+                with pending:
+                    pending_jobs[0] += 1
+                submit(job, resubmit=True)
+            with pending:
+                pending.wait_for(lambda: pending_jobs[0] == 0)
+        finally:
+            for pool in pools:
+                pool.shutdown()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Extracts properties for the jobs read from the standard input.")
+    parser.add_argument("--max-workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--no-warm", action="store_true", help="resolve parser and property classes on first use")
+    options = parser.parse_args(args)
+    # results are written to a duplicate of the standard output, the standard output itself is redirected by serve
+    with os.fdopen(os.dup(sys.stdout.fileno()), "w") as output_stream:
+        serve(sys.stdin, output_stream, max_workers=options.max_workers, warm=not options.no_warm)
+
+
+if __name__ == "__main__":
+    main()
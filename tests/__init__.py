@@ -2,6 +2,7 @@ import os
 import yaml
 import unittest
 import numpy as np
+from collections.abc import Mapping
 
 
 class TestBase(unittest.TestCase):
@@ -36,8 +37,8 @@ class TestBase(unittest.TestCase):
             Based on: http://stackoverflow.com/a/23550280
 
         Args:
-            expected (dict|list|tuple): expected complex object.
-            actual (dict|list|tuple): actual complex object.
+            expected (Mapping|list|tuple): expected complex object.
+            actual (Mapping|list|tuple): actual complex object.
         """
         is_root = "__trace" not in kwargs
         trace = kwargs.pop("__trace", "ROOT")
@@ -51,10 +52,12 @@ class TestBase(unittest.TestCase):
                 for index in range(len(expected)):
                     v1, v2 = expected[index], actual[index]
                     self.assertDeepAlmostEqual(v1, v2, __trace=repr(index), *args, **kwargs)
-            elif isinstance(expected, dict):
+            elif isinstance(expected, Mapping):
                 self.assertEqual(set(expected), set(actual))
                 for key in expected:
                     self.assertDeepAlmostEqual(expected[key], actual[key], __trace=repr(key), *args, **kwargs)
+            else:
+                self.assertEqual(expected, actual)
         except AssertionError as exc:
             exc.__dict__.setdefault("traces", []).append(trace)
             if is_root:
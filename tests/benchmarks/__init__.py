@@ -0,0 +1,52 @@
+"""
+Micro-benchmarks for performance-sensitive code paths.
+
+The benchmarks are not collected by the test runner and are executed as modules, e.g.:
+
+    python -m tests.benchmarks.benchmark_regex
+"""
+
+import os
+import timeit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fixtures")
+GIT_LFS_POINTER_PREFIX = "version https://git-lfs"
+
+
+def read_fixture(relative_path, fallback=""):
+    """
+    Returns the content of a given fixture, or the fallback text if the fixture is not available (e.g. not pulled
+    from git LFS).
+
+    Args:
+        relative_path (str): path relative to the fixtures directory.
+        fallback (str): text to use when the fixture is not available.
+
+    Returns:
+         str
+    """
+    path = os.path.join(FIXTURES_DIR, relative_path)
+    if os.path.exists(path):
+        with open(path) as f:
+            content = f.read()
+        if not content.startswith(GIT_LFS_POINTER_PREFIX):
+            return content
+    return fallback
+
+
+def benchmark(label, func, number=1000, repeat=5):
+    """
+    Runs a given function and prints the best time per call.
+
+    Args:
+        label (str): benchmark label.
+        func (callable): function to benchmark.
+        number (int): number of calls per measurement.
+        repeat (int): number of measurements.
+
+    Returns:
+         float: best time per call in seconds.
+    """
+    per_call = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print("{0:<64} {1:>12.2f} us/call".format(label, per_call * 1e6))
+    return per_call
@@ -0,0 +1,266 @@
+"""
+Compares extracting the convergence electronic and ionic data of a 500-ionic-step vc-relax output from a shared index of
+the self-consistent and BFGS blocks against the code path prior to the shared index, which re-parsed the output for
+each property.
+"""
+
+import re
+import random
+import builtins
+
+import numpy as np
+
+from express.parsers.settings import Constant
+from express.parsers.apps.espresso import settings
+from express.parsers.apps.espresso.formats.txt import EspressoTXTParser
+from tests.benchmarks import benchmark
+
+HEADER = """
+     Program PWSCF v.6.3 starts on  1Jan2020 at 10: 0: 0
+
+     lattice parameter (alat)  =       7.2558  a.u.
+     number of atoms/cell      =            {natoms}
+
+     crystal axes: (cart. coord. in units of alat)
+               a(1) = (  -0.500000   0.000000   0.500000 )
+               a(2) = (   0.000000   0.500000   0.500000 )
+               a(3) = (  -0.500000   0.500000   0.000000 )
+
+     site n.     atom                  positions (alat units)
+{sites}
+"""
+
+SCF = """
+     Self-consistent Calculation
+{iterations}
+     End of self-consistent calculation
+
+     convergence has been achieved in  {n} iterations
+
+!    total energy              =     {energy:.8f} Ry
+     estimated scf accuracy    <       0.00000060 Ry
+
+     Forces acting on atoms (cartesian axes, Ry/au):
+
+     atom    1 type  1   force =     0.00000000    0.00000000    0.00100000
+
+     Total force =     0.001414     Total SCF correction =     0.000000
+"""
+
+ITERATION = """
+     iteration #{i:3d}     ecut=    30.00 Ry     beta= 0.70
+     Davidson diagonalization with overlap
+     total cpu time spent up to now is        0.1 secs
+
+     total energy              =     {energy:.8f} Ry
+     estimated scf accuracy    <       {accuracy:.8f} Ry
+"""
+
+BFGS = """
+     number of scf cycles    =  {step}
+     number of bfgs steps    =  {step}
+
+     new unit-cell volume =    270.01 a.u.^3 (    40.01 Ang^3 )
+     density =      2.33 g/cm^3
+
+CELL_PARAMETERS (angstrom)
+{cell}
+ATOMIC_POSITIONS (crystal)
+{positions}
+
+     Writing output data file ./pwscf.save/
+"""
+
+
+def vc_relax_output(steps, natoms=8, iterations=10, seed=0):
+    """
+    Returns a synthetic pw.x vc-relax standard output.
+
+    Args:
+        steps (int): number of ionic steps.
+        natoms (int): number of atoms.
+        iterations (int): number of electronic steps per ionic step.
+        seed (int): random seed.
+
+    Returns:
+         str
+    """
+    rng = random.Random(seed)
+    sites = "\n".join(
+        "         {0}           Si  tau(   {0}) = (   {1:.7f}   {2:.7f}   {3:.7f}  )".format(
+            i + 1, *[rng.random() for _ in range(3)]
+        )
+        for i in range(natoms)
+    )
+    parts = [HEADER.format(natoms=natoms, sites=sites)]
+    for step in range(steps):
+        energy = -15.8 - rng.random()
+        parts.append(
+            SCF.format(
+                iterations="".join(
+                    ITERATION.format(i=i + 1, energy=energy + 0.1 / (i + 1), accuracy=10.0**-i)
+                    for i in range(iterations)
+                ),
+                n=iterations,
+                energy=energy,
+            )
+        )
+        parts.append(
+            BFGS.format(
+                step=step + 1,
+                cell="\n".join(
+                    "  {0:.9f}  {1:.9f}  {2:.9f}".format(*[rng.uniform(-3, 3) for _ in range(3)]) for _ in range(3)
+                ),
+                positions="\n".join(
+                    "Si            {0:.10f}        {1:.10f}        {2:.10f}".format(*[rng.random() for _ in range(3)])
+                    for _ in range(natoms)
+                ),
+            )
+        )
+    return "".join(parts)
+
+
+class BaselineEspressoTXTParser(EspressoTXTParser):
+    """
+    Text parser with the convergence code path prior to the shared convergence index, copied verbatim: each property
+    re-parses the output, the electronic steps are grouped by extracting the convergence ionic data, including the
+    structures, and the patterns are compiled on every call.
+    """
+
+    def _general_output_parser(
+        self, text, regex, output_type, start_flag=None, end_flag=None, occurrences=0, match_groups=[]
+    ):
+        start_index = text.rfind(start_flag) if start_flag else 0
+        end_index = text.rfind(end_flag) if end_flag else len(text)
+        pattern = re.compile(regex, re.I | re.MULTILINE)
+        cast = getattr(builtins, output_type)
+        # output type depends on the number of values required. List or single number.
+        result = [] if len(match_groups) > 1 or abs(occurrences) > 1 or occurrences == 0 else None
+
+        match = pattern.findall(text[start_index:end_index])
+        if match:
+            occurrences = len(match) if occurrences == 0 else occurrences
+            match = match[occurrences:] if occurrences < 0 else match[:occurrences]
+            if isinstance(result, list):
+                for m in match:
+                    result.append([cast(m[i - 1]) for i in match_groups]) if match_groups else result.append(cast(m))
+            else:
+                result = cast(match[0][0]) if isinstance(match[0], tuple) else cast(match[0])
+        return result
+
+    def convergence_electronic(self, text):
+        data = self._general_output_parser(text, **settings.REGEX["convergence_electronic"])
+        # The next 3 lines are necessary to have realtime data
+        ionic_data = [_["electronic"]["data"] for _ in self.convergence_ionic(text)]
+        last_step_data = data[sum([len(_) for _ in ionic_data]) : len(data)]
+        if last_step_data:
+            ionic_data.append(last_step_data)
+        return [(np.array(_) * Constant.RYDBERG).tolist() for _ in ionic_data]
+
+    def convergence_ionic(self, text):
+        data = []
+        blocks = re.findall(settings.REGEX["convergence_ionic_blocks"]["regex"], text, re.DOTALL | re.MULTILINE)
+        for idx, block in enumerate(blocks):
+            energies = self._general_output_parser(block, **settings.REGEX["convergence_ionic_energies"])
+            energies = (np.array(energies) * Constant.RYDBERG).tolist()
+            data.append(
+                {
+                    "energy": energies[-1],
+                    "electronic": {
+                        "units": "eV",
+                        "data": self._general_output_parser(block, **settings.REGEX["convergence_electronic"]),
+                    },
+                }
+            )
+
+        if not data:
+            return []
+
+        # last structure is used for the next ionic step, hence [:max(0, len(data) - 1)]
+        lattice_convergence = self._lattice_convergence(text)[: max(0, len(data) - 1)]
+        basis_convergence = self._basis_convergence(text)[: max(0, len(data) - 1)]
+        for idx, structure in enumerate(zip(lattice_convergence, basis_convergence)):
+            structure[1]["units"] = "angstrom"
+            lattice_matrix = np.array([structure[0]["vectors"][key] for key in ["a", "b", "c"]]).reshape((3, 3))
+            for coordinate in structure[1]["coordinates"]:
+                coordinate["value"] = np.dot(coordinate["value"], lattice_matrix).tolist()
+            data[idx + 1].update({"structure": {"lattice": structure[0], "basis": structure[1]}})
+
+        # inject initial structure
+        data[0].update(
+            {"structure": {"basis": self.initial_basis(text), "lattice": self.initial_lattice_vectors(text)}}
+        )
+
+        return data
+
+    def initial_basis(self, text):
+        alat = self._get_alat(text)
+        number_of_atoms = self._number_of_atoms(text)
+        basis_in_alat_units = self._extract_basis(text[text.find("positions (alat units)") :], number_of_atoms)
+        for coordinate in basis_in_alat_units["coordinates"]:
+            coordinate["value"] = [x * alat * Constant.BOHR for x in coordinate["value"]]
+        return basis_in_alat_units
+
+    def _extract_basis(self, text, number_of_atoms):
+        basis = {"units": "angstrom", "elements": [], "coordinates": []}
+        matches = self._general_output_parser(text, **settings.REGEX["basis_alat"](number_of_atoms))
+        for idx, match in enumerate(matches):
+            basis["elements"].append({"id": idx, "value": match[0]})
+            coordinate = [float(match[1]), float(match[2]), float(match[3])]
+            basis["coordinates"].append({"id": idx, "value": coordinate})
+        return basis
+
+    def _lattice_convergence(self, text):
+        return self._extract_data_from_bfgs_blocks(text, self._extract_lattice)
+
+    def _extract_data_from_bfgs_blocks(self, text, func):
+        results = []
+        bfgs_block_pattern = re.compile(settings.REGEX["bfgs_block"]["regex"], re.DOTALL)
+        bfgs_blocks = bfgs_block_pattern.findall(text)
+        for block in bfgs_blocks:
+            results.append(func(block))
+        return results
+
+    def _extract_lattice(self, text, regex="lattice"):
+        match = re.search(settings.REGEX[regex]["regex"], text)
+        if match:
+            lattice = [float(_) for _ in match.groups(1)]
+            return {"vectors": {"a": lattice[0:3], "b": lattice[3:6], "c": lattice[6:9], "alat": 1}}
+
+    def _basis_convergence(self, text):
+        return self._extract_data_from_bfgs_blocks(text, self._extract_basis_from_bfgs_blocks)
+
+    def _extract_basis_from_bfgs_blocks(self, text):
+        basis = {"units": "crystal", "elements": [], "coordinates": []}
+        matches = re.findall(settings.REGEX["ion_position"]["regex"], text)
+        if matches:
+            for idx, match in enumerate(matches):
+                basis["elements"].append({"id": idx, "value": match[0]})
+                basis["coordinates"].append({"id": idx, "value": [float(match[1]), float(match[2]), float(match[3])]})
+
+            return basis
+
+
+def extract(parser, text):
+    return parser.convergence_electronic(text), parser.convergence_ionic(text)
+
+
+def main():
+    text = vc_relax_output(500)
+    assert extract(BaselineEspressoTXTParser(None), text) == extract(EspressoTXTParser(None), text)
+    benchmark(
+        "convergence electronic + ionic, baseline code path",
+        lambda: extract(BaselineEspressoTXTParser(None), text),
+        number=1,
+        repeat=3,
+    )
+    benchmark(
+        "convergence electronic + ionic, shared block index",
+        lambda: extract(EspressoTXTParser(None), text),
+        number=1,
+        repeat=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
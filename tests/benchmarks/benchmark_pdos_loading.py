@@ -0,0 +1,74 @@
+"""
+Compares loading a projwfc.x pdos file with the regex trimming and `np.genfromtxt` used previously by
+`EspressoTXTParser._extract_partial_dos` against `load_dos_file`, and reading the pdos files of a job serially and
+concurrently.
+"""
+
+import io
+import os
+import random
+import re
+import tempfile
+
+import numpy as np
+
+from express.parsers.apps.espresso.formats.txt import EspressoTXTParser, load_dos_file
+from tests.benchmarks import benchmark
+
+
+def pdos_file(num_levels=5000, num_orbitals=5, seed=0):
+    """
+    Returns the content of a synthetic pdos file with overflowing energies in the first and last rows, i.e. with
+    `num_levels - 2` energy levels read.
+
+    Args:
+        num_levels (int): number of rows, including the overflowing ones.
+        num_orbitals (int): number of orbitals.
+        seed (int): random seed.
+
+    Returns:
+         str
+    """
+    rng = random.Random(seed)
+    lines = ["# E (eV)  ldos(E)  " + "  ".join("pdos(E)" for _ in range(num_orbitals))]
+    for index in range(num_levels):
+        energy = "*******" if index in (0, num_levels - 1) else "{0:8.3f}".format(-25.0 + 0.01 * index)
+        lines.append(" ".join([energy] + ["{0:.3E}".format(rng.random()) for _ in range(num_orbitals + 1)]))
+    return "\n".join(lines) + "\n"
+
+
+def previous_extract_partial_dos(path, num_orbitals):
+    with open(path) as f:
+        text = "\n".join(re.findall(r"^ *[-+]?\d*\.\d+(?:[eE][-+]?\d+)?.*$", f.read(), re.MULTILINE))
+    return np.genfromtxt(io.StringIO(text), dtype=np.float32, usecols=range(2, 2 + num_orbitals))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "__prefix__.pdos_atm#1(Ti)_wfc#3(d)")
+        with open(path, "w") as f:
+            f.write(pdos_file())
+        benchmark("pdos file: regex + genfromtxt", lambda: previous_extract_partial_dos(path, 5), number=10)
+        benchmark("pdos file: load_dos_file", lambda: load_dos_file(path, range(2, 7)), number=10)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        num_atoms, num_levels = 200, 2000
+        for atom_id in range(num_atoms):
+            for orbit_id, (orbit_symbol, num_orbitals) in enumerate((("s", 1), ("p", 3), ("d", 5))):
+                name = "__prefix__.pdos_atm#{0}(Ti)_wfc#{1}({2})".format(atom_id + 1, orbit_id + 1, orbit_symbol)
+                with open(os.path.join(tmp_dir, name), "w") as f:
+                    f.write(pdos_file(num_levels=num_levels + 2, num_orbitals=num_orbitals, seed=atom_id))
+        parser = EspressoTXTParser(tmp_dir)
+        label = "{0} pdos files".format(3 * num_atoms)
+        benchmark(label + ": serial", lambda: parser._partial_dos(num_levels), number=1, repeat=3)
+        for executor in ("thread", "process"):
+            benchmark(
+                label + ": 4 {0} workers".format(executor),
+                lambda: parser._partial_dos(num_levels, max_workers=4, executor=executor),
+                number=1,
+                repeat=3,
+            )
+
+
+if __name__ == "__main__":
+    main()
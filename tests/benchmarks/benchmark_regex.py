@@ -0,0 +1,78 @@
+"""
+Compares the per-call overhead of compiling the settings regex patterns on every call (previous behavior of
+`BaseTXTParser._general_output_parser`) against looking them up in the compiled regex registry.
+"""
+
+import re
+
+from express.parsers.apps.espresso import settings as espresso_settings
+from express.parsers.apps.vasp import settings as vasp_settings
+from express.parsers.formats.txt import GENERAL_OUTPUT_PARSER_FLAGS, BaseTXTParser
+from express.parsers.regex import REGEX_REGISTRY
+from tests.benchmarks import benchmark, read_fixture
+
+ESPRESSO_STDOUT = read_fixture(
+    "espresso/v6_5/test-004/pw_scf.out",
+    fallback="\n".join(
+        [
+            "     total energy              =     -15.79103983 Ry",
+            "     estimated scf accuracy    <       0.00000060 Ry",
+            "!    total energy              =     -15.79441848 Ry",
+            "     one-electron contribution =       4.83378726 Ry",
+            "     Total force =     0.001414     Total SCF correction =     0.000000",
+        ]
+    ),
+)
+VASP_OUTCAR = read_fixture(
+    "vasp/test-001/OUTCAR",
+    fallback="\n".join(
+        [
+            "  external pressure =       -0.43 kB  Pullay stress =        0.00 kB",
+            "  Hartree 1.0 2.0 3.0 4.0 5.0 6.0",
+            "  total drift:                                0.000000      0.000000     -0.000000",
+        ]
+    ),
+)
+
+CASES = [
+    ("espresso", espresso_settings.REGEX, ["total_energy", "total_force", "pressure"], ESPRESSO_STDOUT),
+    ("vasp", vasp_settings.REGEX, ["pressure", "total_force"], VASP_OUTCAR),
+]
+
+
+class UncompiledTXTParser(BaseTXTParser):
+    """
+    Text parser compiling the regex pattern on every call, as done prior to the regex registry.
+    """
+
+    def _general_output_parser(self, text, regex, *args, **kwargs):
+        re.compile(regex, GENERAL_OUTPUT_PARSER_FLAGS)
+        return super()._general_output_parser(text, regex, *args, **kwargs)
+
+
+def main():
+    for namespace, table, names, text in CASES:
+        for name in names:
+            regex = table[name]["regex"]
+            benchmark(
+                "{0}.{1}: re.compile per call".format(namespace, name),
+                lambda: re.compile(regex, GENERAL_OUTPUT_PARSER_FLAGS),
+                number=100000,
+            )
+            benchmark(
+                "{0}.{1}: registry lookup".format(namespace, name),
+                lambda: REGEX_REGISTRY.get(namespace, name, GENERAL_OUTPUT_PARSER_FLAGS),
+                number=100000,
+            )
+            benchmark(
+                "{0}.{1}: _general_output_parser, compile per call".format(namespace, name),
+                lambda: UncompiledTXTParser(None)._general_output_parser(text, **table[name]),
+            )
+            benchmark(
+                "{0}.{1}: _general_output_parser, registry".format(namespace, name),
+                lambda: BaseTXTParser(None)._general_output_parser(text, **table[name]),
+            )
+
+
+if __name__ == "__main__":
+    main()
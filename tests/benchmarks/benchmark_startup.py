@@ -0,0 +1,46 @@
+"""
+Measures the time to import express in a new interpreter and checks it against a budget.
+"""
+
+import subprocess
+import sys
+import timeit
+
+# seconds, on top of the interpreter startup
+IMPORT_TIME_BUDGET = 0.5
+
+
+def import_time(module_name, repeat=5):
+    """
+    Returns the best time to import a given module in a new interpreter, less the interpreter startup time.
+
+    Args:
+        module_name (str): module name.
+        repeat (int): number of measurements.
+
+    Returns:
+         float: seconds.
+    """
+
+    def run(code):
+        return min(timeit.repeat(lambda: subprocess.check_call([sys.executable, "-c", code]), number=1, repeat=repeat))
+
+    return run("import {0}".format(module_name)) - run("pass")
+
+
+def main():
+    for module_name in (
+        "express",
+        "express.parsers.apps.espresso.parser",
+        "express.parsers.apps.vasp.parser",
+        "express.parsers.apps.nwchem.parser",
+    ):
+        print("{0:<64} {1:>12.1f} ms".format("import " + module_name, import_time(module_name) * 1e3))
+    seconds = import_time("express")
+    assert seconds < IMPORT_TIME_BUDGET, "import express took {0:.2f} s, budget {1:.2f} s".format(
+        seconds, IMPORT_TIME_BUDGET
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compares decoding the numeric tags of a pw.x XML data file with the regex-based casters used previously by
+`EspressoXMLParserBase.TAG_VALUE_CAST_MAP` against `decode_numbers`.
+"""
+
+import random
+import re
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from express.parsers.apps.espresso.formats.xml.xml_base import EspressoXMLParserBase
+from express.parsers.settings import GENERAL_REGEX
+from tests.benchmarks import benchmark, read_fixture
+
+KS_ENERGIES = """
+    <ks_energies>
+      <k_point weight="{weight:.14e}">{kpoint}</k_point>
+      <npw>1000</npw>
+      <eigenvalues size="{nbands}">{eigenvalues}</eigenvalues>
+      <occupations size="{nbands}">{occupations}</occupations>
+    </ks_energies>"""
+
+
+def data_file(nkpoints=100, nbands=2000, seed=0):
+    """
+    Returns a synthetic band structure section of a pw.x XML data file.
+
+    Args:
+        nkpoints (int): number of kpoints.
+        nbands (int): number of bands.
+        seed (int): random seed.
+
+    Returns:
+         str
+    """
+    rng = random.Random(seed)
+
+    def numbers(count, low, high):
+        return " ".join("{0:.15e}".format(rng.uniform(low, high)) for _ in range(count))
+
+    ks_energies = "".join(
+        KS_ENERGIES.format(
+            weight=rng.random(),
+            kpoint=numbers(3, -0.5, 0.5),
+            nbands=nbands,
+            eigenvalues=numbers(nbands, -1.0, 1.0),
+            occupations=numbers(nbands, 0.0, 1.0),
+        )
+        for _ in range(nkpoints)
+    )
+    return "<band_structure>{0}\n</band_structure>".format(ks_energies)
+
+
+def previous_real_cast(v, s, c):
+    return np.array([float(_) for _ in re.findall(GENERAL_REGEX["double_number"], v)]).reshape([s // c, c])
+
+
+def decode_tags(tags, cast):
+    for tag in tags:
+        cast(tag.text, int(tag.attrib["size"]), 1)
+
+
+def main():
+    root = ET.fromstring(
+        read_fixture("espresso/v6_5/test-006/outdir/__prefix__.save/data-file-schema.xml", fallback=data_file())
+    )
+    tags = [tag for tag in root.iter() if tag.tag in ("eigenvalues", "occupations") and "size" in tag.attrib]
+    benchmark(
+        "{0} eigenvalues/occupations tags: regex".format(len(tags)),
+        lambda: decode_tags(tags, previous_real_cast),
+        number=1,
+    )
+    benchmark(
+        "{0} eigenvalues/occupations tags: decode_numbers".format(len(tags)),
+        lambda: decode_tags(tags, EspressoXMLParserBase.TAG_VALUE_CAST_MAP["real"]),
+        number=1,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import pickle
+
+from tests.unit import UnitTestBase
+from express.parsers.basis import Basis, expand_bases
+from express.parsers.utils import get_element_counts, lattice_basis_to_poscar
+
+BASIS = {
+    "units": "crystal",
+    "elements": [{"id": 0, "value": "Zr"}, {"id": 1, "value": "H"}, {"id": 2, "value": "H"}, {"id": 3, "value": "Zr"}],
+    "coordinates": [
+        {"id": 0, "value": [0.0, 0.0, 0.0]},
+        {"id": 1, "value": [0.25, 0.25, 0.25]},
+        {"id": 2, "value": [0.75, 0.75, 0.75]},
+        {"id": 3, "value": [0.5, 0.5, 0.5]},
+    ],
+}
+
+LATTICE = {"vectors": {"a": [2.0, 0.0, 0.0], "b": [0.0, 2.0, 0.0], "c": [0.0, 0.0, 2.0], "alat": 1}}
+
+
+class BasisTest(UnitTestBase):
+    def setUp(self):
+        super(BasisTest, self).setUp()
+        self.basis = Basis.from_dict(BASIS)
+
+    def test_basis_is_compact(self):
+        self.assertEqual(self.basis.symbols, ["Zr", "H"])
+        self.assertEqual(self.basis.element_indices.tolist(), [0, 1, 1, 0])
+        self.assertEqual(self.basis.coordinates.shape, (4, 3))
+        self.assertFalse(hasattr(self.basis, "__dict__"))
+
+    def test_basis_expands_to_esse_shape(self):
+        self.assertEqual(self.basis, BASIS)
+        self.assertEqual(self.basis.to_dict(), BASIS)
+        self.assertEqual(expand_bases([{"basis": self.basis}, [1.0, 2.0]]), [{"basis": BASIS}, [1.0, 2.0]])
+        self.assertEqual(pickle.loads(pickle.dumps(self.basis)), BASIS)
+
+    def test_basis_constraints(self):
+        basis = Basis(["Si"], [[0.0, 0.0, 0.0]], constraints=[[1, 1, 0]])
+        self.assertEqual(basis["constraints"], [{"id": 0, "value": [True, True, False]}])
+        self.assertEqual(Basis.from_dict(basis.to_dict()), basis)
+
+    def test_basis_mismatched_elements(self):
+        self.assertRaises(ValueError, Basis, ["Si"], [[0.0, 0.0, 0.0], [0.5, 0.5, 0.5]])
+
+    def test_basis_to_poscar(self):
+        self.assertEqual(get_element_counts(self.basis), get_element_counts(BASIS))
+        self.assertEqual(lattice_basis_to_poscar(LATTICE, self.basis), lattice_basis_to_poscar(LATTICE, BASIS))
+
+    def test_basis_is_compared_deeply(self):
+        basis = Basis.from_dict(BASIS)
+        self.assertDeepAlmostEqual(basis, BASIS)
+        other_basis = expand_bases({"basis": basis})["basis"]
+        other_basis["coordinates"][1]["value"] = [0.3, 0.25, 0.25]
+        self.assertRaises(AssertionError, self.assertDeepAlmostEqual, basis, other_basis)
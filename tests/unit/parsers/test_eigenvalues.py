@@ -0,0 +1,47 @@
+from tests.unit import UnitTestBase
+from express.parsers.eigenvalues import EigenvalueSet
+
+EIGENVALUES_AT_KPOINTS = [
+    {
+        "kpoint": [0.0, 0.0, 0.0],
+        "weight": 0.25,
+        "eigenvalues": [
+            {"energies": [-1.0, 1.0], "occupations": [1.0, 0.0], "spin": 0.5},
+            {"energies": [-2.0, 2.0], "occupations": [1.0, 0.0], "spin": -0.5},
+        ],
+    },
+    {
+        "kpoint": [0.5, 0.0, 0.0],
+        "weight": 0.0,
+        "eigenvalues": [
+            {"energies": [-1.5, 1.5], "occupations": [1.0, 0.0], "spin": 0.5},
+            {"energies": [-2.5, 2.5], "occupations": [1.0, 0.0], "spin": -0.5},
+        ],
+    },
+]
+
+
+class EigenvalueSetTest(UnitTestBase):
+    def setUp(self):
+        super(EigenvalueSetTest, self).setUp()
+        self.eigenvalue_set = EigenvalueSet.from_list(EIGENVALUES_AT_KPOINTS)
+
+    def test_eigenvalue_set_arrays(self):
+        self.assertEqual(self.eigenvalue_set.energies.shape, (2, 2, 2))
+        self.assertEqual(self.eigenvalue_set.energies[1, 0].tolist(), [-2.0, 2.0])
+        self.assertEqual(self.eigenvalue_set.weights.tolist(), [0.25, 0.0])
+        self.assertEqual(self.eigenvalue_set.spin_energies(1).shape, (1, 2, 2))
+
+    def test_eigenvalue_set_sequence(self):
+        self.assertEqual(self.eigenvalue_set, EIGENVALUES_AT_KPOINTS)
+        self.assertEqual(len(self.eigenvalue_set), 2)
+        self.assertEqual(self.eigenvalue_set[-1], EIGENVALUES_AT_KPOINTS[1])
+        self.assertEqual([_["weight"] for _ in self.eigenvalue_set], [0.25, 0.0])
+
+    def test_eigenvalue_set_select(self):
+        eigenvalue_set = self.eigenvalue_set.select(self.eigenvalue_set.weights == 0.0)
+        self.assertEqual(eigenvalue_set.to_list(), EIGENVALUES_AT_KPOINTS[1:])
+
+    def test_eigenvalue_set_without_occupations(self):
+        eigenvalue_set = EigenvalueSet([[0.0, 0.0, 0.0]], [1.0], [[[-1.0, 1.0]]])
+        self.assertEqual(eigenvalue_set[0]["eigenvalues"], [{"energies": [-1.0, 1.0], "occupations": [], "spin": 0.5}])
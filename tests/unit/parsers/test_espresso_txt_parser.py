@@ -0,0 +1,135 @@
+import os
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.espresso.formats.txt import EspressoTXTParser, EspressoConvergenceIndex, load_dos_file
+
+VC_RELAX_HEADER = """
+     lattice parameter (alat)  =       7.2558  a.u.
+     number of atoms/cell      =            2
+
+     crystal axes: (cart. coord. in units of alat)
+               a(1) = (  -0.500000   0.000000   0.500000 )
+               a(2) = (   0.000000   0.500000   0.500000 )
+               a(3) = (  -0.500000   0.500000   0.000000 )
+
+     site n.     atom                  positions (alat units)
+         1           Si  tau(   1) = (   0.0000000   0.0000000   0.0000000  )
+         2           Si  tau(   2) = (   0.2500000   0.2500000   0.2500000  )
+"""
+
+VC_RELAX_STEP = """
+     Self-consistent Calculation
+
+     iteration #  1     ecut=    30.00 Ry     beta= 0.70
+     total energy              =     -15.79103983 Ry
+     estimated scf accuracy    <       0.06376690 Ry
+
+     iteration #  2     ecut=    30.00 Ry     beta= 0.70
+     total energy              =     {energy:.8f} Ry
+     estimated scf accuracy    <       0.00000060 Ry
+
+     End of self-consistent calculation
+
+     convergence has been achieved in   2 iterations
+
+     new unit-cell volume =    270.01 a.u.^3 (    40.01 Ang^3 )
+
+CELL_PARAMETERS (angstrom)
+  -2.700000000   0.000000000   2.700000000
+   0.000000000   2.700000000   2.700000000
+  -2.700000000   2.700000000   0.000000000
+
+ATOMIC_POSITIONS (crystal)
+Si            0.0000000000        0.0000000000        0.0000000000
+Si            0.2500000000        0.2500000000        {position:.10f}
+
+     Writing output data file ./pwscf.save/
+"""
+
+VC_RELAX_STDOUT = VC_RELAX_HEADER + "".join(
+    VC_RELAX_STEP.format(energy=-15.8 - 0.01 * step, position=0.25 + 0.01 * step) for step in range(3)
+)
+
+PDOS_FILES = {
+    "__prefix__.pdos_tot": "# E (eV)  dos(E)    pdos(E)\n******* 0.1 0.1\n-1.000 0.2 0.2\n 1.000 0.3 0.3\n",
+    "__prefix__.pdos_atm#1(Si)_wfc#1(s)": "# E (eV)  ldos(E)  pdos(E)\n******* 1 1\n-1.000 1 1\n 1.000 2 2\n",
+    "__prefix__.pdos_atm#2(Si)_wfc#1(s)": "# E (eV)  ldos(E)  pdos(E)\n******* 1 1\n-1.000 1 3\n 1.000 2 4\n",
+    "__prefix__.pdos_atm#2(Si)_wfc#2(p)": (
+        "# E (eV)  ldos(E)  pdoz(E)  pdosx(E)  pdosy(E)\n-1.000 6 1 2 3\n 1.000 6 3 2 1\n"
+    ),
+}
+
+
+class EspressoTXTParserTest(UnitTestBase):
+    def setUp(self):
+        super(EspressoTXTParserTest, self).setUp()
+        self.txt_parser = EspressoTXTParser(None)
+
+    def test_convergence_ionic(self):
+        data = self.txt_parser.convergence_ionic(VC_RELAX_STDOUT)
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data[0]["structure"]["basis"]["elements"][1], {"id": 1, "value": "Si"})
+        self.assertEqual(data[2]["structure"]["basis"]["units"], "angstrom")
+        self.assertEqual(data[2]["electronic"]["data"], [0.0637669, 6e-07])
+
+    def test_convergence_index_update(self):
+        index = EspressoConvergenceIndex(self.txt_parser)
+        lines = VC_RELAX_STDOUT.splitlines(keepends=True)
+        for line_index, line in enumerate(lines):
+            index.update(line)
+            text = "".join(lines[: line_index + 1])
+            self.assertEqual(index.convergence_electronic(), self.txt_parser.convergence_electronic(text))
+        self.assertEqual(index.convergence_ionic(), self.txt_parser.convergence_ionic(VC_RELAX_STDOUT))
+
+    def test_convergence_index_is_shared(self):
+        index = self.txt_parser.convergence_index(VC_RELAX_STDOUT)
+        self.txt_parser.convergence_electronic(VC_RELAX_STDOUT)
+        self.assertEqual(index._structures, [])
+        self.txt_parser.convergence_ionic(VC_RELAX_STDOUT)
+        self.assertIs(self.txt_parser.convergence_index(VC_RELAX_STDOUT), index)
+        self.assertEqual(len(index._structures), 2)
+
+    def test_convergence_index_is_shared_by_content(self):
+        index = self.txt_parser.convergence_index(VC_RELAX_STDOUT)
+        self.assertIs(self.txt_parser.convergence_index("".join(list(VC_RELAX_STDOUT))), index)
+        self.assertIsNot(self.txt_parser.convergence_index(VC_RELAX_STDOUT + "\n"), index)
+
+    def test_convergence_ionic_is_copied(self):
+        data = self.txt_parser.convergence_ionic(VC_RELAX_STDOUT)
+        data[1]["electronic"]["data"].clear()
+        data[1]["structure"]["basis"]["elements"].clear()
+        data = self.txt_parser.convergence_ionic(VC_RELAX_STDOUT)
+        self.assertEqual(len(data[1]["electronic"]["data"]), 2)
+        self.assertEqual(len(data[1]["structure"]["basis"]["elements"]), 2)
+
+
+class EspressoDOSTest(UnitTestBase):
+    def setUp(self):
+        super(EspressoDOSTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        for name, content in PDOS_FILES.items():
+            with open(os.path.join(self.tmp_dir.name, name), "w") as f:
+                f.write(content)
+        self.txt_parser = EspressoTXTParser(self.tmp_dir.name)
+
+    def tearDown(self):
+        super(EspressoDOSTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_load_dos_file(self):
+        columns = load_dos_file(os.path.join(self.tmp_dir.name, "__prefix__.pdos_atm#2(Si)_wfc#2(p)"), range(2, 5))
+        self.assertEqual(columns.tolist(), [[1.0, 3.0], [2.0, 2.0], [3.0, 1.0]])
+
+    def test_dos(self):
+        dos = self.txt_parser.dos()
+        self.assertEqual(dos["energy"], [-1.0, 1.0])
+        self.assertEqual(dos["total"], [0.20000000298023224, 0.30000001192092896])
+        self.assertEqual([info["electronicState"] for info in dos["partial_info"]], ["1s", "2pz", "2px", "2py"])
+        self.assertEqual(dos["partial"], [[4.0, 6.0], [1.0, 3.0], [2.0, 2.0], [3.0, 1.0]])
+
+    def test_dos_max_workers(self):
+        dos = self.txt_parser.dos()
+        self.assertEqual(self.txt_parser.dos(max_workers=2), dos)
+        self.assertEqual(self.txt_parser.dos(max_workers=2, executor="process"), dos)
+        self.assertRaises(ValueError, self.txt_parser.dos, max_workers=2, executor="mpi")
@@ -0,0 +1,53 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from tests.unit import UnitTestBase
+from express.parsers import BaseParser
+from express.parsers.cache import FileContentCache
+
+
+class FileContentCacheTest(UnitTestBase):
+    def setUp(self):
+        super(FileContentCacheTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = self._write("stdout", "total energy = -1.0\n")
+
+    def tearDown(self):
+        super(FileContentCacheTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_file_is_read_once(self):
+        parser = BaseParser()
+        with patch("builtins.open", wraps=open) as mocked_open:
+            for _ in range(3):
+                self.assertEqual(parser._get_file_content(self.file_path), "total energy = -1.0\n")
+        self.assertEqual(mocked_open.call_count, 1)
+
+    def test_changed_file_is_read_again(self):
+        cache = FileContentCache()
+        cache.get(self.file_path)
+        self._write("stdout", "total energy = -2.0\nconverged\n")
+        self.assertEqual(cache.get(self.file_path), "total energy = -2.0\nconverged\n")
+        self.assertEqual(len(cache), 1)
+
+    def test_memory_budget(self):
+        other_file_path = self._write("OUTCAR", "F= -1.0\n")
+        cache = FileContentCache(max_size=os.path.getsize(self.file_path))
+        cache.get(self.file_path)
+        cache.get(other_file_path)
+        self.assertNotIn(self.file_path, cache)
+        self.assertIn(other_file_path, cache)
+        self.assertLessEqual(cache.size, cache.max_size)
+
+    def test_close(self):
+        parser = BaseParser()
+        parser._get_file_content(self.file_path)
+        parser.close()
+        self.assertEqual(len(parser.file_content_cache), 0)
@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers.tail import FileTail
+
+
+class FileTailTest(UnitTestBase):
+    def setUp(self):
+        super(FileTailTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "pw.out")
+        self.tail = FileTail(self.file_path)
+
+    def tearDown(self):
+        super(FileTailTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def _append(self, content, mode="a"):
+        with open(self.file_path, mode) as f:
+            f.write(content)
+
+    def test_read_new_lines(self):
+        self.assertEqual(self.tail.read(), ("", False))
+        self._append("first line\nsecond")
+        self.assertEqual(self.tail.read(), ("first line\n", False))
+        self._append(" line\n")
+        self.assertEqual(self.tail.read(), ("second line\n", False))
+        self.assertEqual(self.tail.read(), ("", False))
+
+    def test_read_truncated_file(self):
+        self._append("first line\nsecond line\n")
+        self.tail.read()
+        self._append("new\n", mode="w")
+        self.assertEqual(self.tail.read(), ("new\n", True))
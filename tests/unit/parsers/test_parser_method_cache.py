@@ -0,0 +1,191 @@
+import os
+import tempfile
+
+import numpy as np
+
+from tests.unit import UnitTestBase
+from express import ExPrESS
+from express.parsers import BaseParser
+from express.parsers.basis import Basis
+from express.parsers.eigenvalues import EigenvalueSet
+from express.parsers.cache import ParserMethodCache, copy_result, freeze_result, memoized
+
+
+class CountingParser(BaseParser):
+    def __init__(self, *args, **kwargs):
+        super(CountingParser, self).__init__(*args, **kwargs)
+        self.calls = []
+
+    @memoized
+    def fermi_energy(self):
+        self.calls.append("fermi_energy")
+        return 1.0
+
+    @memoized
+    def total_energy(self, scale=1.0):
+        self.calls.append("total_energy")
+        return -2.0 * scale
+
+    def homo_energy(self):
+        return self.fermi_energy() - 1.0
+
+    @memoized
+    def iter_energies(self):
+        yield self.total_energy()
+
+
+class CountingParserSubclass(CountingParser):
+    def fermi_energy(self):
+        self.calls.append("fermi_energy")
+        return 2.0
+
+
+class ParserMethodCacheTest(UnitTestBase):
+    def setUp(self):
+        super(ParserMethodCacheTest, self).setUp()
+        self.parser = CountingParser()
+
+    def test_methods_are_called_once(self):
+        with ParserMethodCache(self.parser):
+            self.assertEqual(self.parser.fermi_energy(), 1.0)
+            self.assertEqual(self.parser.homo_energy(), 0.0)
+            self.assertEqual(self.parser.total_energy(scale=2.0), -4.0)
+            self.assertEqual(self.parser.total_energy(scale=2.0), -4.0)
+            self.assertEqual(self.parser.total_energy(), -2.0)
+        self.assertEqual(self.parser.calls, ["fermi_energy", "total_energy", "total_energy"])
+
+    def test_methods_are_restored(self):
+        with ParserMethodCache(self.parser):
+            self.assertIsInstance(self.parser, CountingParser)
+        self.parser.fermi_energy()
+        self.parser.fermi_energy()
+        self.assertEqual(self.parser.calls, ["fermi_energy", "fermi_energy"])
+        self.assertEqual(vars(self.parser).get("fermi_energy"), None)
+
+    def test_only_memoized_methods_are_wrapped(self):
+        with ParserMethodCache(self.parser):
+            self.assertIn("fermi_energy", vars(self.parser))
+            self.assertNotIn("homo_energy", vars(self.parser))
+            self.assertNotIn("close", vars(self.parser))
+            self.assertNotIn("invalidate_file_content_cache", vars(self.parser))
+
+    def test_memoized_mark_is_inherited(self):
+        parser = CountingParserSubclass()
+        with ParserMethodCache(parser):
+            parser.fermi_energy()
+            self.assertEqual(parser.fermi_energy(), 2.0)
+        self.assertEqual(parser.calls, ["fermi_energy"])
+
+    def test_generators_are_not_cached(self):
+        with ParserMethodCache(self.parser):
+            self.assertEqual(list(self.parser.iter_energies()), [-2.0])
+            self.assertEqual(list(self.parser.iter_energies()), [-2.0])
+
+    def test_express_properties(self):
+        express = ExPrESS()
+        express.parser = self.parser
+        properties = express.properties(["fermi_energy", "homo_energy", "total_energy"])
+        self.assertEqual(properties["fermi_energy"]["value"], 1.0)
+        self.assertEqual(properties["homo_energy"]["value"], 0.0)
+        self.assertEqual(properties["total_energy"]["value"], -2.0)
+        self.assertEqual(self.parser.calls, ["fermi_energy", "total_energy"])
+
+
+class FileParser(BaseParser):
+    def __init__(self, *args, **kwargs):
+        super(FileParser, self).__init__(*args, **kwargs)
+        self.stdout_file = kwargs["stdout_file"]
+        self.reads = 0
+
+    @memoized
+    def lines(self):
+        self.reads += 1
+        with open(self.stdout_file) as f:
+            return f.read().splitlines()
+
+
+class MemoizedParserTest(UnitTestBase):
+    def setUp(self):
+        super(MemoizedParserTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.stdout_file = os.path.join(self.tmp_dir.name, "stdout")
+        self._write("first")
+        self.parser = FileParser(work_dir=self.tmp_dir.name, stdout_file=self.stdout_file, memoize=True)
+
+    def tearDown(self):
+        super(MemoizedParserTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def _write(self, content):
+        with open(self.stdout_file, "w") as f:
+            f.write(content)
+
+    def test_results_are_cached(self):
+        self.assertEqual(self.parser.lines(), ["first"])
+        self.assertEqual(self.parser.lines(), ["first"])
+        self.assertEqual(self.parser.reads, 1)
+        self.assertEqual(self.parser.method_cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_results_are_copied(self):
+        self.parser.lines().append("second")
+        self.assertEqual(self.parser.lines(), ["first"])
+
+    def test_results_are_invalidated(self):
+        self.parser.lines()
+        self._write("first\nsecond")
+        self.assertEqual(self.parser.lines(), ["first", "second"])
+        self.assertEqual(self.parser.reads, 2)
+
+    def test_missing_files_are_watched(self):
+        self.parser.lines()
+        os.remove(self.stdout_file)
+        self.assertRaises(FileNotFoundError, self.parser.lines)
+        self._write("second")
+        self.assertEqual(self.parser.lines(), ["second"])
+
+    def test_file_content_cache_is_invalidated(self):
+        self.parser._get_file_content(self.stdout_file)
+        self.parser.invalidate_file_content_cache(self.stdout_file)
+        self.parser._get_file_content(self.stdout_file)
+        self.parser.invalidate_file_content_cache(self.stdout_file)
+        self.assertNotIn(self.stdout_file, self.parser.file_content_cache)
+
+    def test_results_are_dropped_on_close(self):
+        self.parser.lines()
+        self.parser.close()
+        self.assertEqual(self.parser.method_cache.stats()["size"], 0)
+
+    def test_memoization_is_opt_in(self):
+        parser = FileParser(work_dir=self.tmp_dir.name, stdout_file=self.stdout_file)
+        parser.lines()
+        parser.lines()
+        self.assertIsNone(parser.method_cache)
+        self.assertEqual(parser.reads, 2)
+
+    def test_arrays_are_read_only(self):
+        array = copy_result(np.zeros(3))
+        self.assertRaises(ValueError, array.fill, 1.0)
+
+    def test_containers_are_copied(self):
+        result = {"eigenvalues": [{"energies": [1.0, 2.0], "spin": 0.5}], "kpoint": (0.0, 0.0, 0.0)}
+        result_copy = copy_result(freeze_result(result))
+        self.assertEqual(result_copy, result)
+        result_copy["eigenvalues"][0]["energies"].append(3.0)
+        self.assertEqual(result["eigenvalues"][0]["energies"], [1.0, 2.0])
+        self.assertIs(result_copy["kpoint"], result["kpoint"])
+
+    def test_array_backed_results_share_read_only_arrays(self):
+        basis = Basis(["Si", "Si"], [[0.0, 0.0, 0.0], [0.25, 0.25, 0.25]])
+        basis_copy = copy_result(freeze_result(basis))
+        self.assertEqual(basis_copy, basis)
+        self.assertTrue(np.shares_memory(basis_copy.coordinates, basis.coordinates))
+        self.assertRaises(ValueError, basis_copy.coordinates.fill, 1.0)
+        basis_copy.symbols.append("Ge")
+        self.assertEqual(basis.symbols, ["Si"])
+
+        eigenvalues = EigenvalueSet([[0.0, 0.0, 0.0]], [1.0], [[[-1.0, 1.0]]])
+        eigenvalues_copy = copy_result(freeze_result(eigenvalues))
+        self.assertEqual(eigenvalues_copy.to_list(), eigenvalues.to_list())
+        self.assertTrue(np.shares_memory(eigenvalues_copy.energies, eigenvalues.energies))
+        self.assertRaises(ValueError, eigenvalues_copy.energies.fill, 1.0)
+        self.assertIsNone(eigenvalues_copy.occupations)
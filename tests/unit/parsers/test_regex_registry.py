@@ -0,0 +1,27 @@
+import re
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.espresso import settings
+from express.parsers.regex import REGEX_REGISTRY, COMPILED_REGEX_CACHE_SIZE, compile_regex
+
+
+class RegexRegistryTest(UnitTestBase):
+    def test_patterns_are_compiled_once(self):
+        pattern = REGEX_REGISTRY.get("espresso", "pdos_file")
+        self.assertIs(pattern, REGEX_REGISTRY.get("espresso", "pdos_file"))
+        self.assertEqual(pattern.pattern, settings.REGEX["pdos_file"]["regex"])
+
+    def test_flags(self):
+        pattern = REGEX_REGISTRY.get("espresso", "bfgs_block", re.DOTALL)
+        self.assertTrue(pattern.flags & re.DOTALL)
+        self.assertIsNot(pattern, REGEX_REGISTRY.get("espresso", "bfgs_block"))
+
+    def test_factory_entries_are_not_registered(self):
+        self.assertNotIn("basis_alat", REGEX_REGISTRY.names("espresso"))
+        self.assertIn("harris_foulkes", REGEX_REGISTRY.names("espresso"))
+        self.assertIn("double_number", REGEX_REGISTRY.names("general"))
+
+    def test_compiled_patterns_are_bounded(self):
+        for index in range(COMPILED_REGEX_CACHE_SIZE + 1):
+            compile_regex("runtime pattern {0}".format(index))
+        self.assertEqual(compile_regex.cache_info().currsize, COMPILED_REGEX_CACHE_SIZE)
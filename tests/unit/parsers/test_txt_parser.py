@@ -0,0 +1,56 @@
+import os
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers import BaseParser
+from express.parsers.apps.espresso import settings
+from express.parsers.formats.txt import BaseTXTParser
+
+STDOUT = """
+     total energy              =     -15.79103983 Ry
+     estimated scf accuracy    <       0.00000060 Ry
+
+!    total energy              =     -15.79441848 Ry
+     estimated scf accuracy    <       0.00000060 Ry
+
+     Forces acting on atoms (cartesian axes, Ry/au):
+
+     atom    1 type  1   force =     0.00000000    0.00000000    0.00100000
+     atom    2 type  1   force =     0.00000000    0.00000000   -0.00100000
+     The non-local contrib.  to forces
+     atom    1 type  1   force =     0.00000000    0.00000000    0.00200000
+
+     Total force =     0.001414     Total SCF correction =     0.000000
+
+     total   stress  (Ry/bohr**3)                   (kbar)     P=       -8.88
+"""
+
+
+class BaseTXTParserTest(UnitTestBase):
+    def setUp(self):
+        super(BaseTXTParserTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.stdout_file = os.path.join(self.tmp_dir.name, "pw.out")
+        with open(self.stdout_file, "w") as f:
+            f.write(STDOUT)
+        self.txt_parser = BaseTXTParser(self.tmp_dir.name)
+
+    def tearDown(self):
+        super(BaseTXTParserTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_general_output_parser_memory_map(self):
+        parser = BaseParser(use_mmap=True)
+        view = parser._get_file_view(self.stdout_file)
+        for name in ["total_energy", "forces_on_atoms", "total_force", "pressure"]:
+            self.assertEqual(
+                self.txt_parser._general_output_parser(view, **settings.REGEX[name]),
+                self.txt_parser._general_output_parser(STDOUT, **settings.REGEX[name]),
+            )
+        parser.close()
+        self.assertEqual(len(parser.file_map_cache), 0)
+
+    def test_general_output_parser_missing_start_flag(self):
+        self.assertIsNone(
+            self.txt_parser._general_output_parser(STDOUT.replace("!", " "), **settings.REGEX["total_energy"])
+        )
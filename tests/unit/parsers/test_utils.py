@@ -0,0 +1,20 @@
+import copy
+
+from tests.unit import UnitTestBase
+from express.parsers.utils import convert_basis_to_cartesian
+
+LATTICE = {"vectors": {"a": [2.0, 0.0, 0.0], "b": [1.0, 2.0, 0.0], "c": [0.0, 0.0, 4.0], "alat": 1}}
+
+BASIS = {
+    "units": "crystal",
+    "elements": [{"id": 0, "value": "Si"}, {"id": 1, "value": "Si"}],
+    "coordinates": [{"id": 0, "value": [0.0, 0.0, 0.0]}, {"id": 1, "value": [0.5, 0.5, 0.25]}],
+}
+
+
+class UtilsTest(UnitTestBase):
+    def test_convert_basis_to_cartesian(self):
+        basis = convert_basis_to_cartesian(copy.deepcopy(BASIS), LATTICE)
+        self.assertEqual(basis["coordinates"][1], {"id": 1, "value": [1.5, 1.0, 1.0]})
+        self.assertEqual(basis["coordinates"][0]["value"], [0.0, 0.0, 0.0])
+        self.assertEqual(BASIS["coordinates"][1]["value"], [0.5, 0.5, 0.25])
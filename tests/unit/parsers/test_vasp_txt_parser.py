@@ -0,0 +1,61 @@
+import io
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.vasp.formats.txt import VaspTXTParser
+
+LATTICE = """
+  direct lattice vectors                 reciprocal lattice vectors
+     0.000000000  2.715000000  2.715000000    -0.184162063  0.184162063  0.184162063
+     2.715000000  0.000000000  2.715000000     0.184162063 -0.184162063  0.184162063
+     2.715000000  2.715000000  0.000000000     0.184162063  0.184162063 -0.184162063
+"""
+
+IONS = """
+--------------------------------------- Iteration    1(   5)  ---------------------------------------
+ POSITION                                       TOTAL-FORCE (eV/Angst)
+ -----------------------------------------------------------------------------------
+      0.00000      0.00000      0.00000         0.000000      0.000000      0.010000
+      1.35750      1.35750      1.35750         0.000000      0.000000     -0.010000
+ -----------------------------------------------------------------------------------
+    total drift:                                0.000000      0.000000      0.000000
+"""
+
+OUTCAR = LATTICE + IONS + LATTICE + IONS + LATTICE
+
+STDOUT = """
+       N       E                     dE             d eps       ncg     rms          rms(c)
+DAV:   1     0.699475439520E+04    0.69948E+04   -0.37054E+05   920   0.140E+03
+DAV:   2    -0.402547717878E+03   -0.73973E+04   -0.71440E+04  1084   0.442E+02
+   1 F= -.92170983E+03 E0= -.92172095E+03  d E =-.921721E+03
+       N       E                     dE             d eps       ncg     rms          rms(c)
+DAV:   1    -0.916206954626E+03    0.55030E+01   -0.19221E+03   920   0.750E+01    0.931E+00
+   2 F= -.91969309E+03 E0= -.91970717E+03  d E =0.2E+01
+       N       E                     dE             d eps       ncg     rms          rms(c)
+DAV:   1    -0.919705445969E+03    0.12985E+00   -0.93950E-01  1128   0.186E+00    0.145E+00
+DAV:   2    -0.919705445969E+03    0.12985E+00   -0.93950E-01  1128   0.186E+00    0.145E+00
+"""
+
+
+class VaspTXTParserTest(UnitTestBase):
+    def setUp(self):
+        super(VaspTXTParserTest, self).setUp()
+        self.txt_parser = VaspTXTParser(None)
+
+    def test_iter_structures(self):
+        structures = list(self.txt_parser.iter_structures(io.StringIO(OUTCAR), ["Si", "Si"]))
+        self.assertEqual(len(structures), 3)
+        self.assertEqual(structures[0]["lattice"]["vectors"]["b"], [2.715, 0.0, 2.715])
+        self.assertEqual(structures[1]["basis"]["coordinates"][1]["value"], [1.3575, 1.3575, 1.3575])
+        self.assertEqual(structures[1]["forces"], [[0.0, 0.0, 0.01], [0.0, 0.0, -0.01]])
+        self.assertIsNone(structures[2]["basis"])
+
+    def test_convergence_electronic(self):
+        data = self.txt_parser.convergence_electronic(None, io.StringIO(STDOUT), ["Si", "Si"])
+        self.assertEqual(data, [[6994.8, -7397.3], [5.503], [0.12985, 0.12985]])
+
+    def test_convergence_ionic(self):
+        steps = list(self.txt_parser.iter_ionic_steps(OUTCAR, STDOUT, ["Si", "Si"]))
+        self.assertEqual(len(steps), 3)
+        self.assertAlmostEqual(steps[1]["energy"], 6994.8 - 7397.3 + 5.503)
+        self.assertEqual(steps[0]["structure"]["basis"]["elements"][1], {"id": 1, "value": "Si"})
+        self.assertNotIn("structure", steps[2])
@@ -0,0 +1,165 @@
+import os
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.vasp.formats.xml import VaspXMLParser
+from express.parsers.apps.espresso.formats.xml.xml_base import EspressoXMLParserBase
+from express.parsers.apps.espresso.formats.xml.xml_post64 import EspressoXMLParserPostV6_4
+from express.parsers.settings import Constant
+
+CALCULATION = """
+ <calculation>
+  <varray name="forces" >
+   <v>       0.00000000       0.00000000       {force:.8f} </v>
+  </varray>
+ </calculation>"""
+
+VASPRUN = "<modeling>{}\n</modeling>\n".format("".join(CALCULATION.format(force=0.01 * index) for index in range(3)))
+
+VASPRUN_EIGENVALUES = """<modeling>
+ <kpoints>
+  <varray name="kpointlist"><v> 0.0 0.0 0.0 </v><v> 0.5 0.0 0.0 </v></varray>
+  <varray name="weights"><v> 0.25 </v><v> 0.75 </v></varray>
+ </kpoints>
+ <calculation>
+  <eigenvalues><array><set><set comment="spin 1">
+   <set comment="kpoint 1"><r> 2.0 0.0 </r><r> -1.0 1.0 </r><r> 1.0 0.0 </r></set>
+   <set comment="kpoint 2"><r> -2.0 1.0 </r><r> 3.0 0.0 </r><r> ******** 1.0 </r></set>
+  </set></set></array></eigenvalues>
+ </calculation>
+</modeling>
+"""
+
+VASPRUN_DOS = """<modeling>
+ <atominfo><array name="atoms"><set>
+  <rc><c>Si</c><c> 1</c></rc><rc><c>C </c><c> 2</c></rc><rc><c>Si</c><c> 1</c></rc>
+ </set></array></atominfo>
+ <calculation>
+  <dos>
+   <i name="efermi"> 0.5 </i>
+   <total><array><set>
+    <set comment="spin 1"><r> -1.0 0.1 0.0 </r><r> 1.0 0.2 0.0 </r></set>
+    <set comment="spin 2"><r> -1.0 0.3 0.0 </r><r> 1.0 0.4 0.0 </r></set>
+   </set></array></total>
+   <partial><array><field>energy</field><field>s</field><field>p</field><set>{}</set></array></partial>
+  </dos>
+ </calculation>
+</modeling>
+""".format(
+    "".join(
+        '<set comment="ion {0}"><set comment="spin 1"><r> -1.0 {0} 1.0 </r><r> 1.0 {0} 2.0 </r></set>'
+        '<set comment="spin 2"><r> -1.0 0.0 -{0} </r><r> 1.0 0.0 -{0} </r></set></set>'.format(atom_id)
+        for atom_id in range(3)
+    )
+)
+
+KS_ENERGIES = """
+   <ks_energies>
+    <k_point weight="{weight}">{kpoint}</k_point>
+    <eigenvalues size="4">-0.1 0.1 -0.2 0.2</eigenvalues>
+    <occupations size="4">1.0 0.0 1.0 0.0</occupations>
+   </ks_energies>"""
+
+DATA_FILE = """<qes:espresso xmlns:qes="http://www.quantum-espresso.org/ns/qes/qes-1.0">
+ <input><control_variables/></input>
+ <output>
+  <atomic_structure nat="1" alat="1.0"/>
+  <basis_set>
+   <reciprocal_lattice><b1>0.5 0.0 0.0</b1><b2>0.0 0.5 0.0</b2><b3>0.0 0.0 2.0</b3></reciprocal_lattice>
+  </basis_set>
+  <band_structure>
+   <lsda>true</lsda><noncolin>false</noncolin><nbnd_up>2</nbnd_up><fermi_energy>0.5</fermi_energy>{}
+  </band_structure>
+ </output>
+</qes:espresso>
+""".format(
+    KS_ENERGIES.format(weight=0.25, kpoint="0.0 0.0 0.0") + KS_ENERGIES.format(weight=0.75, kpoint="0.25 0.0 1.0")
+)
+
+
+class XMLParserTest(UnitTestBase):
+    def setUp(self):
+        super(XMLParserTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super(XMLParserTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_root_is_parsed_lazily(self):
+        path = self._write("vasprun.xml", VASPRUN)
+        parser = VaspXMLParser(path)
+        os.remove(path)
+        self.assertFalse(parser._is_root_loaded)
+        self.assertRaises(FileNotFoundError, getattr, parser, "root")
+
+    def test_vasp_keeps_last_calculation(self):
+        parser = VaspXMLParser(self._write("vasprun.xml", VASPRUN))
+        self.assertEqual(len(parser.root.findall("calculation")), 1)
+        self.assertAlmostEqual(parser.atomic_forces()[0][2], 0.02)
+
+    def test_vasp_index(self):
+        parser = VaspXMLParser(self._write("vasprun.xml", VASPRUN))
+        index = parser.index
+        self.assertIs(parser.index, index)
+        self.assertIs(index["calculation"], parser.root.find("calculation"))
+        self.assertIsNone(index["atom_names"])
+        self.assertRaises(ValueError, parser.atom_names)
+
+    def test_vasp_dos(self):
+        parser = VaspXMLParser(self._write("vasprun.xml", VASPRUN_DOS))
+        dos = parser.dos(combined=False)
+        self.assertEqual(dos["total"], [0.4, 0.6000000000000001])
+        self.assertEqual(len(dos["partial"]), 12)
+        self.assertEqual(dos["partial"][4], [1.0, 1.0])
+        self.assertEqual(dos["partial_info"][4], {"element": "C", "index": 1, "electronicState": "s-up", "spin": 0.5})
+
+        dos = parser.dos(combined=True)
+        partial = {
+            (info["element"], info["electronicState"]): value
+            for info, value in zip(dos["partial_info"], dos["partial"])
+        }
+        self.assertEqual(len(partial), 8)
+        self.assertEqual(partial[("Si", "s-up")], [2.0, 2.0])
+        self.assertEqual(partial[("Si", "p-up")], [2.0, 4.0])
+        self.assertEqual(partial[("Si", "p-down")], [-2.0, -2.0])
+        self.assertEqual(partial[("C", "p-down")], [-1.0, -1.0])
+        self.assertEqual(list(partial)[:4], [("Si", "s-up"), ("Si", "p-up"), ("Si", "s-down"), ("Si", "p-down")])
+
+    def test_broken_xml(self):
+        self.assertIsNone(VaspXMLParser(self._write("vasprun.xml", VASPRUN[:-20])).root)
+
+    def test_vasp_eigenvalues_at_kpoints(self):
+        eigenvalues_at_kpoints = VaspXMLParser(self._write("vasprun.xml", VASPRUN_EIGENVALUES)).eigenvalues_at_kpoints()
+        self.assertEqual(eigenvalues_at_kpoints.kpoints.tolist(), [[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]])
+        self.assertEqual(eigenvalues_at_kpoints.weights.tolist(), [0.25, 0.75])
+        self.assertEqual(eigenvalues_at_kpoints.energies.tolist(), [[[-1.0, 1.0, 2.0], [-2.0, 3.0, 3.0]]])
+        self.assertEqual(eigenvalues_at_kpoints.occupations.tolist(), [[[1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]])
+
+    def test_espresso_output_root(self):
+        parser = EspressoXMLParserPostV6_4(self._write("data-file-schema.xml", DATA_FILE))
+        self.assertEqual(parser.root.tag, "output")
+        self.assertEqual(parser.fermi_energy(), 0.5 * Constant.HARTREE)
+
+    def test_espresso_eigenvalues_at_kpoints(self):
+        eigenvalues_at_kpoints = EspressoXMLParserPostV6_4(
+            self._write("data-file-schema.xml", DATA_FILE)
+        ).eigenvalues_at_kpoints()
+        self.assertEqual([_["kpoint"] for _ in eigenvalues_at_kpoints], [[0.0, 0.0, 0.0], [0.5, 0.0, 0.5]])
+        self.assertEqual([_["weight"] for _ in eigenvalues_at_kpoints], [0.25, 0.75])
+        eigenvalues = eigenvalues_at_kpoints[1]["eigenvalues"]
+        self.assertEqual([_["spin"] for _ in eigenvalues], [0.5, -0.5])
+        self.assertEqual(eigenvalues[1]["energies"], [-0.2 * Constant.HARTREE, 0.2 * Constant.HARTREE])
+        self.assertEqual(eigenvalues[1]["occupations"], [1.0, 0.0])
+
+    def test_espresso_numeric_tag_decoding(self):
+        cast_map = EspressoXMLParserBase.TAG_VALUE_CAST_MAP
+        self.assertEqual(cast_map["real"](" 1.0 -2.5E-01\n 3.0D+00 4 ", 4, 2).tolist(), [[1.0, -0.25], [3.0, 4.0]])
+        self.assertEqual(cast_map["integer"]("1 -2 3", 3, 1).tolist(), [[1], [-2], [3]])
+        self.assertEqual(cast_map["integer"](" 1, -2 3;", 3, 1).tolist(), [[1], [-2], [3]])
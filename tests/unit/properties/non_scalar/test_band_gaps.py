@@ -92,3 +92,17 @@ class BandGapsTest(UnitTestBase):
         parser.attach_mock(MagicMock(return_value=EIGENVALUES_AT_KPOINTS), "eigenvalues_at_kpoints")
         property_ = BandGaps("band_gaps", parser)
         self.assertDeepAlmostEqual(property_.serialize_and_validate(), BAND_GAPS)
+
+    def test_band_gaps_all_bands_occupied(self):
+        parser = MagicMock()
+        parser.attach_mock(MagicMock(return_value=1), "nspins")
+        parser.attach_mock(MagicMock(return_value=10.0), "fermi_energy")
+        parser.attach_mock(MagicMock(return_value=None), "band_gaps_direct")
+        parser.attach_mock(MagicMock(return_value=None), "band_gaps_indirect")
+        eigenvalues_at_kpoints = BAND_GAPS["eigenvalues"][:2]
+        ibz_k_points = [eigenvalues_at_kpoint["kpoint"] for eigenvalues_at_kpoint in eigenvalues_at_kpoints]
+        parser.attach_mock(MagicMock(return_value=ibz_k_points), "ibz_k_points")
+        parser.attach_mock(MagicMock(return_value=eigenvalues_at_kpoints), "eigenvalues_at_kpoints")
+        property_ = BandGaps("band_gaps", parser)
+        with self.assertRaises(ValueError):
+            property_.get_band_gaps_from_mesh()
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from tests.unit import UnitTestBase
 from tests.fixtures.data import DOS_RAW_DATA
 from express.properties.non_scalar.two_dimensional_plot.density_of_states import DensityOfStates
@@ -20,6 +22,13 @@ DOS = {
     ],
 }
 
+FINE_DOS_RAW_DATA = {
+    "energy": [-2.0, -1.0, 0.0, 1.0, 2.0],
+    "total": [0.0, 1.0, 2.0, 3.0, 4.0],
+    "partial": [[0.1, 0.2, 0.30000001192092896, 0.4, 0.5]],
+    "partial_info": [{"element": "Si", "electronicState": "1s"}],
+}
+
 
 class DensityOfStatesTest(UnitTestBase):
     def setUp(self):
@@ -32,3 +41,18 @@ class DensityOfStatesTest(UnitTestBase):
         parser = self.get_mocked_parser("dos", DOS_RAW_DATA)
         property_ = DensityOfStates("density_of_states", parser)
         self.assertDeepAlmostEqual(property_.serialize_and_validate(), DOS)
+
+    def test_dos_energy_window_and_num_points(self):
+        parser = self.get_mocked_parser("dos", FINE_DOS_RAW_DATA)
+        parser.attach_mock(MagicMock(return_value=0.25), "fermi_energy")
+        property_ = DensityOfStates("density_of_states", parser, energy_window=[-1.5, 1.5], num_points=5)
+        data = property_.serialize_and_validate()
+        self.assertEqual(data["xDataArray"], [[-1.0, -0.5, 0.0, 0.5, 1.0]])
+        self.assertEqual(data["yDataSeries"][0], [1.0, 1.5, 2.0, 2.5, 3.0])
+
+    def test_dos_dtype(self):
+        parser = self.get_mocked_parser("dos", FINE_DOS_RAW_DATA)
+        data = DensityOfStates("density_of_states", parser, dtype="float32").serialize_and_validate()
+        self.assertEqual(data["yDataSeries"][1], [0.1, 0.2, 0.3, 0.4, 0.5])
+        data = DensityOfStates("density_of_states", parser).serialize_and_validate()
+        self.assertEqual(data["yDataSeries"][1], FINE_DOS_RAW_DATA["partial"][0])
@@ -0,0 +1,22 @@
+from jsonschema.exceptions import ValidationError
+
+from tests.unit import UnitTestBase
+from express.properties.schemas import SCHEMA_REGISTRY
+from express.properties.scalar.total_energy import TotalEnergy
+
+
+class SchemaRegistryTest(UnitTestBase):
+    def test_properties_share_esse(self):
+        parser = self.get_mocked_parser("total_energy", 1)
+        first, second = TotalEnergy("total_energy", parser), TotalEnergy("total_energy", parser)
+        self.assertIs(first.esse, second.esse)
+        self.assertIs(first.schema, second.schema)
+
+    def test_validator_is_cached(self):
+        schema = SCHEMA_REGISTRY.get_schema_by_id("properties-directory/scalar/total-energy")
+        self.assertIs(SCHEMA_REGISTRY.get_validator(schema), SCHEMA_REGISTRY.get_validator(schema))
+
+    def test_validate(self):
+        schema = SCHEMA_REGISTRY.get_schema_by_id("properties-directory/scalar/total-energy")
+        SCHEMA_REGISTRY.validate({"name": "total_energy", "value": 1.0, "units": "eV"}, schema)
+        self.assertRaises(ValidationError, SCHEMA_REGISTRY.validate, {"name": "total_energy", "value": "1"}, schema)
@@ -0,0 +1,20 @@
+from tests.unit import UnitTestBase
+from express import ExPrESS, get_class_by_reference, settings
+from express.parsers.regex import REGEX_REGISTRY
+from express.properties.scalar.total_energy import TotalEnergy
+
+
+class ExPrESSTest(UnitTestBase):
+    def test_class_resolution_is_cached(self):
+        reference = settings.PROPERTIES_MANIFEST["total_energy"]["reference"]
+        self.assertIs(ExPrESS()._get_property_class("total_energy"), TotalEnergy)
+        hits = get_class_by_reference.cache_info().hits
+        self.assertIs(get_class_by_reference(reference), TotalEnergy)
+        self.assertEqual(get_class_by_reference.cache_info().hits, hits + 1)
+
+    def test_warm(self):
+        ExPrESS.warm()
+        self.assertIn("espresso", REGEX_REGISTRY._tables)
+        hits = get_class_by_reference.cache_info().hits
+        ExPrESS("espresso", work_dir="", stdout_file="")
+        self.assertEqual(get_class_by_reference.cache_info().hits, hits + 1)
@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+
+from tests.unit import UnitTestBase
+
+HEAVY_MODULES = ["pymatgen", "ase", "jarvis", "rdkit", "mat3ra.esse", "jsonschema"]
+
+APPLICATION_PARSERS = [
+    "express.parsers.apps.espresso.parser",
+    "express.parsers.apps.vasp.parser",
+    "express.parsers.apps.nwchem.parser",
+]
+
+
+def get_loaded_modules(modules, imports):
+    """
+    Imports given modules in a new interpreter and returns which of the given heavy modules are loaded.
+
+    Args:
+        modules (list): names of the heavy modules to look for.
+        imports (list): names of the modules to import.
+
+    Returns:
+         list
+    """
+    code = "import sys, json; {0}; print(json.dumps([m for m in {1} if m in sys.modules]))".format(
+        "; ".join("import {0}".format(name) for name in imports), json.dumps(modules)
+    )
+    return json.loads(subprocess.check_output([sys.executable, "-c", code]))
+
+
+class StartupTest(UnitTestBase):
+    def test_import_express_is_light(self):
+        self.assertEqual(get_loaded_modules(HEAVY_MODULES, ["express"]), [])
+
+    def test_import_application_parsers_is_light(self):
+        self.assertEqual(get_loaded_modules(HEAVY_MODULES, ["express"] + APPLICATION_PARSERS), [])
@@ -0,0 +1,95 @@
+import io
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+from tests.unit import UnitTestBase
+from express.parsers.settings import Constant
+from express.worker import serve, run_job
+
+STDOUT = """
+!    total energy              =     -15.80000000 Ry
+"""
+
+
+def run_or_exit_job(job):
+    # the worker process exits on the first attempt of the job, whose kwargs hold the path of a marker file
+    marker_file = job["kwargs"].get("marker_file")
+    if marker_file and not os.path.exists(marker_file):
+        open(marker_file, "w").close()
+        os._exit(1)
+    if job["id"] == "exit":
+        os._exit(1)
+    return run_job(job)
+
+
+def run_and_print_job(job):
+    print("atom_names can not be extracted")
+    return run_job(job)
+
+
+class WorkerTest(UnitTestBase):
+    def setUp(self):
+        super(WorkerTest, self).setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.stdout_file = os.path.join(self.tmp_dir.name, "pw.out")
+        with open(self.stdout_file, "w") as f:
+            f.write(STDOUT)
+
+    def tearDown(self):
+        super(WorkerTest, self).tearDown()
+        self.tmp_dir.cleanup()
+
+    def _job(self, job_id, properties, parser="espresso"):
+        kwargs = {"work_dir": self.tmp_dir.name, "stdout_file": self.stdout_file}
+        return json.dumps({"id": job_id, "parser": parser, "kwargs": kwargs, "properties": properties})
+
+    def _serve(self, lines, **kwargs):
+        output_stream = io.StringIO()
+        input_stream = io.StringIO("\n".join(lines) + "\n") if isinstance(lines, list) else lines
+        serve(input_stream, output_stream, warm=False, **kwargs)
+        return {result["id"]: result for result in map(json.loads, output_stream.getvalue().splitlines())}
+
+    def test_serve(self):
+        results = self._serve(
+            [self._job(1, ["total_energy"]), "", self._job(2, ["unknown"]), self._job(3, [], parser="unknown"), "{"]
+        )
+        self.assertAlmostEqual(results[1]["properties"]["total_energy"]["value"], -15.8 * Constant.RYDBERG)
+        self.assertIn("KeyError", results[2]["error"])
+        self.assertEqual(results[3]["error"], "ValueError: Unknown parser: unknown")
+        self.assertIn("JSONDecodeError", results[None]["error"])
+
+    def test_parser_is_closed(self):
+        with mock.patch("express.parsers.BaseParser.close") as close:
+            self._serve([self._job(1, ["total_energy"]), self._job(2, ["unknown"])])
+        self.assertEqual(close.call_count, 2)
+
+    def test_serve_with_workers(self):
+        results = self._serve([self._job(job_id, ["total_energy"]) for job_id in range(3)], max_workers=2)
+        self.assertEqual(sorted(results), [0, 1, 2])
+        self.assertEqual(results[0]["properties"], results[2]["properties"])
+
+    def test_serve_with_broken_pool(self):
+        jobs = [json.loads(self._job(job_id, ["total_energy"])) for job_id in range(3)]
+        jobs[0]["kwargs"]["marker_file"] = os.path.join(self.tmp_dir.name, "marker")
+        with mock.patch("express.worker.run_job", run_or_exit_job):
+            results = self._serve(list(map(json.dumps, jobs)), max_workers=1)
+        self.assertEqual(sorted(results), [0, 1, 2])
+        self.assertEqual(results[0]["properties"], results[1]["properties"])
+        self.assertEqual(results[1]["properties"], results[2]["properties"])
+
+    def test_serve_with_exiting_job(self):
+        with mock.patch("express.worker.run_job", run_or_exit_job):
+            results = self._serve([self._job("exit", ["total_energy"])], max_workers=1)
+        self.assertIn("BrokenProcessPool", results["exit"]["error"])
+
+    def test_prints_do_not_corrupt_results(self):
+        output_stream = io.StringIO()
+        input_stream = io.StringIO(self._job(1, ["total_energy"]) + "\n")
+        with mock.patch("express.worker.run_job", run_and_print_job), mock.patch("sys.stdout", output_stream):
+            with mock.patch("sys.stderr", io.StringIO()) as error_stream:
+                serve(input_stream, sys.stdout, warm=False)
+        self.assertIn("properties", json.loads(output_stream.getvalue()))
+        self.assertEqual(error_stream.getvalue(), "atom_names can not be extracted\n")